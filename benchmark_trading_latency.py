@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+거래 경로 지연 시간 벤치마크 스크립트
+
+사용법:
+    python benchmark_trading_latency.py                  # 기본 설정으로 5회 측정
+    python benchmark_trading_latency.py --runs 20 --latency-ms 10 40 --fill-delay-ms 100 --partial-fills 3
+    python benchmark_trading_latency.py --load 200       # 잔고/체결/미체결 조회 부하 (동시 8개)
+    python benchmark_trading_latency.py --polling        # 실시간 체결 수신 없이 체결 조회 API로만 확인
+    python benchmark_trading_latency.py --warm           # 개장 전 거래 경로 준비(TradingWarmup) 후 측정
+
+로컬 키움증권 시뮬레이터(LocalKiwoomServer)를 띄우고 실제 KiwoomAPIClient를 연결한 뒤,
+AutoTradingSystem.process_new_contract()로 공시 한 건을 처리하면서 다음 구간을 측정합니다.
+
+- 공시 → 매수 주문 접수: 매수 조건 확인, 예수금 조회, 매수 주문까지
+- 매수 주문 → 체결: 시뮬레이터 체결 지연 (fill_delay, partial_fills)
+- 체결 → 익절 주문 접수: 체결 확인(실시간 체결 수신 또는 체결 조회)과 익절 지정가 주문까지
+- 전체: process_new_contract() 호출 시간
+
+주식 분석(pykrx)과 현재가 조회(pykrx)는 네트워크가 필요하므로 고정 분석 결과와
+시뮬레이터 시세로 대체하고, 구글 시트 기록은 메모리에만 보관합니다.
+설정 파일(.env)은 run.py와 같은 값이 필요하며, 키움증권 관련 값은 시뮬레이터용으로 덮어씁니다.
+"""
+
+import sys
+import os
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# 설정 로드 전에 시뮬레이터용 거래 설정 지정 (실제 계좌 정보 불필요)
+os.environ['TRADING_MODE'] = 'LIVE'
+os.environ['KIWOOM_APP_KEY'] = 'simulator-app-key'
+os.environ['KIWOOM_APP_SECRET'] = 'simulator-app-secret'
+os.environ['KIWOOM_ACCOUNT_NUMBER'] = '0000000000'
+
+from loguru import logger
+
+from config.settings import KIWOOM_RATE_LIMIT_CONFIG
+from src.backtest import LocalKiwoomServer
+from src.trading.auto_trading_system import AutoTradingSystem
+from src.trading.kiwoom_client import KiwoomAPIClient
+from src.trading.warmup import TradingWarmup
+from src.utils.rate_limiter import SharedTokenBucketRateLimiter
+from src.utils.slack_notifier import SlackNotifier
+from src.utils.stock_analyzer import StockAnalysisResult
+
+# 매수 조건(개장일, 거래 시간, 당일 공시)을 만족하는 고정 시각
+BENCHMARK_TIME = datetime(2025, 3, 4, 10, 0, 0)
+
+STOCK_CODE = '005930'
+STOCK_NAME = '벤치마크전자'
+STOCK_PRICE = Decimal('50000')
+
+
+class MemorySheetsClient:
+    """거래내역/오류 기록을 메모리에만 보관하는 시트 클라이언트 (측정 대상 제외)"""
+
+    def __init__(self):
+        self.buy_transactions = []
+        self.error_logs = []
+
+    def save_buy_transaction(self, buy_result: dict) -> bool:
+        self.buy_transactions.append(buy_result)
+        return True
+
+    def log_error_to_sheet(self, error_log: dict) -> bool:
+        self.error_logs.append(error_log)
+        return True
+
+
+def build_contract(run: int) -> dict:
+    """측정용 공시 한 건을 생성합니다."""
+    return {
+        '종목코드': STOCK_CODE,
+        '종목명': STOCK_NAME,
+        '시장구분': 'KOSPI',
+        '접수일자': BENCHMARK_TIME.strftime('%Y%m%d'),
+        '접수번호': f"BENCH{run:06d}",
+        '계약금액': '10000000000',
+        '계약상대방': '벤치마크',
+    }
+
+
+def build_analysis() -> StockAnalysisResult:
+    """매수 조건을 만족하는 고정 분석 결과를 생성합니다."""
+    return StockAnalysisResult(
+        stock_code=STOCK_CODE, stock_name=STOCK_NAME, market_type='KOSPI',
+        industry_code='', industry_name='', is_target_industry=False,
+        current_price=int(STOCK_PRICE), opening_price=int(STOCK_PRICE), price_change_rate=0.0, market_cap=1000,
+        is_index_above_ma200=True, is_market_cap_in_range=True, is_contract_ratio_over_20=True,
+        trading_conditions_met=2, index_current=0.0, index_ma200=0.0, contract_sales_ratio=30.0,
+        volume_ratio=1.5, is_positive_candle=True, analysis_summary='벤치마크', recommendation_score=10
+    )
+
+
+def create_server(args) -> LocalKiwoomServer:
+    """명령행 설정으로 시뮬레이터를 생성합니다."""
+    return LocalKiwoomServer(
+        prices={STOCK_CODE: STOCK_PRICE},
+        stock_names={STOCK_CODE: STOCK_NAME},
+        latency=(args.latency_ms[0] / 1000, args.latency_ms[1] / 1000),
+        fill_delay=args.fill_delay_ms / 1000,
+        partial_fills=args.partial_fills,
+        rate_limit_per_second=args.rate_limit,
+        server_error_rate=args.error_rate,
+        seed=args.seed,
+    ).start()
+
+
+def create_client(server: LocalKiwoomServer) -> KiwoomAPIClient:
+    """시뮬레이터에 연결된 키움증권 클라이언트를 생성합니다."""
+    client = KiwoomAPIClient(
+        app_key=os.environ['KIWOOM_APP_KEY'],
+        app_secret=os.environ['KIWOOM_APP_SECRET'],
+        account_number=os.environ['KIWOOM_ACCOUNT_NUMBER'],
+        base_url=server.base_url,
+        # 측정마다 새 시뮬레이터를 띄우므로 호출 제한도 공유 파일 없이 새로 시작
+        rate_limiter=SharedTokenBucketRateLimiter(KIWOOM_RATE_LIMIT_CONFIG['buckets'], name='시뮬레이터 API')
+    )
+    # 측정마다 새 시뮬레이터를 띄우므로 보관된 접속 토큰도 사용하지 않음
+    client.token_cache = None
+    # 현재가는 pykrx 대신 시뮬레이터 시세 사용
+    client.get_current_price = lambda stock_code: {'current_price': server.get_price(stock_code)}
+    return client
+
+
+def measure_once(args, run: int) -> dict:
+    """
+    새 시뮬레이터 계좌로 공시 한 건을 처리하고 구간별 시간을 측정합니다.
+
+    Returns:
+        dict: 구간명 -> 소요 시간 (초, 측정할 수 없으면 None)
+    """
+    server = create_server(args)
+    try:
+        order_events = None if args.polling else server.create_order_stream()
+        system = AutoTradingSystem(MemorySheetsClient(), SlackNotifier(webhook_url=None),
+                                   kiwoom_client=create_client(server), order_events=order_events)
+        if not system.trading_enabled:
+            raise RuntimeError("시뮬레이터 연결에 실패했습니다")
+        system.trading_strategy.clock = lambda: BENCHMARK_TIME
+        if args.warm:
+            # 시장지수는 pykrx(네트워크)가 필요하므로 제외하고 인증/연결/계좌 정보만 준비
+            TradingWarmup(system, market_types=()).warm_up()
+
+        contract = build_contract(run)
+        system.stock_analyzer.remember_analysis(contract, build_analysis())
+
+        started_at = time.perf_counter()
+        bought = system.process_new_contract(contract)
+        finished_at = time.perf_counter()
+
+        orders = server.get_orders()
+        buy = next((order for order in orders if order['side'] == 'buy'), None)
+        sell = next((order for order in orders if order['side'] == 'sell'), None)
+
+        return {
+            '공시 → 매수 주문': buy['received_at'] - started_at if buy else None,
+            '매수 주문 → 체결': buy['filled_at'] - buy['received_at'] if buy and buy['filled_at'] else None,
+            '체결 → 익절 주문': sell['received_at'] - buy['filled_at'] if sell and buy['filled_at'] else None,
+            '전체': finished_at - started_at,
+            '매수 성공': bought,
+            'API 요청 수': server.stats['requests'],
+        }
+    finally:
+        server.stop()
+
+
+def run_load(args):
+    """조회 TR을 동시에 호출하여 처리량과 응답 시간 분포를 측정합니다."""
+    server = create_server(args)
+    try:
+        client = create_client(server)
+        if not client.authenticate():
+            raise RuntimeError("시뮬레이터 인증에 실패했습니다")
+
+        calls = [client.get_balance, client.get_positions, client.get_order_status, client.get_pending_orders]
+
+        def timed_call(i: int) -> float:
+            call_started = time.perf_counter()
+            calls[i % len(calls)]()
+            return time.perf_counter() - call_started
+
+        started_at = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            durations = list(executor.map(timed_call, range(args.load)))
+        elapsed = time.perf_counter() - started_at
+
+        print(f"📈 조회 부하: {args.load}건, 동시 {args.workers}개, {elapsed:.2f}초 ({args.load / elapsed:.1f}건/초)")
+        print_stats('응답 시간', durations)
+        print(f"   시뮬레이터: 요청 {server.stats['requests']}건, 호출 제한 {server.stats['rate_limited']}건, "
+              f"서버 오류 {server.stats['server_errors']}건")
+    finally:
+        server.stop()
+
+
+def print_stats(name: str, values: list):
+    """측정값의 최소/중앙값/p95/최대를 밀리초로 출력합니다."""
+    values = sorted(value for value in values if value is not None)
+    if not values:
+        print(f"  {name}: 측정값 없음")
+        return
+    p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+    print(f"  {name:<12} 최소 {values[0] * 1000:8.1f}ms | 중앙값 {statistics.median(values) * 1000:8.1f}ms | "
+          f"p95 {p95 * 1000:8.1f}ms | 최대 {values[-1] * 1000:8.1f}ms")
+
+
+def main() -> int:
+    """벤치마크를 실행하고 결과를 출력합니다."""
+    parser = argparse.ArgumentParser(description="로컬 키움증권 시뮬레이터로 거래 경로 지연 시간을 측정합니다.")
+    parser.add_argument('--runs', type=int, default=5, help="공시 처리 측정 횟수")
+    parser.add_argument('--latency-ms', type=float, nargs=2, default=[5.0, 20.0], metavar=('MIN', 'MAX'),
+                        help="시뮬레이터 응답 지연 범위 (밀리초)")
+    parser.add_argument('--fill-delay-ms', type=float, default=50.0, help="주문 접수 후 체결까지 지연 (밀리초)")
+    parser.add_argument('--partial-fills', type=int, default=1, help="주문 1건의 분할 체결 횟수")
+    parser.add_argument('--rate-limit', type=int, default=5, help="시뮬레이터 초당 허용 요청 수 (0이면 제한 없음)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="시뮬레이터 HTTP 500 응답 확률")
+    parser.add_argument('--seed', type=int, default=None, help="난수 시드")
+    parser.add_argument('--polling', action='store_true', help="실시간 체결 수신 없이 체결 조회 API로만 체결 확인")
+    parser.add_argument('--warm', action='store_true', help="개장 전 거래 경로 준비 후 공시 처리")
+    parser.add_argument('--load', type=int, default=0, help="조회 부하 측정 요청 수 (0이면 생략)")
+    parser.add_argument('--workers', type=int, default=8, help="조회 부하 측정 동시 실행 수")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level='WARNING')
+
+    if args.load:
+        run_load(args)
+        return 0
+
+    print(f"⏱️ 거래 경로 지연 측정: {args.runs}회 (응답 지연 {args.latency_ms[0]:g}~{args.latency_ms[1]:g}ms, "
+          f"체결 지연 {args.fill_delay_ms:g}ms, 분할 체결 {args.partial_fills}회, "
+          f"체결 확인 {'체결 조회 API' if args.polling else '실시간 체결 수신'}{', 사전 준비' if args.warm else ''})")
+
+    results = [measure_once(args, run) for run in range(1, args.runs + 1)]
+
+    for name in ('공시 → 매수 주문', '매수 주문 → 체결', '체결 → 익절 주문', '전체'):
+        print_stats(name, [result[name] for result in results])
+
+    succeeded = sum(1 for result in results if result['매수 성공'])
+    requests_per_run = statistics.mean(result['API 요청 수'] for result in results)
+    print(f"  매수 성공 {succeeded}/{len(results)}회, 공시당 API 요청 {requests_per_run:.1f}건")
+    return 0 if succeeded == len(results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
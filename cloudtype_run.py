@@ -125,6 +125,9 @@ def run_scraping_system():
     """
     global system_instance
     
+    if CLOUDTYPE_CONFIG.get('resident_mode'):
+        return run_resident_system()
+    
     print("=" * 80)
     print("🔄 [스크래핑 시스템 실행 시작]")
     print("=" * 80)
@@ -201,9 +204,56 @@ def run_scraping_system():
         print("="*50)
         return 1
 
+def run_resident_system():
+    """
+    상주 모드로 DART 스크래핑 시스템을 실행합니다.
+    
+    첫 실행 시에만 DartScrapingSystem 인스턴스를 생성하고, 이후 실행 주기에서는
+    같은 인스턴스(시트 연결, HTTP 세션, 키움 토큰, 분석기)를 재사용합니다.
+    실행 전에 상태를 점검하여 끊어진 구성요소만 다시 연결합니다.
+    
+    Returns:
+        int: 종료 코드 (0: 성공, 1: 실패)
+    """
+    global system_instance
+    
+    try:
+        if system_instance is None:
+            print("🔧 [상주 모드] 시스템 인스턴스 생성 중...")
+            from src.main import DartScrapingSystem
+            system_instance = DartScrapingSystem()
+            # 실시간 주문체결 수신, 개장 전 거래 경로 준비 및 장중 연결 유지 (인스턴스가 유지되는 상주 모드에서만)
+            system_instance.auto_trading.start_order_stream()
+            system_instance.auto_trading.start_warmup()
+            print("✅ [상주 모드] 시스템 인스턴스 생성 완료")
+        elif not system_instance.ensure_healthy():
+            logger.warning("⚠️ [상주 모드] 일부 구성요소가 비정상 상태입니다. 가능한 범위에서 실행합니다.")
+        
+        success = system_instance.run()
+        print(f"✅ [상주 모드] 실행 완료 (결과: {success})")
+        return 0 if success else 1
+        
+    except Exception as e:
+        print(f"❌ [상주 모드] 실행 중 오류 발생: {e}")
+        import traceback
+        print(traceback.format_exc())
+        
+        # 다음 실행 주기에 인스턴스를 새로 생성
+        if system_instance is not None and hasattr(system_instance, 'stop'):
+            try:
+                system_instance.stop()
+            except Exception:
+                pass
+        system_instance = None
+        return 1
+
 def health_check():
     """헬스체크 함수"""
     try:
+        if system_instance is not None and hasattr(system_instance, 'health_check'):
+            status = system_instance.health_check()
+            logger.debug(f"  ├─ 구성요소 상태: {status}")
+        
         logger.debug("  ├─ 기본 헬스체크 로직 실행 중...")
         logger.debug("  ├─ 시스템 모듈 확인...")
         logger.debug("  └─ 헬스체크 완료")
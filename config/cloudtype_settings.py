@@ -74,6 +74,19 @@ SHEET_COLUMNS = [
     '종료일', '계약금액', '최근 매출액', '매출액 대비 비율'
 ]
 
+# 구글 시트 로컬 복제본 설정
+GOOGLE_SHEETS_CONFIG = {
+    'use_local_replica': True,  # 시트 내용을 로컬(SQLite)에 복제하고 새로 추가된 행만 동기화
+    'replica_db_path': '/tmp/sheets_replica.db' if IS_PRODUCTION else 'cache/sheets_replica.db',
+    'replica_full_sync_minutes': 60,  # 수정/삭제된 행 반영을 위한 전체 재동기화 주기
+    'company_list_sync_minutes': 10,  # 회사 목록(수정이 잦은 시트) 전체 재동기화 주기
+    'use_write_buffer': True,  # 행 추가/셀 수정을 모아 일괄 전송
+    'write_buffer_max_pending': 100,  # 대기 작업이 이 개수 이상이면 즉시 전송
+    'write_buffer_max_delay_seconds': 30,  # 가장 오래된 작업이 이 시간(초) 이상 대기하면 전송
+    'write_spill_file': '/tmp/sheets_write_spill.json' if IS_PRODUCTION else 'logs/sheets_write_spill.json',  # 전송 전/전송 실패한 작업 보관 파일 (재시작 시 다시 전송)
+    'trade_ledger_sync_seconds': 30  # 거래내역 색인을 시트와 다시 맞추는 최소 간격 (초)
+}
+
 # DART API 설정
 DART_API_CONFIG = {
     'base_url': 'https://opendart.fss.or.kr/api',
@@ -81,7 +94,23 @@ DART_API_CONFIG = {
     'document_endpoint': '/document.xml',
     'search_start_date': '20200101',
     'page_size': 100,
-    'request_delay': 0.2 if IS_PRODUCTION else 0.1  # 프로덕션에서는 더 안전한 간격
+    'request_delay': 0.2 if IS_PRODUCTION else 0.1,  # 프로덕션에서는 더 안전한 간격
+    'scan_mode': os.getenv('DART_SCAN_MODE', 'company'),  # company: 회사별 조회, market: 시장 전체 피드 조회
+    'market_feed_max_days': 90,  # 시장 전체 조회 시 최대 검색 기간 (DART 제한: 3개월)
+    'rate_limit_burst': 5,  # 순간적으로 허용되는 최대 연속 요청 수
+    'max_workers': int(os.getenv('DART_MAX_WORKERS', 4)),  # 회사별 공시 동시 처리 스레드 수
+    'connection_pool_size': 10,  # HTTP 연결 풀 크기 (max_workers 이상 권장)
+    'http_max_retries': 3,  # 연결 오류/429/5xx 응답 시 재시도 횟수
+    'http_backoff_factor': 0.5,  # 재시도 간 지수 백오프 계수 (초)
+    'use_document_cache': True,  # 다운로드한 공시 원본파일 로컬 보관
+    'document_cache_dir': '/tmp/dart_documents' if IS_PRODUCTION else 'cache/dart_documents',
+    'document_cache_max_mb': 200 if IS_PRODUCTION else 500,  # 원본파일 저장소 최대 용량 (초과 시 LRU 삭제)
+    'parser_engine': os.getenv('REPORT_PARSER_ENGINE', 'auto'),  # 보고서 파서 (auto: lxml 우선, 없으면 html.parser)
+    'backfill_download_workers': 4,  # 백필 시 보고서 다운로드 스레드 수
+    'backfill_parse_workers': None,  # 백필 시 보고서 분석 프로세스 수 (None: CPU 코어 수)
+    'backfill_batch_size': 50,  # 백필 시 시트 저장 배치 크기
+    'use_watermark': True,  # 회사별 마지막 확인 공시 이후만 조회
+    'watermark_file': '/tmp/dart_watermarks.json' if IS_PRODUCTION else 'logs/dart_watermarks.json'
 }
 
 # 로깅 설정 (한국 시간대 적용)
@@ -102,7 +131,8 @@ CLOUDTYPE_CONFIG = {
     'host': '0.0.0.0',
     'max_memory_usage': '512MB',  # 메모리 사용량 제한
     'timeout': 300,  # 5분 타임아웃
-    'max_concurrent_requests': 5  # 동시 요청 제한
+    'max_concurrent_requests': 5,  # 동시 요청 제한
+    'resident_mode': os.getenv('RESIDENT_MODE', 'true').lower() == 'true'  # 실행 주기 간 시스템 인스턴스 재사용
 }
 
 # 필수 데이터 필드 정의
@@ -168,6 +198,30 @@ TRADING_CONFIG = {
     'monitoring_interval': 300,              # 공시 모니터링 주기 (5분)
     'position_check_interval': 600,          # 포지션 체크 주기 (10분)
     'min_balance': Decimal('10000'),         # 최소 예수금 (1만원)
+    'use_order_stream': True,                # 실시간 주문체결 수신 (미지원 시 체결 조회 API 폴링)
+    'account_snapshot_ttl': 3,               # 잔고/보유 종목 조회 결과 재사용 시간 (초, 주문/체결 시 폐기)
+    'token_cache_file': '/tmp/kiwoom_token.json' if IS_PRODUCTION else 'cache/kiwoom_token.json',  # 접속 토큰 보관 파일 (재시작 시 만료 전까지 재사용, None이면 메모리에만 보관)
+    'use_warmup': True,                      # 상주 모드에서 개장 전 인증/연결/계좌 정보 미리 준비
+    'warmup_minutes_before_open': 10,        # 정규장 개장 몇 분 전부터 준비할지
+    'warmup_keepalive_seconds': 30,          # 장중 계좌 조회(연결 유지) 간격 (초)
+}
+
+# 키움증권 API 호출 제한 설정 (토큰 발급 제외)
+KIWOOM_RATE_LIMIT_CONFIG = {
+    'shared_state_path': '/tmp/kiwoom_rate_limit.db' if IS_PRODUCTION else 'cache/kiwoom_rate_limit.db',  # 같은 앱 키를 쓰는 프로세스들이 공유하는 호출 기록
+    'max_calls_per_day': 10000,  # 일일 최대 호출 수 (재시작해도 유지)
+    'buckets': {  # 초당 충전 토큰 수(rate)와 순간 허용 호출 수(burst), 어느 1초 구간에도 rate + burst - 1회 이하
+        'total': {'rate': 3, 'burst': 3},  # 전체 TR (서버 한도 초당 5회)
+        'order': {'rate': 2, 'burst': 3},  # 주문 TR (kt*): 매수/익절/취소는 한 번에 몰아 보내되 계속되면 조회 몫을 남김
+        'inquiry': {'rate': 2, 'burst': 2},  # 조회 TR (ka*): 조회가 몰려도 주문에 초당 1회 이상 남김
+    },
+}
+
+# 시세 데이터(pykrx) 캐시 설정
+MARKET_DATA_CONFIG = {
+    'use_cache': True,  # 확정된 과거 거래일 시세를 디스크에 보관하고 없는 구간만 조회
+    'cache_dir': '/tmp/market_data' if IS_PRODUCTION else 'cache/market_data',
+    'live_ttl_seconds': 60  # 당일(장중) 시세 재사용 시간 (초)
 }
 
 # 에러 처리 설정
@@ -3,7 +3,8 @@
 DART 공시 스크래핑 시스템 실행 스크립트
 
 사용법:
-    python run.py
+    python run.py              # 정규 스크래핑 실행
+    python run.py --backfill   # 미처리 과거 공시 백필 실행
 
 이 스크립트는 다음과 같은 작업을 수행합니다:
 1. 구글 스프레드시트에서 분석 대상 회사 목록을 가져옵니다
@@ -22,7 +23,7 @@ from src.main import main
 
 if __name__ == '__main__':
     try:
-        exit_code = main()
+        exit_code = main(backfill='--backfill' in sys.argv[1:])
         sys.exit(exit_code)
     except KeyboardInterrupt:
         print("\n\n⚠️ 사용자에 의해 중단되었습니다.")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+거래 전략 백테스트 실행 스크립트
+
+사용법:
+    python run_backtest.py           # 현재 TRADING_CONFIG로 백테스트
+    python run_backtest.py --sweep   # 익절/손절/보유 기간 조합별 백테스트
+
+'계약' 시트의 과거 공시를 접수일자 순서대로 재생하면서 실제 매수/매도 로직
+(TradingStrategy, PositionManager, OrderManager)을 모의 키움증권 클라이언트로 실행하고,
+손익, 적중률, 보유 기간을 출력합니다. 일봉은 시세 캐시(MARKET_DATA_CONFIG)를 사용하므로
+두 번째 실행부터는 새로 추가된 거래일만 조회합니다.
+"""
+
+import sys
+import os
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from loguru import logger
+
+from config.settings import TRADING_CONFIG
+from src.google_sheets.client import GoogleSheetsClient
+from src.backtest import BacktestEngine, BarStore, load_contracts_from_sheet
+from src.backtest.market_data import to_date_int
+
+# 파라미터 탐색 조합
+SWEEP_GRID = {
+    'profit_target': [Decimal('0.02'), Decimal('0.03'), Decimal('0.05')],
+    'stop_loss_5days': [Decimal('-0.01'), Decimal('-0.03')],
+    'hold_period_soft': [3, 5],
+    'hold_period_hard': [7, 10, 15],
+}
+
+# 지표 계산(최근 150일)과 보유 기간 이후 매도를 위한 여유 기간 (일)
+LOOKBACK_DAYS = 160
+LOOKAHEAD_DAYS = 40
+
+
+def main() -> int:
+    """백테스트를 실행하고 결과를 출력합니다."""
+    logger.remove()
+    logger.add(sys.stderr, level='WARNING')
+
+    sheets_client = GoogleSheetsClient()
+    if not sheets_client.connect():
+        print("❌ 구글 시트에 연결할 수 없습니다.")
+        return 1
+
+    contracts = load_contracts_from_sheet(sheets_client)
+    dates = [to_date_int(contract['접수일자']) for contract in contracts if contract.get('접수일자', '').strip()]
+    if not dates:
+        print("⚠️ 백테스트할 공시가 없습니다.")
+        return 1
+
+    start = datetime.strptime(str(min(dates)), "%Y%m%d") - timedelta(days=LOOKBACK_DAYS)
+    end = min(datetime.strptime(str(max(dates)), "%Y%m%d") + timedelta(days=LOOKAHEAD_DAYS), datetime.now())
+
+    print(f"📦 일봉 불러오는 중: {len(contracts)}개 공시, {start:%Y-%m-%d} ~ {end:%Y-%m-%d}")
+    bars = BarStore.load(
+        [BacktestEngine.normalize_code(contract.get('종목코드', '')) for contract in contracts],
+        [contract.get('시장구분', 'KOSPI') for contract in contracts],
+        start.strftime("%Y%m%d"), end.strftime("%Y%m%d")
+    )
+    engine = BacktestEngine(contracts, bars)
+
+    if '--sweep' in sys.argv[1:]:
+        reports = engine.sweep(SWEEP_GRID)
+        reports.sort(key=lambda report: report.total_pnl, reverse=True)
+        print(f"📊 파라미터 조합 {len(reports)}개 (손익 순)")
+        for report in reports:
+            print(f"  {report.summary()}")
+        return 0
+
+    report = engine.run(TRADING_CONFIG)
+    print(f"📊 공시 {report.events}건 중 매수 신호 {report.signals}건")
+    for trade in report.trades:
+        print(f"  {trade.buy_date} → {trade.sell_date} {trade.stock_name}({trade.stock_code}) "
+              f"{trade.return_rate * 100:+.2f}% ({trade.holding_days}일, {trade.exit_reason})")
+    print(report.summary())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
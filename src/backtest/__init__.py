@@ -0,0 +1,22 @@
+"""
+백테스트 모듈
+
+이 모듈은 과거 공시 이력을 일봉 데이터에 맞춰 재생하여 거래 전략을 오프라인으로 평가하고,
+거래 경로의 지연 시간 측정을 위한 로컬 키움증권 API 시뮬레이터를 제공합니다.
+"""
+
+from src.backtest.market_data import BarSeries, BarStore
+from src.backtest.simulated_kiwoom import SimulatedKiwoomClient
+from src.backtest.kiwoom_server import LocalKiwoomServer
+from src.backtest.engine import BacktestEngine, BacktestReport, BacktestTrade, load_contracts_from_sheet
+
+__all__ = [
+    'BarSeries',
+    'BarStore',
+    'SimulatedKiwoomClient',
+    'LocalKiwoomServer',
+    'BacktestEngine',
+    'BacktestReport',
+    'BacktestTrade',
+    'load_contracts_from_sheet',
+]
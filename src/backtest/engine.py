@@ -0,0 +1,458 @@
+"""
+백테스트 엔진
+
+이 모듈은 '계약' 시트의 과거 공시를 접수일자 순서대로 재생하면서, 실제 거래에 사용하는
+TradingStrategy / PositionManager / OrderManager를 모의 키움증권 클라이언트에 연결해 실행합니다.
+
+하루는 다음 순서로 진행됩니다.
+1. 장 시작: 전일까지 접수된 지정가 매도 주문을 오늘 일봉(시가/고가)으로 체결 판정
+2. 15:00: 당일 공시에 대해 매수 조건 확인 후 종가로 시장가 매수 (공시 시각을 알 수 없으므로 종가 기준)
+3. 15:20: 보유 포지션 관리 (보유 기간별 매도 전략, 종가 기준)
+
+투자 점수는 모든 공시에 대해 한 번만 벡터 연산으로 계산하므로, 익절/손절/보유 기간 등의
+설정만 바꾸는 파라미터 탐색에서는 일봉 재생만 반복합니다.
+"""
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, time
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+import numpy as np
+from loguru import logger
+
+from src.backtest.market_data import BarStore, shift_date_int, to_date_int
+from src.backtest.simulated_kiwoom import SimulatedKiwoomClient
+from src.trading.order_manager import OrderManager
+from src.trading.position_manager import PositionManager
+from src.trading.trading_strategy import TradingStrategy
+from src.utils.stock_analyzer import StockAnalysisResult
+from src.utils.stock_screener import VOLUME_AVG_WINDOW, INDEX_MA_WINDOW, build_panel, score_contracts
+
+# 실제 분석과 같은 조회 기간 (StockAnalyzer는 최근 150일 시세로 지표를 계산)
+ANALYSIS_LOOKBACK_DAYS = 150
+
+# 백테스트 중 상세 로그를 생략할 모듈
+QUIET_MODULES = ('src.trading', 'src.utils.market_schedule')
+
+# 파라미터 탐색 대상 설정 키 (보고서에 표시)
+SWEEP_KEYS = ('profit_target', 'stop_loss_5days', 'hold_period_soft', 'hold_period_hard', 'min_score')
+
+
+@dataclass
+class BacktestTrade:
+    """백테스트 거래 1건 (매수 ~ 매도)"""
+    rcept_no: str
+    stock_code: str
+    stock_name: str
+    score: int
+    buy_date: int
+    buy_price: Decimal
+    quantity: int
+    buy_cost: Decimal  # 매수 금액 + 수수료
+    sell_date: Optional[int] = None
+    sell_price: Optional[Decimal] = None
+    sell_proceeds: Decimal = Decimal('0')  # 매도 금액 - 수수료 - 세금
+    holding_days: int = 0  # 보유 거래일 수
+    exit_reason: str = ''
+    is_open: bool = False  # 백테스트 종료 시점까지 보유 중 (종가로 평가)
+
+    @property
+    def pnl(self) -> Decimal:
+        """비용을 반영한 실현 손익"""
+        return self.sell_proceeds - self.buy_cost
+
+    @property
+    def return_rate(self) -> float:
+        """비용을 반영한 수익률"""
+        return float(self.pnl / self.buy_cost) if self.buy_cost else 0.0
+
+
+@dataclass
+class BacktestReport:
+    """백테스트 결과 요약"""
+    params: Dict[str, Any]
+    initial_cash: Decimal
+    final_equity: Decimal
+    trades: List[BacktestTrade] = field(default_factory=list)
+    events: int = 0  # 재생한 공시 수
+    signals: int = 0  # 매수 조건을 충족한 공시 수
+
+    @property
+    def total_pnl(self) -> Decimal:
+        return self.final_equity - self.initial_cash
+
+    @property
+    def total_return(self) -> float:
+        return float(self.total_pnl / self.initial_cash) if self.initial_cash else 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """수익으로 끝난 거래 비율"""
+        return sum(1 for trade in self.trades if trade.pnl > 0) / len(self.trades) if self.trades else 0.0
+
+    @property
+    def average_return(self) -> float:
+        return float(np.mean([trade.return_rate for trade in self.trades])) if self.trades else 0.0
+
+    @property
+    def average_holding_days(self) -> float:
+        return float(np.mean([trade.holding_days for trade in self.trades])) if self.trades else 0.0
+
+    @property
+    def max_holding_days(self) -> int:
+        return max((trade.holding_days for trade in self.trades), default=0)
+
+    def summary(self) -> str:
+        """결과를 한 줄로 요약합니다."""
+        params = ', '.join(f"{key}={value}" for key, value in self.params.items())
+        return (f"[{params}] 거래 {len(self.trades)}건 | 손익 {self.total_pnl:,.0f}원 "
+                f"({self.total_return * 100:+.2f}%) | 적중률 {self.hit_rate * 100:.1f}% | "
+                f"평균 수익률 {self.average_return * 100:+.2f}% | "
+                f"평균 보유 {self.average_holding_days:.1f}일 (최대 {self.max_holding_days}일)")
+
+
+def load_contracts_from_sheet(sheets_client) -> List[Dict]:
+    """
+    '계약' 시트의 공시 이력을 불러옵니다. (로컬 복제본 사용)
+
+    Args:
+        sheets_client: 연결된 GoogleSheetsClient
+
+    Returns:
+        List[Dict]: 계약 정보 목록 (시트 행 그대로)
+    """
+    df = sheets_client.get_sheet_dataframe(sheets_client.sheet_names['CONTRACT'])
+    if df is None or df.empty:
+        return []
+    return df.fillna('').astype(str).to_dict('records')
+
+
+class BacktestEngine:
+    """과거 공시를 일봉에 맞춰 재생하여 거래 전략을 평가하는 백테스트 엔진"""
+
+    BUY_TIME = time(15, 0)  # 공시 매수 시각 (종가 기준)
+    POSITION_CHECK_TIME = time(15, 20)  # 포지션 관리 시각 (종가 기준)
+    MARKET_OPEN_TIME = time(9, 0)
+
+    def __init__(self, contracts: List[Dict], bars: BarStore, initial_cash: Decimal = Decimal('10000000'),
+                 sell_tax_rate: Decimal = Decimal('0.0015')):
+        """
+        백테스트 엔진을 초기화하고 모든 공시의 투자 점수를 미리 계산합니다.
+
+        Args:
+            contracts (List[Dict]): 계약 정보 목록 ('계약' 시트 행)
+            bars (BarStore): 일봉 저장소
+            initial_cash (Decimal): 초기 예수금
+            sell_tax_rate (Decimal): 매도 시 거래세율
+        """
+        self.bars = bars
+        self.initial_cash = Decimal(initial_cash)
+        self.sell_tax_rate = sell_tax_rate
+        self.events = self._prepare_events(contracts)
+        self._score_events()
+
+        logger.info(f"백테스트 준비 완료: 공시 {len(self.events)}건 "
+                    f"(일봉 없는 공시 {len(contracts) - len(self.events)}건 제외)")
+
+    @staticmethod
+    def normalize_code(stock_code) -> str:
+        """시트에서 앞자리 0이 빠진 종목코드를 6자리로 보정합니다."""
+        code = str(stock_code).strip()
+        return code.zfill(6) if code.isdigit() else code
+
+    @staticmethod
+    def _parse_number(value) -> int:
+        """시트의 숫자 문자열(쉼표 포함)을 정수로 변환합니다."""
+        try:
+            return int(float(str(value).replace(',', '').strip() or 0))
+        except ValueError:
+            return 0
+
+    def _prepare_events(self, contracts: List[Dict]) -> List[Dict]:
+        """공시 당일 일봉이 있는 계약만 접수일자 순서로 정렬합니다."""
+        events = []
+        for contract in contracts:
+            try:
+                date = to_date_int(contract.get('접수일자', ''))
+            except ValueError:
+                continue
+
+            stock_code = self.normalize_code(contract.get('종목코드', ''))
+            series = self.bars.stocks.get(stock_code)
+            if series is None or series.row(date) is None:
+                continue
+
+            events.append({
+                'date': date,
+                'rcept_no': str(contract.get('접수번호', '')),
+                'stock_code': stock_code,
+                'contract': {**contract, '종목코드': stock_code, '접수일자': str(date)}
+            })
+
+        events.sort(key=lambda event: (event['date'], event['rcept_no']))
+        return events
+
+    def _score_events(self):
+        """모든 공시의 투자 지표와 점수를 벡터 연산으로 계산합니다."""
+        if not self.events:
+            return
+
+        volumes, open_prices, close_prices, market_caps = [], [], [], []
+        contract_amounts, recent_sales, index_current, index_ma200 = [], [], [], []
+
+        for event in self.events:
+            contract = event['contract']
+            series = self.bars.stocks[event['stock_code']]
+            date = event['date']
+            window_start = shift_date_int(date, -ANALYSIS_LOOKBACK_DAYS)
+
+            # 종목 시세 (공시일까지 최근 150일 중 거래량 평균 계산 구간)
+            end = series.row(date) + 1
+            start = int(np.searchsorted(series.dates, window_start, side='left'))
+            # (데이터가 20일 미만이면 빈 값 -> 거래량 비율 1.0으로 처리)
+            volumes.append(series.volume[end - VOLUME_AVG_WINDOW:end] if end - start >= VOLUME_AVG_WINDOW else None)
+            open_prices.append(series.open[end - 1])
+            close_prices.append(series.close[end - 1])
+
+            market_cap = self.bars.market_cap_eok(event['stock_code'], date)
+            if market_cap is None:
+                listed_shares = self._parse_number(contract.get('상장주식수', '0'))
+                market_cap = int(series.close[end - 1]) * listed_shares // 100000000 if listed_shares > 0 else 0
+            market_caps.append(market_cap)
+
+            contract_amounts.append(self._parse_number(contract.get('계약금액', '0')))
+            recent_sales.append(self._parse_number(contract.get('최근 매출액', '0')))
+
+            # 시장지수 (공시일까지 최근 150일, 최대 200거래일 평균)
+            index_series = self.bars.indexes.get(contract.get('시장구분', 'KOSPI'))
+            if index_series is None:
+                index_current.append(np.nan)
+                index_ma200.append(np.nan)
+            else:
+                index_end = index_series.position(date)
+                index_start = max(int(np.searchsorted(index_series.dates, window_start, side='left')),
+                                  index_end - INDEX_MA_WINDOW)
+                index_current.append(index_series.close[index_end - 1] if index_end else np.nan)
+                index_ma200.append(index_series.close_mean(index_start, index_end))
+
+        result = score_contracts(build_panel(volumes, VOLUME_AVG_WINDOW), open_prices, close_prices,
+                                 market_caps, contract_amounts, recent_sales, index_current, index_ma200)
+
+        for i, event in enumerate(self.events):
+            contract = event['contract']
+            event['analysis'] = StockAnalysisResult(
+                stock_code=event['stock_code'],
+                stock_name=contract.get('종목명', ''),
+                market_type=contract.get('시장구분', 'KOSPI'),
+                industry_code=contract.get('업종코드', ''),
+                industry_name=contract.get('업종명', ''),
+                is_target_industry=False,
+                current_price=int(close_prices[i]),
+                opening_price=int(open_prices[i]),
+                price_change_rate=(close_prices[i] - open_prices[i]) / open_prices[i] * 100 if open_prices[i] else 0.0,
+                market_cap=int(market_caps[i]),
+                is_index_above_ma200=bool(result.is_index_above_ma200[i]),
+                is_market_cap_in_range=bool(result.is_market_cap_in_range[i]),
+                is_contract_ratio_over_20=bool(result.is_contract_ratio_over_20[i]),
+                trading_conditions_met=int(result.trading_conditions_met[i]),
+                index_current=float(result.index_current[i]),
+                index_ma200=float(result.index_ma200[i]),
+                contract_sales_ratio=float(result.contract_sales_ratio[i]),
+                volume_ratio=float(result.volume_ratio[i]),
+                is_positive_candle=bool(result.is_positive_candle[i]),
+                analysis_summary='',
+                recommendation_score=int(result.recommendation_score[i])
+            )
+
+    def run(self, config: Optional[Dict] = None, quiet: bool = True) -> BacktestReport:
+        """
+        공시 이력을 재생하여 백테스트를 실행합니다.
+
+        Args:
+            config (Optional[Dict]): 거래 설정 (TRADING_CONFIG 형식, None이면 TRADING_CONFIG)
+            quiet (bool): 거래 모듈의 상세 로그 생략 여부
+
+        Returns:
+            BacktestReport: 백테스트 결과
+        """
+        if config is None:
+            from config.settings import TRADING_CONFIG
+            config = TRADING_CONFIG
+
+        if quiet:
+            for module in QUIET_MODULES:
+                logger.disable(module)
+        try:
+            return self._run(config)
+        finally:
+            if quiet:
+                for module in QUIET_MODULES:
+                    logger.enable(module)
+
+    def _run(self, config: Dict) -> BacktestReport:
+        """백테스트 본체 (로그 설정은 run()에서 처리)"""
+        client = SimulatedKiwoomClient(
+            self.bars, self.initial_cash,
+            commission_rate=Decimal(str(config.get('commission_rate', OrderManager.COMMISSION_RATE))),
+            sell_tax_rate=self.sell_tax_rate
+        )
+        clock_state = {'now': None}
+        clock = lambda: clock_state['now']
+
+        order_mgr = OrderManager(client)
+        position_mgr = PositionManager(client, config=config, clock=clock)
+        strategy = TradingStrategy(client, order_mgr, position_mgr, config=config, clock=clock)
+        strategy.execution_timeout = 0
+
+        report = BacktestReport(
+            params={key: config[key] for key in SWEEP_KEYS if key in config},
+            initial_cash=self.initial_cash,
+            final_equity=self.initial_cash,
+            events=len(self.events)
+        )
+        if not self.events:
+            return report
+
+        events_by_date: Dict[int, List[Dict]] = {}
+        for event in self.events:
+            events_by_date.setdefault(event['date'], []).append(event)
+
+        calendar = self.bars.calendar()
+        calendar = calendar[calendar >= self.events[0]['date']]
+        last_event_date = self.events[-1]['date']
+
+        open_trade: Optional[BacktestTrade] = None
+        buy_time: Optional[datetime] = None
+
+        def set_time(date: int, at: time, price_field: str):
+            now = datetime.combine(datetime.strptime(str(date), "%Y%m%d").date(), at)
+            clock_state['now'] = now
+            client.set_time(now, price_field)
+
+        def close_trade(fills: List[Dict], reason: str):
+            nonlocal open_trade
+            for fill in fills:
+                if open_trade is None or fill['side'] != 'sell' or fill['stock_code'] != open_trade.stock_code:
+                    continue
+                open_trade.sell_date = fill['date']
+                open_trade.sell_price = fill['price']
+                open_trade.sell_proceeds += fill['price'] * fill['quantity'] - fill['commission'] - fill['tax']
+                if open_trade.stock_code not in client.holdings:
+                    if not reason:
+                        reason = '익절(지정가)' if fill['price'] >= open_trade.buy_price else '손절(지정가)'
+                    open_trade.exit_reason = reason
+                    report.trades.append(open_trade)
+                    open_trade = None
+
+        for date in calendar:
+            date = int(date)
+            if open_trade is None and date > last_event_date:
+                break
+
+            if open_trade is not None:
+                open_trade.holding_days += 1
+
+            # 1. 장 시작: 미체결 지정가 주문 체결 판정
+            set_time(date, self.MARKET_OPEN_TIME, 'open')
+            client.match_limit_orders()
+            close_trade(client.drain_fills(), '')
+
+            # 2. 당일 공시 매수 (종가 기준)
+            set_time(date, self.BUY_TIME, 'close')
+            for event in events_by_date.get(date, []):
+                contract = event['contract']
+                decision = strategy.should_buy(contract, event['analysis'])
+                if not decision['should_buy']:
+                    continue
+                report.signals += 1
+
+                client.stock_names[event['stock_code']] = contract.get('종목명', '')
+                buy_result = strategy.execute_buy_strategy(event['stock_code'], contract.get('종목명', ''))
+                fills = [fill for fill in client.drain_fills() if fill['side'] == 'buy']
+                if not buy_result or 'error_info' in buy_result or not fills:
+                    continue
+
+                quantity = sum(fill['quantity'] for fill in fills)
+                buy_cost = sum((fill['price'] * fill['quantity'] + fill['commission'] for fill in fills), Decimal('0'))
+                open_trade = BacktestTrade(
+                    rcept_no=event['rcept_no'],
+                    stock_code=event['stock_code'],
+                    stock_name=contract.get('종목명', ''),
+                    score=decision['score'],
+                    buy_date=date,
+                    buy_price=fills[-1]['price'],
+                    quantity=quantity,
+                    buy_cost=buy_cost
+                )
+                buy_time = buy_result['buy_time']
+
+            # 3. 포지션 관리 (종가 기준)
+            if open_trade is not None:
+                set_time(date, self.POSITION_CHECK_TIME, 'close')
+                result = strategy.execute_position_management(buy_time)
+                reason = result['reason'] if result and result.get('action') == 'sell_executed' else ''
+                close_trade(client.drain_fills(), reason)
+
+        # 종료 시점까지 보유 중인 거래는 마지막 종가로 평가
+        if open_trade is not None:
+            series = self.bars.stocks[open_trade.stock_code]
+            last_close = Decimal(str(series.last_close(int(calendar[-1]))))
+            open_trade.sell_price = last_close
+            open_trade.sell_proceeds = last_close * open_trade.quantity
+            open_trade.exit_reason = '보유 중 (종가 평가)'
+            open_trade.is_open = True
+            report.trades.append(open_trade)
+
+        report.final_equity = client.equity()
+        return report
+
+    def sweep(self, grid: Dict[str, List], base_config: Optional[Dict] = None,
+              max_workers: Optional[int] = None) -> List[BacktestReport]:
+        """
+        거래 설정 조합별로 백테스트를 실행합니다.
+
+        Args:
+            grid (Dict[str, List]): 설정 키별 후보 값 (예: {'profit_target': [Decimal('0.03'), Decimal('0.05')]})
+            base_config (Optional[Dict]): 기본 거래 설정 (None이면 TRADING_CONFIG)
+            max_workers (Optional[int]): 병렬 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 순차 실행)
+
+        Returns:
+            List[BacktestReport]: 조합 순서대로의 백테스트 결과
+        """
+        if base_config is None:
+            from config.settings import TRADING_CONFIG
+            base_config = TRADING_CONFIG
+
+        keys = list(grid)
+        configs = [{**base_config, **dict(zip(keys, values))} for values in itertools.product(*grid.values())]
+        max_workers = max_workers or os.cpu_count() or 1
+
+        logger.info(f"파라미터 탐색 시작: {len(configs)}개 조합 (프로세스 {max_workers}개)")
+
+        if max_workers <= 1 or len(configs) <= 1:
+            reports = [self.run(config) for config in configs]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_sweep_worker,
+                                     initargs=(self,)) as executor:
+                reports = list(executor.map(_run_sweep_config, configs))
+
+        logger.info(f"✅ 파라미터 탐색 완료: {len(reports)}개 조합")
+        return reports
+
+
+# 작업 프로세스별 백테스트 엔진 (프로세스 시작 시 한 번만 전달)
+_worker_engine: Optional[BacktestEngine] = None
+
+
+def _init_sweep_worker(engine: BacktestEngine):
+    """파라미터 탐색 작업 프로세스를 초기화합니다."""
+    global _worker_engine
+    _worker_engine = engine
+
+
+def _run_sweep_config(config: Dict) -> BacktestReport:
+    """작업 프로세스에서 설정 하나로 백테스트를 실행합니다."""
+    return _worker_engine.run(config)
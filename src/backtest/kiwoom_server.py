@@ -0,0 +1,577 @@
+"""
+로컬 키움증권 REST API 시뮬레이터
+
+이 모듈은 KiwoomAPIClient가 사용하는 TR을 같은 URL/헤더/응답 형식으로 제공하는
+로컬 HTTP 서버입니다. 실제 또는 모의투자 서버 없이 거래 경로의 지연 시간을 측정하고
+부하를 걸어볼 수 있도록 다음 동작을 재현합니다.
+
+- au10001 (/oauth2/token): 토큰 발급
+- ka01690 (/api/dostk/acnt): 일별잔고수익률 (예수금 + 보유 종목)
+- kt10000 / kt10001 (/api/dostk/ordr): 매수 / 매도 주문
+- ka10076 (/api/dostk/acnt): 체결 내역
+- ka10075 (/api/dostk/acnt): 미체결 내역
+
+재현하는 서버 특성:
+- 응답 지연: latency 범위에서 무작위로 지연
+- 체결: 주문 접수 후 fill_delay 간격으로 체결 (partial_fills > 1이면 나누어 부분 체결)
+- 지정가 주문: 현재가가 주문가에 도달해야 체결 (set_price로 시세 변경)
+- 호출 제한: 토큰 발급 외 요청이 초당 rate_limit_per_second를 넘으면 HTTP 429 (return_code -30)
+- 서버 오류: server_error_rate 확률로 HTTP 500
+- 연속조회: 목록 TR은 page_size 단위로 나누어 cont-yn / next-key 헤더로 응답
+- 실시간 주문체결: 체결될 때마다 웹소켓 '00' 타입과 같은 형식의 메시지를 구독자에게 전달
+  (create_order_stream()으로 OrderManager에 연결할 수신기 생성)
+"""
+
+import json
+import math
+import random
+import secrets
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from loguru import logger
+
+from src.trading.order_events import OrderEventStream, REAL_TYPE_ORDER_EXECUTION
+
+
+class _KiwoomRequestHandler(BaseHTTPRequestHandler):
+    """시뮬레이터 HTTP 요청 처리기 (요청 처리는 LocalKiwoomServer에 위임)"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        raw_body = self.rfile.read(length) if length else b''
+        try:
+            body = json.loads(raw_body.decode('utf-8')) if raw_body else {}
+        except ValueError:
+            body = {}
+
+        status, payload, headers = self.server.simulator.handle(self.path, dict(self.headers), body)
+
+        encoded = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json;charset=UTF-8')
+        self.send_header('Content-Length', str(len(encoded)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def log_message(self, format, *args):
+        logger.trace(f"키움 시뮬레이터 요청: {format % args}")
+
+
+class LocalKiwoomServer:
+    """키움증권 REST API를 흉내 내는 로컬 HTTP 서버"""
+
+    # 응답 코드 (KiwoomAPIClient._analyze_kiwoom_error 기준)
+    RC_AUTH_FAILED = -1
+    RC_INSUFFICIENT_CASH = -14
+    RC_INSUFFICIENT_QUANTITY = -15
+    RC_UNKNOWN_STOCK = -20
+    RC_RATE_LIMITED = -30
+
+    # 계좌 조회 TR -> (처리 메서드, 연속조회 대상 목록 필드, 정렬 기준 필드)
+    # 목록은 종목코드 오름차순 / 주문번호 내림차순이며, next-key에는 마지막으로 보낸 항목의 키를 담음
+    LIST_TRS = {
+        'ka01690': ('_balance', 'day_bal_rt', 'stk_cd'),
+        'ka10076': ('_executions', 'cntr', 'ord_no'),
+        'ka10075': ('_pending_orders', 'oso', 'ord_no'),
+    }
+
+    def __init__(self, prices: Optional[Dict[str, Decimal]] = None,
+                 stock_names: Optional[Dict[str, str]] = None,
+                 initial_cash: Decimal = Decimal('10000000'),
+                 latency: Tuple[float, float] = (0.005, 0.02),
+                 fill_delay: float = 0.05,
+                 partial_fills: int = 1,
+                 rate_limit_per_second: int = 5,
+                 server_error_rate: float = 0.0,
+                 page_size: int = 20,
+                 commission_rate: Decimal = Decimal('0.00018'),
+                 sell_tax_rate: Decimal = Decimal('0.0015'),
+                 token_ttl_hours: int = 24,
+                 seed: Optional[int] = None,
+                 host: str = '127.0.0.1', port: int = 0):
+        """
+        시뮬레이터를 초기화합니다. (start()를 호출해야 요청을 받습니다)
+
+        Args:
+            prices: 종목코드별 현재가
+            stock_names: 종목코드별 종목명
+            initial_cash: 초기 예수금
+            latency: 응답 지연 범위 (최소, 최대 초)
+            fill_delay: 주문 접수부터 (다음) 체결까지 걸리는 시간 (초)
+            partial_fills: 주문 1건을 나누어 체결할 횟수 (1이면 전량 체결)
+            rate_limit_per_second: 초당 허용 요청 수 (0이면 제한 없음)
+            server_error_rate: HTTP 500을 반환할 확률 (0~1)
+            page_size: 목록 TR의 한 번 응답에 담을 최대 건수
+            commission_rate: 매수/매도 수수료율
+            sell_tax_rate: 매도 거래세율
+            token_ttl_hours: 발급 토큰 유효 시간
+            seed: 난수 시드 (지연/오류 재현용)
+            host: 바인딩 주소
+            port: 바인딩 포트 (0이면 빈 포트 자동 선택)
+        """
+        self.prices: Dict[str, Decimal] = {code: Decimal(str(price)) for code, price in (prices or {}).items()}
+        self.stock_names: Dict[str, str] = dict(stock_names or {})
+        self.cash = Decimal(initial_cash)
+        self.latency = latency
+        self.fill_delay = fill_delay
+        self.partial_fills = max(1, partial_fills)
+        self.rate_limit_per_second = rate_limit_per_second
+        self.server_error_rate = server_error_rate
+        self.page_size = max(1, page_size)
+        self.commission_rate = commission_rate
+        self.sell_tax_rate = sell_tax_rate
+        self.token_ttl_hours = token_ttl_hours
+
+        self.holdings: Dict[str, Dict[str, Any]] = {}  # 종목코드 -> {'quantity', 'avg_price'}
+        self.orders: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()  # 주문번호 -> 주문 정보
+        self.tokens: Dict[str, datetime] = {}
+        self.stats: Dict[str, int] = {'requests': 0, 'rate_limited': 0, 'server_errors': 0}
+
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._request_times: deque = deque()
+        self._order_seq = 0
+        self._fill_listeners: List[Callable[[Dict[str, Any]], None]] = []
+
+        self._httpd = ThreadingHTTPServer((host, port), _KiwoomRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.simulator = self
+        self._serve_thread: Optional[threading.Thread] = None
+        self._match_thread: Optional[threading.Thread] = None
+        self._running = threading.Event()
+
+    # ---- 서버 제어 ----
+
+    @property
+    def base_url(self) -> str:
+        """KiwoomAPIClient에 전달할 접속 주소"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'LocalKiwoomServer':
+        """요청 처리 스레드와 체결 처리 스레드를 시작합니다."""
+        self._running.set()
+        self._serve_thread = threading.Thread(target=self._httpd.serve_forever, name='kiwoom-sim-http', daemon=True)
+        self._match_thread = threading.Thread(target=self._match_loop, name='kiwoom-sim-match', daemon=True)
+        self._serve_thread.start()
+        self._match_thread.start()
+        logger.info(f"🧪 키움증권 시뮬레이터 시작: {self.base_url}")
+        return self
+
+    def stop(self):
+        """서버를 종료합니다."""
+        self._running.clear()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        for thread in (self._serve_thread, self._match_thread):
+            if thread is not None:
+                thread.join(timeout=1)
+        logger.info("🧪 키움증권 시뮬레이터 종료")
+
+    def __enter__(self) -> 'LocalKiwoomServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    # ---- 시세/계좌 조작 ----
+
+    def set_price(self, stock_code: str, price: Decimal, stock_name: Optional[str] = None):
+        """
+        종목 현재가를 변경합니다. (도달한 지정가 주문은 다음 체결 처리에서 체결)
+
+        Args:
+            stock_code: 종목코드
+            price: 현재가
+            stock_name: 종목명 (지정 시 갱신)
+        """
+        with self._lock:
+            self.prices[stock_code] = Decimal(str(price))
+            if stock_name:
+                self.stock_names[stock_code] = stock_name
+
+    def get_price(self, stock_code: str) -> Optional[Decimal]:
+        """종목 현재가를 반환합니다. (등록되지 않은 종목이면 None)"""
+        with self._lock:
+            return self.prices.get(stock_code)
+
+    def get_orders(self) -> List[Dict[str, Any]]:
+        """
+        접수된 주문의 사본을 반환합니다. (벤치마크 시각 측정용)
+
+        Returns:
+            List[Dict]: 주문 목록 (접수 순서)
+                - received_at / first_fill_at / filled_at: time.perf_counter() 기준 시각
+        """
+        with self._lock:
+            return [dict(order) for order in self.orders.values()]
+
+    def subscribe_fills(self, listener: Callable[[Dict[str, Any]], None]):
+        """
+        체결 시마다 실시간 주문체결 메시지를 받을 함수를 등록합니다.
+
+        Args:
+            listener: {'trnm': 'REAL', 'data': [{'type': '00', 'values': {...}}]} 메시지를 받는 함수
+        """
+        with self._lock:
+            self._fill_listeners.append(listener)
+
+    def create_order_stream(self) -> OrderEventStream:
+        """
+        이 시뮬레이터의 체결을 실시간으로 받는 주문체결 수신기를 생성합니다.
+        (키움증권 웹소켓 대신 OrderManager에 연결)
+
+        Returns:
+            OrderEventStream: 연결된 수신기
+        """
+        stream = OrderEventStream().start()
+        self.subscribe_fills(stream.handle_message)
+        return stream
+
+    # ---- 요청 처리 ----
+
+    def handle(self, path: str, headers: Dict[str, str], body: Dict[str, Any]) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        """
+        HTTP 요청 하나를 처리합니다.
+
+        Args:
+            path: 요청 경로
+            headers: 요청 헤더
+            body: JSON 본문
+
+        Returns:
+            Tuple[int, Dict, Dict]: (HTTP 상태코드, 응답 본문, 응답 헤더)
+        """
+        headers = {name.lower(): value for name, value in headers.items()}
+        api_id = headers.get('api-id', 'au10001' if path == '/oauth2/token' else '')
+
+        low, high = self.latency
+        if high > 0:
+            time.sleep(self._random.uniform(low, high))
+
+        with self._lock:
+            self.stats['requests'] += 1
+
+            # 토큰 발급은 조회/주문 TR 호출 제한과 별도로 처리
+            if path != '/oauth2/token' and self._is_rate_limited():
+                self.stats['rate_limited'] += 1
+                return 429, self._error(self.RC_RATE_LIMITED, '허용된 요청 개수를 초과하였습니다'), {'api-id': api_id}
+
+            if self.server_error_rate and self._random.random() < self.server_error_rate:
+                self.stats['server_errors'] += 1
+                return 500, self._error(-32, '일시적인 서버 오류입니다'), {'api-id': api_id}
+
+            if path == '/oauth2/token':
+                return 200, self._issue_token(body), {}
+
+            if not self._is_valid_token(headers.get('authorization', '')):
+                return 200, self._error(self.RC_AUTH_FAILED, '인증에 실패했습니다 (토큰 만료 또는 잘못된 토큰)'), {'api-id': api_id}
+
+            self._process_fills(time.perf_counter())
+
+            if path == '/api/dostk/ordr' and api_id in ('kt10000', 'kt10001'):
+                return 200, self._place_order(api_id, body), {'api-id': api_id}
+
+            if path == '/api/dostk/acnt' and api_id in self.LIST_TRS:
+                method_name, list_key, key_field = self.LIST_TRS[api_id]
+                payload = getattr(self, method_name)(body)
+                return 200, payload, self._paginate(payload, list_key, key_field, headers, api_id)
+
+            return 404, self._error(1, f'지원하지 않는 요청입니다: {path} ({api_id})'), {'api-id': api_id}
+
+    def _is_rate_limited(self) -> bool:
+        """최근 1초 요청 수가 제한을 넘었는지 확인하고 현재 요청을 기록합니다."""
+        if not self.rate_limit_per_second:
+            return False
+
+        now = time.monotonic()
+        while self._request_times and now - self._request_times[0] >= 1.0:
+            self._request_times.popleft()
+        if len(self._request_times) >= self.rate_limit_per_second:
+            return True
+        self._request_times.append(now)
+        return False
+
+    def _paginate(self, payload: Dict[str, Any], list_key: str, key_field: str,
+                  headers: Dict[str, str], api_id: str) -> Dict[str, str]:
+        """
+        목록을 next-key 다음 항목부터 page_size건으로 자르고 연속조회 헤더를 반환합니다.
+
+        위치(offset) 대신 마지막 항목의 키를 이어받으므로, 페이지 사이에 체결로 목록이
+        바뀌어도 같은 항목이 두 번 전달되지 않습니다.
+        """
+        items = payload.get(list_key, [])
+        next_key = headers.get('next-key', '') if headers.get('cont-yn') == 'Y' else ''
+        if next_key:
+            if key_field == 'ord_no':
+                items = [item for item in items if item[key_field] < next_key]
+            else:
+                items = [item for item in items if item[key_field] > next_key]
+
+        payload[list_key] = items[:self.page_size]
+        if len(items) > self.page_size:
+            return {'api-id': api_id, 'cont-yn': 'Y', 'next-key': payload[list_key][-1][key_field]}
+        return {'api-id': api_id, 'cont-yn': 'N', 'next-key': ''}
+
+    @staticmethod
+    def _error(return_code: int, return_msg: str) -> Dict[str, Any]:
+        return {'return_code': return_code, 'return_msg': return_msg}
+
+    @staticmethod
+    def _ok(**fields) -> Dict[str, Any]:
+        return {'return_code': 0, 'return_msg': '정상적으로 처리되었습니다', **fields}
+
+    def _issue_token(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """au10001: 앱 키/시크릿이 있으면 토큰을 발급합니다."""
+        if body.get('grant_type') != 'client_credentials' or not body.get('appkey') or not body.get('secretkey'):
+            return self._error(self.RC_AUTH_FAILED, '앱 키 또는 시크릿 키가 올바르지 않습니다')
+
+        token = secrets.token_hex(32)
+        expires_at = datetime.now() + timedelta(hours=self.token_ttl_hours)
+        self.tokens[token] = expires_at
+        return self._ok(token=token, token_type='bearer', expires_dt=expires_at.strftime('%Y%m%d%H%M%S'))
+
+    def _is_valid_token(self, authorization: str) -> bool:
+        token = authorization[len('Bearer '):] if authorization.startswith('Bearer ') else ''
+        expires_at = self.tokens.get(token)
+        return expires_at is not None and datetime.now() < expires_at
+
+    # ---- 주문/체결 ----
+
+    def _place_order(self, api_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """kt10000/kt10001: 주문을 검증하고 접수합니다."""
+        stock_code = str(body.get('stk_cd', ''))
+        quantity = int(body.get('ord_qty') or 0)
+        is_market = body.get('trde_tp') == '3'
+        side = 'buy' if api_id == 'kt10000' else 'sell'
+
+        current_price = self.prices.get(stock_code)
+        if current_price is None:
+            return self._error(self.RC_UNKNOWN_STOCK, f'종목코드가 올바르지 않습니다: {stock_code}')
+        if quantity <= 0:
+            return self._error(-12, '주문수량을 확인하세요')
+
+        price = None if is_market else Decimal(str(body.get('ord_uv') or '0'))
+        if price is not None and price <= 0:
+            return self._error(-13, '주문단가를 확인하세요')
+
+        if side == 'buy':
+            required = (price or current_price) * quantity * (1 + self.commission_rate)
+            if required > self._orderable_cash():
+                return self._error(self.RC_INSUFFICIENT_CASH, '주문가능금액이 부족합니다')
+        elif quantity > self._sellable_quantity(stock_code):
+            return self._error(self.RC_INSUFFICIENT_QUANTITY, '매도가능수량이 부족합니다')
+
+        self._order_seq += 1
+        order_number = f"{self._order_seq:07d}"
+        received_at = time.perf_counter()
+        self.orders[order_number] = {
+            'order_number': order_number,
+            'api_id': api_id,
+            'side': side,
+            'stock_code': stock_code,
+            'is_market': is_market,
+            'price': price,
+            'quantity': quantity,
+            'executed_quantity': 0,
+            'executed_amount': Decimal('0'),
+            'order_time': datetime.now().strftime('%H%M%S'),
+            'received_at': received_at,
+            'next_fill_at': received_at + self.fill_delay,
+            'first_fill_at': None,
+            'filled_at': None,
+        }
+        return self._ok(ord_no=order_number, dmst_stex_tp=body.get('dmst_stex_tp', 'KRX'))
+
+    def _orderable_cash(self) -> Decimal:
+        """예수금에서 미체결 매수 주문 금액을 뺀 주문가능금액"""
+        reserved = Decimal('0')
+        for order in self.orders.values():
+            if order['side'] == 'buy' and order['filled_at'] is None:
+                remaining = order['quantity'] - order['executed_quantity']
+                price = order['price'] or self.prices.get(order['stock_code'], Decimal('0'))
+                reserved += price * remaining * (1 + self.commission_rate)
+        return self.cash - reserved
+
+    def _sellable_quantity(self, stock_code: str) -> int:
+        """보유 수량에서 미체결 매도 수량을 뺀 매도가능수량"""
+        held = self.holdings.get(stock_code, {}).get('quantity', 0)
+        pending = sum(
+            order['quantity'] - order['executed_quantity']
+            for order in self.orders.values()
+            if order['side'] == 'sell' and order['stock_code'] == stock_code and order['filled_at'] is None
+        )
+        return held - pending
+
+    def _match_loop(self):
+        """체결 시각이 된 주문을 주기적으로 체결합니다."""
+        while self._running.is_set():
+            with self._lock:
+                self._process_fills(time.perf_counter())
+            time.sleep(min(0.005, self.fill_delay or 0.005))
+
+    def _process_fills(self, now: float):
+        """체결 시각이 지난 미체결 주문을 (부분) 체결합니다."""
+        for order in self.orders.values():
+            while order['filled_at'] is None and order['next_fill_at'] <= now:
+                fill_price = self._fill_price(order)
+                if fill_price is None:
+                    order['next_fill_at'] = now + self.fill_delay
+                    break
+
+                chunk = math.ceil(order['quantity'] / self.partial_fills)
+                quantity = min(chunk, order['quantity'] - order['executed_quantity'])
+                self._apply_fill(order, quantity, fill_price, order['next_fill_at'])
+                order['next_fill_at'] += self.fill_delay
+
+    def _fill_price(self, order: Dict[str, Any]) -> Optional[Decimal]:
+        """주문이 지금 체결될 수 있으면 체결가를 반환합니다."""
+        current_price = self.prices.get(order['stock_code'])
+        if current_price is None:
+            return None
+        if order['is_market']:
+            return current_price
+        if order['side'] == 'buy' and current_price <= order['price']:
+            return order['price']
+        if order['side'] == 'sell' and current_price >= order['price']:
+            return order['price']
+        return None
+
+    def _apply_fill(self, order: Dict[str, Any], quantity: int, price: Decimal, filled_at: float):
+        """체결 결과를 주문, 예수금, 보유 종목에 반영합니다."""
+        amount = price * quantity
+        commission = amount * self.commission_rate
+        stock_code = order['stock_code']
+
+        if order['side'] == 'buy':
+            self.cash -= amount + commission
+            holding = self.holdings.setdefault(stock_code, {'quantity': 0, 'avg_price': Decimal('0')})
+            total_cost = holding['avg_price'] * holding['quantity'] + amount
+            holding['quantity'] += quantity
+            holding['avg_price'] = total_cost / holding['quantity']
+        else:
+            self.cash += amount - commission - amount * self.sell_tax_rate
+            holding = self.holdings[stock_code]
+            holding['quantity'] -= quantity
+            if holding['quantity'] <= 0:
+                del self.holdings[stock_code]
+
+        order['executed_quantity'] += quantity
+        order['executed_amount'] += amount
+        if order['first_fill_at'] is None:
+            order['first_fill_at'] = filled_at
+        if order['executed_quantity'] >= order['quantity']:
+            order['filled_at'] = filled_at
+
+        if self._fill_listeners:
+            message = {
+                'trnm': 'REAL',
+                'data': [{
+                    'type': REAL_TYPE_ORDER_EXECUTION,
+                    'name': '주문체결',
+                    'item': stock_code,
+                    'values': {
+                        '9203': order['order_number'],
+                        '9001': f"A{stock_code}",
+                        '913': '체결',
+                        '302': self.stock_names.get(stock_code, stock_code),
+                        '900': str(order['quantity']),
+                        '901': str(int(order['price'] or 0)),
+                        '902': str(order['quantity'] - order['executed_quantity']),
+                        '903': str(int(order['executed_amount'])),
+                        '905': '+매수' if order['side'] == 'buy' else '-매도',
+                        '908': datetime.now().strftime('%H%M%S'),
+                        '910': str(int(price)),
+                        '911': str(quantity),
+                    },
+                }],
+            }
+            for listener in self._fill_listeners:
+                try:
+                    listener(message)
+                except Exception as e:
+                    logger.error(f"시뮬레이터 체결 알림 처리 중 오류: {e}")
+
+    # ---- 조회 TR ----
+
+    def _balance(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """ka01690: 예수금과 종목별 잔고"""
+        items = []
+        total_buy = Decimal('0')
+        total_eval = Decimal('0')
+        for stock_code, holding in sorted(self.holdings.items()):
+            current_price = self.prices.get(stock_code, holding['avg_price'])
+            buy_amount = holding['avg_price'] * holding['quantity']
+            eval_amount = current_price * holding['quantity']
+            total_buy += buy_amount
+            total_eval += eval_amount
+            items.append({
+                'stk_cd': stock_code,
+                'stk_nm': self.stock_names.get(stock_code, stock_code),
+                'rmnd_qty': str(holding['quantity']),
+                'buy_uv': str(int(holding['avg_price'])),
+                'cur_prc': str(int(current_price)),
+                'evlt_amt': str(int(eval_amount)),
+                'evltv_prft': str(int(eval_amount - buy_amount)),
+                'prft_rt': f"{(eval_amount - buy_amount) / buy_amount * 100:.2f}" if buy_amount else '0.00',
+            })
+
+        return self._ok(
+            dt=body.get('qry_dt', ''),
+            dbst_bal=str(int(self.cash)),
+            tot_buy_amt=str(int(total_buy)),
+            tot_evlt_amt=str(int(total_eval)),
+            day_stk_asst=str(int(self.cash + total_eval)),
+            day_bal_rt=items,
+        )
+
+    def _order_item(self, order: Dict[str, Any]) -> Dict[str, Any]:
+        """주문 정보를 체결/미체결 TR 항목 형식으로 변환합니다."""
+        executed = order['executed_quantity']
+        return {
+            'ord_no': order['order_number'],
+            'stk_cd': order['stock_code'],
+            'stk_nm': self.stock_names.get(order['stock_code'], order['stock_code']),
+            'io_tp_nm': '+매수' if order['side'] == 'buy' else '-매도',
+            'ord_pric': str(int(order['price'] or 0)),
+            'ord_qty': str(order['quantity']),
+            'cntr_pric': str(int(order['executed_amount'] / executed)) if executed else '0',
+            'cntr_qty': str(executed),
+            'oso_qty': str(order['quantity'] - executed),
+            'ord_stt': '체결' if order['filled_at'] is not None else '접수',
+            'trde_tp': '시장가' if order['is_market'] else '보통',
+        }
+
+    def _matching_orders(self, stock_code: str, order_number: str = '') -> List[Dict[str, Any]]:
+        """종목코드/주문번호 조건에 맞는 주문을 최근 주문부터 반환합니다."""
+        return [
+            order for order in reversed(self.orders.values())
+            if (not stock_code or order['stock_code'] == stock_code)
+            and (not order_number or order['order_number'] == order_number)
+        ]
+
+    def _executions(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """ka10076: 체결된 수량이 있는 주문"""
+        items = []
+        for order in self._matching_orders(body.get('stk_cd', ''), body.get('ord_no', '')):
+            if order['executed_quantity'] > 0:
+                items.append({**self._order_item(order), 'ord_tm': order['order_time']})
+        return self._ok(cntr=items)
+
+    def _pending_orders(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """ka10075: 미체결 수량이 남은 주문"""
+        items = []
+        for order in self._matching_orders(body.get('stk_cd', '')):
+            if order['filled_at'] is None:
+                current_price = self.prices.get(order['stock_code'], Decimal('0'))
+                items.append({**self._order_item(order), 'tm': order['order_time'], 'cur_prc': str(int(current_price))})
+        return self._ok(oso=items)
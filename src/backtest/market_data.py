@@ -0,0 +1,188 @@
+"""
+백테스트용 일봉 저장소
+
+이 모듈은 종목/지수/시가총액 일봉을 종목별 NumPy 배열로 변환해 보관합니다.
+백테스트는 하루에도 여러 번 시세를 조회하므로, pandas 슬라이싱 대신
+(거래일 -> 행 위치) 색인과 배열 조회로 가격을 바로 꺼냅니다.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+from loguru import logger
+
+
+def to_date_int(date_str: str) -> int:
+    """YYYYMMDD(또는 YYYY-MM-DD) 문자열을 정수 날짜로 변환합니다."""
+    return int(str(date_str).replace('-', '').strip()[:8])
+
+
+def shift_date_int(date_int: int, days: int) -> int:
+    """정수 날짜를 days일 만큼 이동합니다."""
+    shifted = datetime.strptime(str(date_int), "%Y%m%d") + timedelta(days=days)
+    return int(shifted.strftime("%Y%m%d"))
+
+
+class BarSeries:
+    """한 종목(또는 지수)의 일봉을 배열로 보관하는 클래스"""
+
+    def __init__(self, dates: np.ndarray, open_: np.ndarray, high: np.ndarray, low: np.ndarray,
+                 close: np.ndarray, volume: np.ndarray):
+        """
+        일봉 배열을 초기화합니다. (모든 배열은 날짜 오름차순)
+
+        Args:
+            dates (np.ndarray): 정수 날짜 (YYYYMMDD)
+            open_, high, low, close, volume (np.ndarray): 시가, 고가, 저가, 종가, 거래량
+        """
+        self.dates = dates
+        self.open = open_
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self._rows = {int(date): row for row, date in enumerate(dates)}
+        self._close_cumsum = np.concatenate(([0.0], np.cumsum(close)))
+
+    @classmethod
+    def from_dataframe(cls, df) -> Optional['BarSeries']:
+        """
+        pykrx 일봉 DataFrame을 변환합니다. (거래정지일 - 시가 0 - 제외)
+
+        Args:
+            df (pd.DataFrame): 날짜 인덱스와 '시가', '고가', '저가', '종가', '거래량' 컬럼
+
+        Returns:
+            Optional[BarSeries]: 일봉 배열 (데이터가 없으면 None)
+        """
+        if df is None or df.empty:
+            return None
+
+        if '시가' in df.columns:
+            df = df[df['시가'] != 0]
+            if df.empty:
+                return None
+
+        dates = np.asarray(df.index.strftime('%Y%m%d'), dtype=np.int64)
+
+        def column(name: str) -> np.ndarray:
+            if name in df.columns:
+                return df[name].to_numpy(dtype=float)
+            return df['종가'].to_numpy(dtype=float) if name != '거래량' else np.zeros(len(df))
+
+        return cls(dates, column('시가'), column('고가'), column('저가'), column('종가'), column('거래량'))
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def row(self, date: int) -> Optional[int]:
+        """거래일의 행 위치를 반환합니다. (거래가 없던 날이면 None)"""
+        return self._rows.get(date)
+
+    def position(self, date: int) -> int:
+        """date 이하인 마지막 거래일 다음 위치(= date까지의 행 수)를 반환합니다."""
+        return int(np.searchsorted(self.dates, date, side='right'))
+
+    def last_close(self, date: int) -> Optional[float]:
+        """date 이하인 마지막 거래일의 종가를 반환합니다."""
+        position = self.position(date)
+        return float(self.close[position - 1]) if position else None
+
+    def close_mean(self, start: int, end: int) -> float:
+        """[start, end) 행 구간의 종가 평균을 반환합니다. (누적합 사용)"""
+        if end <= start:
+            return float('nan')
+        return float((self._close_cumsum[end] - self._close_cumsum[start]) / (end - start))
+
+
+class BarStore:
+    """백테스트에 필요한 종목/지수/시가총액 일봉을 보관하는 클래스"""
+
+    def __init__(self):
+        """빈 일봉 저장소를 초기화합니다."""
+        self.stocks: Dict[str, BarSeries] = {}
+        self.indexes: Dict[str, BarSeries] = {}
+        self.market_caps: Dict[str, BarSeries] = {}  # 종가 배열에 시가총액(원)을 보관
+        self._calendar: Optional[np.ndarray] = None
+
+    def add_stock(self, stock_code: str, df):
+        """종목 일봉을 추가합니다."""
+        series = BarSeries.from_dataframe(df)
+        if series is not None:
+            self.stocks[stock_code] = series
+            self._calendar = None
+
+    def add_index(self, market_type: str, df):
+        """시장지수 일봉을 추가합니다."""
+        series = BarSeries.from_dataframe(df)
+        if series is not None:
+            self.indexes[market_type] = series
+            self._calendar = None
+
+    def add_market_cap(self, stock_code: str, df):
+        """시가총액 이력을 추가합니다. (pykrx get_market_cap_by_date 결과)"""
+        if df is None or df.empty or '시가총액' not in df.columns:
+            return
+        dates = np.asarray(df.index.strftime('%Y%m%d'), dtype=np.int64)
+        caps = df['시가총액'].to_numpy(dtype=float)
+        self.market_caps[stock_code] = BarSeries(dates, caps, caps, caps, caps, np.zeros(len(caps)))
+
+    def calendar(self) -> np.ndarray:
+        """
+        거래일 목록을 반환합니다. (지수 일봉 기준, 지수가 없으면 종목 일봉 전체)
+
+        Returns:
+            np.ndarray: 정수 날짜 오름차순
+        """
+        if self._calendar is None:
+            sources = list(self.indexes.values()) or list(self.stocks.values())
+            if sources:
+                self._calendar = np.unique(np.concatenate([series.dates for series in sources]))
+            else:
+                self._calendar = np.array([], dtype=np.int64)
+        return self._calendar
+
+    def market_cap_eok(self, stock_code: str, date: int) -> Optional[int]:
+        """date 이하 마지막 거래일의 시가총액을 억원 단위로 반환합니다."""
+        series = self.market_caps.get(stock_code)
+        if series is None:
+            return None
+        cap = series.last_close(date)
+        return int(cap / 100000000) if cap is not None else None
+
+    @classmethod
+    def load(cls, stock_codes: Iterable[str], market_types: Iterable[str], start_date: str, end_date: str,
+             pykrx_client=None) -> 'BarStore':
+        """
+        pykrx(시세 캐시 사용)에서 백테스트 기간의 일봉을 불러옵니다.
+
+        Args:
+            stock_codes (Iterable[str]): 종목코드 목록
+            market_types (Iterable[str]): 시장구분 목록 (예: 'KOSPI', 'KOSDAQ')
+            start_date (str): 시작일 (YYYYMMDD, 지표 계산 기간 포함)
+            end_date (str): 종료일 (YYYYMMDD)
+            pykrx_client: PykrxStockDataClient (None이면 새로 생성)
+
+        Returns:
+            BarStore: 일봉 저장소
+        """
+        if pykrx_client is None:
+            from src.utils.stock_analyzer import PykrxStockDataClient
+            pykrx_client = PykrxStockDataClient()
+
+        store = cls()
+        codes: List[str] = list(dict.fromkeys(stock_codes))
+
+        for market_type in dict.fromkeys(market_types):
+            store.add_index(market_type, pykrx_client.get_market_index(
+                market_type, start_date, end_date, retry_with_prev_day=False))
+
+        for i, stock_code in enumerate(codes, 1):
+            store.add_stock(stock_code, pykrx_client.get_stock_ohlcv(
+                stock_code, start_date, end_date, retry_with_prev_day=False))
+            store.add_market_cap(stock_code, pykrx_client.get_market_cap_history(stock_code, start_date, end_date))
+            if i % 50 == 0:
+                logger.info(f"백테스트 일봉 로드 중: {i}/{len(codes)}개 종목")
+
+        logger.info(f"백테스트 일봉 로드 완료: 종목 {len(store.stocks)}개, 지수 {len(store.indexes)}개")
+        return store
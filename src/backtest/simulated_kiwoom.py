@@ -0,0 +1,316 @@
+"""
+백테스트용 모의 키움증권 클라이언트
+
+이 모듈은 KiwoomAPIClient와 같은 메서드와 반환 형식을 제공하면서, 실제 API 대신
+과거 일봉에 맞춰 잔고와 주문 체결을 계산합니다. 기존 OrderManager, PositionManager,
+TradingStrategy를 수정 없이 이 클라이언트에 연결하여 과거 구간을 재생할 수 있습니다.
+
+체결 규칙:
+- 시장가 주문: 현재 시뮬레이션 가격(시가 또는 종가)으로 즉시 전량 체결
+- 지정가 매도: 시가가 주문가 이상이면 시가, 장중 고가가 주문가 이상이면 주문가로 전량 체결
+- 지정가 매수: 시가가 주문가 이하이면 시가, 장중 저가가 주문가 이하이면 주문가로 전량 체결
+- 같은 종목에 새 매도 주문이 들어오면 기존 미체결 매도 주문은 정정(대체)된 것으로 처리
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from src.backtest.market_data import BarStore
+
+
+class SimulatedKiwoomClient:
+    """과거 일봉으로 주문을 체결하는 모의 키움증권 클라이언트"""
+
+    def __init__(self, bars: BarStore, initial_cash: Decimal = Decimal('10000000'),
+                 commission_rate: Decimal = Decimal('0.00018'), sell_tax_rate: Decimal = Decimal('0.0015')):
+        """
+        모의 클라이언트를 초기화합니다.
+
+        Args:
+            bars (BarStore): 일봉 저장소
+            initial_cash (Decimal): 초기 예수금
+            commission_rate (Decimal): 매수/매도 수수료율
+            sell_tax_rate (Decimal): 매도 시 거래세율
+        """
+        self.bars = bars
+        self.commission_rate = commission_rate
+        self.sell_tax_rate = sell_tax_rate
+        self.cash = Decimal(initial_cash)
+        self.is_authenticated = True
+
+        self.holdings: Dict[str, Dict[str, Any]] = {}  # 종목코드 -> {'quantity', 'avg_price'}
+        self.orders: Dict[str, Dict[str, Any]] = {}  # 주문번호 -> 주문 정보
+        self.stock_names: Dict[str, str] = {}
+        self.fills: List[Dict[str, Any]] = []  # 아직 엔진이 가져가지 않은 체결 내역
+        self._order_seq = 0
+
+        self.now: Optional[datetime] = None
+        self.date: int = 0
+        self.price_field = 'close'
+
+    # ---- 시뮬레이션 제어 ----
+
+    def set_time(self, now: datetime, price_field: str):
+        """
+        시뮬레이션 시각과 현재가로 사용할 가격을 설정합니다.
+
+        Args:
+            now (datetime): 시뮬레이션 시각
+            price_field (str): 현재가로 사용할 일봉 가격 ('open' 또는 'close')
+        """
+        self.now = now
+        self.date = int(now.strftime('%Y%m%d'))
+        self.price_field = price_field
+
+    def _bar_value(self, stock_code: str, field: str) -> Optional[Decimal]:
+        """오늘 일봉 값을 반환합니다. (오늘 거래가 없으면 None)"""
+        series = self.bars.stocks.get(stock_code)
+        row = series.row(self.date) if series is not None else None
+        if row is None:
+            return None
+        return Decimal(str(getattr(series, field)[row]))
+
+    def _market_price(self, stock_code: str) -> Optional[Decimal]:
+        """현재 시뮬레이션 가격을 반환합니다. (오늘 거래가 없으면 마지막 종가)"""
+        price = self._bar_value(stock_code, self.price_field)
+        if price is not None:
+            return price
+
+        series = self.bars.stocks.get(stock_code)
+        last_close = series.last_close(self.date) if series is not None else None
+        return Decimal(str(last_close)) if last_close is not None else None
+
+    def match_limit_orders(self):
+        """오늘 일봉으로 미체결 지정가 주문의 체결 여부를 판정합니다."""
+        for order in list(self.orders.values()):
+            if order['unexecuted_quantity'] <= 0 or order['trade_type'] != '보통':
+                continue
+
+            open_price = self._bar_value(order['stock_code'], 'open')
+            if open_price is None:
+                continue  # 거래정지 등으로 오늘 거래 없음
+
+            limit_price = order['order_price']
+            if order['side'] == 'sell':
+                if open_price >= limit_price:
+                    self._fill(order, open_price)
+                elif self._bar_value(order['stock_code'], 'high') >= limit_price:
+                    self._fill(order, limit_price)
+            else:
+                if open_price <= limit_price:
+                    self._fill(order, open_price)
+                elif self._bar_value(order['stock_code'], 'low') <= limit_price:
+                    self._fill(order, limit_price)
+
+    def drain_fills(self) -> List[Dict[str, Any]]:
+        """마지막 호출 이후의 체결 내역을 반환하고 비웁니다."""
+        fills, self.fills = self.fills, []
+        return fills
+
+    def equity(self) -> Decimal:
+        """예수금과 보유 종목 평가금액의 합을 반환합니다."""
+        total = self.cash
+        for stock_code, holding in self.holdings.items():
+            price = self._market_price(stock_code) or holding['avg_price']
+            total += price * holding['quantity']
+        return total
+
+    def _fill(self, order: Dict[str, Any], price: Decimal):
+        """주문을 전량 체결하고 예수금과 보유 수량을 갱신합니다."""
+        stock_code = order['stock_code']
+        quantity = order['unexecuted_quantity']
+        amount = price * quantity
+        commission = amount * self.commission_rate
+
+        if order['side'] == 'buy':
+            holding = self.holdings.setdefault(stock_code, {'quantity': 0, 'avg_price': Decimal('0')})
+            total_cost = holding['avg_price'] * holding['quantity'] + amount
+            holding['quantity'] += quantity
+            holding['avg_price'] = total_cost / holding['quantity']
+            self.cash -= amount + commission
+            tax = Decimal('0')
+        else:
+            holding = self.holdings.get(stock_code)
+            quantity = min(quantity, holding['quantity']) if holding else 0
+            if quantity <= 0:
+                order['unexecuted_quantity'] = 0
+                order['order_status'] = '취소'
+                return
+            amount = price * quantity
+            commission = amount * self.commission_rate
+            tax = amount * self.sell_tax_rate
+            holding['quantity'] -= quantity
+            self.cash += amount - commission - tax
+            if holding['quantity'] == 0:
+                del self.holdings[stock_code]
+                self._cancel_orders(stock_code, 'sell')
+
+        order['executed_quantity'] += quantity
+        order['unexecuted_quantity'] -= quantity
+        order['executed_price'] = price
+        order['order_status'] = '체결'
+
+        self.fills.append({
+            'order_number': order['order_number'],
+            'stock_code': stock_code,
+            'side': order['side'],
+            'trade_type': order['trade_type'],
+            'quantity': quantity,
+            'price': price,
+            'commission': commission,
+            'tax': tax,
+            'date': self.date,
+            'time': self.now
+        })
+
+    def _cancel_orders(self, stock_code: str, side: str):
+        """종목의 미체결 주문을 취소합니다."""
+        for order in self.orders.values():
+            if order['stock_code'] == stock_code and order['side'] == side and order['unexecuted_quantity'] > 0:
+                order['unexecuted_quantity'] = 0
+                order['order_status'] = '취소'
+
+    # ---- KiwoomAPIClient 인터페이스 ----
+
+    def authenticate(self) -> bool:
+        """모의 클라이언트는 항상 인증된 상태입니다."""
+        return True
+
+    def get_balance(self) -> Optional[Dict[str, Any]]:
+        """예수금과 평가금액을 반환합니다. (KiwoomAPIClient.get_balance와 같은 형식)"""
+        total_buy = sum((h['avg_price'] * h['quantity'] for h in self.holdings.values()), Decimal('0'))
+        total_eval = self.equity() - self.cash
+        return {
+            'deposit': self.cash,
+            'total_buy_amount': total_buy,
+            'total_eval_amount': total_eval,
+            'estimated_asset': self.cash + total_eval,
+            'available_amount': self.cash
+        }
+
+    def get_positions(self) -> Optional[list]:
+        """보유 종목을 반환합니다. (KiwoomAPIClient.get_positions와 같은 형식)"""
+        positions = []
+        for stock_code, holding in self.holdings.items():
+            current_price = self._market_price(stock_code) or holding['avg_price']
+            eval_amount = current_price * holding['quantity']
+            profit_loss = eval_amount - holding['avg_price'] * holding['quantity']
+            profit_rate = (current_price - holding['avg_price']) / holding['avg_price'] * 100
+            positions.append({
+                'stock_code': stock_code,
+                'stock_name': self.stock_names.get(stock_code, stock_code),
+                'quantity': holding['quantity'],
+                'avg_price': holding['avg_price'],
+                'current_price': current_price,
+                'eval_amount': eval_amount,
+                'profit_loss': profit_loss,
+                'profit_rate': profit_rate
+            })
+        return positions
+
+    def get_current_price(self, stock_code: str) -> Optional[Dict[str, Any]]:
+        """현재 시뮬레이션 가격을 반환합니다."""
+        price = self._market_price(stock_code)
+        return {'current_price': price} if price is not None else None
+
+    def place_order(self, stock_code: str, order_type: str, quantity: int,
+                    price: Optional[Decimal] = None) -> Optional[Dict[str, Any]]:
+        """
+        주문을 접수합니다. 시장가 주문은 즉시 체결됩니다.
+
+        Args:
+            stock_code: 종목코드 (6자리)
+            order_type: 주문유형 ('buy_market', 'buy_limit', 'sell_market', 'sell_limit')
+            quantity: 주문수량
+            price: 주문가격 (지정가인 경우 필수)
+
+        Returns:
+            Optional[Dict]: 주문 결과 (거래가 없는 종목, 잔고 부족 등 실패 시 None)
+        """
+        if quantity <= 0 or order_type not in ['buy_market', 'buy_limit', 'sell_market', 'sell_limit']:
+            return None
+        if order_type.endswith('limit') and not price:
+            return None
+
+        side = 'buy' if order_type.startswith('buy') else 'sell'
+        is_market = order_type.endswith('market')
+
+        if self._bar_value(stock_code, 'open') is None:
+            return None  # 오늘 거래가 없는 종목 (거래정지 등)
+
+        if side == 'buy':
+            order_price = self._market_price(stock_code) if is_market else Decimal(price)
+            required = order_price * quantity * (Decimal('1') + self.commission_rate)
+            if required > self.cash:
+                return None  # 주문가능금액 부족
+        else:
+            if stock_code not in self.holdings:
+                return None  # 매도 가능 수량 없음
+            self._cancel_orders(stock_code, 'sell')
+
+        self._order_seq += 1
+        order_number = f"{self._order_seq:07d}"
+        order = {
+            'order_number': order_number,
+            'stock_code': stock_code,
+            'side': side,
+            'trade_type': '시장가' if is_market else '보통',
+            'order_price': Decimal('0') if is_market else Decimal(price),
+            'order_quantity': quantity,
+            'executed_price': Decimal('0'),
+            'executed_quantity': 0,
+            'unexecuted_quantity': quantity,
+            'order_status': '접수',
+            'order_time': self.now.strftime('%H%M%S') if self.now else ''
+        }
+        self.orders[order_number] = order
+
+        if is_market:
+            self._fill(order, self._market_price(stock_code))
+
+        return {
+            'order_number': order_number,
+            'exchange': 'KRX',
+            'order_time': order['order_time']
+        }
+
+    def _to_api_order(self, order: Dict[str, Any]) -> Dict[str, Any]:
+        """내부 주문 정보를 KiwoomAPIClient 조회 결과 형식으로 변환합니다."""
+        return {
+            'order_number': order['order_number'],
+            'stock_code': order['stock_code'],
+            'stock_name': self.stock_names.get(order['stock_code'], order['stock_code']),
+            'order_type': '+매수' if order['side'] == 'buy' else '-매도',
+            'order_price': order['order_price'],
+            'order_quantity': order['order_quantity'],
+            'executed_price': order['executed_price'],
+            'executed_quantity': order['executed_quantity'],
+            'unexecuted_quantity': order['unexecuted_quantity'],
+            'order_status': order['order_status'],
+            'order_time': order['order_time'],
+            'trade_type': order['trade_type']
+        }
+
+    def get_order_status(self, stock_code: Optional[str] = None, order_number: Optional[str] = None) -> Optional[list]:
+        """체결 내역을 반환합니다. (KiwoomAPIClient.get_order_status와 같은 형식)"""
+        return [
+            self._to_api_order(order) for order in self.orders.values()
+            if (not stock_code or order['stock_code'] == stock_code)
+            and (not order_number or order['order_number'] == order_number)
+            and order['executed_quantity'] > 0
+        ]
+
+    def get_pending_orders(self, stock_code: Optional[str] = None) -> Optional[list]:
+        """미체결 내역을 반환합니다. (KiwoomAPIClient.get_pending_orders와 같은 형식)"""
+        return [
+            self._to_api_order(order) for order in self.orders.values()
+            if (not stock_code or order['stock_code'] == stock_code) and order['unexecuted_quantity'] > 0
+        ]
+
+    def has_pending_orders(self, stock_code: str) -> bool:
+        """종목의 미체결 주문 존재 여부를 반환합니다."""
+        return any(
+            order['stock_code'] == stock_code and order['unexecuted_quantity'] > 0
+            for order in self.orders.values()
+        )
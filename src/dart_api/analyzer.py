@@ -5,19 +5,65 @@ DART 보고서 분석 모듈
 """
 
 import re
-from typing import Dict, List, Optional
-from bs4 import BeautifulSoup
+from typing import Dict, List, Optional, Pattern, Tuple
+from bs4 import BeautifulSoup, Tag
 from loguru import logger
 
-from config.settings import REQUIRED_FIELDS
+from config.settings import REQUIRED_FIELDS, DART_API_CONFIG
 from src.utils.error_handler import get_error_handler
 
+# lxml 파서 사용 가능 여부 확인 (선택적 의존성)
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# 지원하는 파서 엔진 (BeautifulSoup 백엔드 이름)
+SUPPORTED_PARSER_ENGINES = ('lxml', 'html.parser')
+
+
+def resolve_parser_engine(parser_engine: Optional[str] = None) -> str:
+    """
+    사용할 HTML 파서 엔진을 결정합니다.
+    
+    Args:
+        parser_engine (Optional[str]): 'auto', 'lxml', 'html.parser' (None이면 설정값 사용)
+        
+    Returns:
+        str: 실제 사용할 파서 엔진 이름 (lxml 미설치 시 html.parser)
+    """
+    requested = (parser_engine or DART_API_CONFIG.get('parser_engine', 'auto')).lower()
+    
+    if requested not in SUPPORTED_PARSER_ENGINES and requested != 'auto':
+        logger.warning(f"지원하지 않는 파서 엔진 '{requested}', 자동 선택으로 대체합니다.")
+        requested = 'auto'
+    
+    if requested in ('auto', 'lxml'):
+        if LXML_AVAILABLE:
+            return 'lxml'
+        if requested == 'lxml':
+            logger.warning("lxml이 설치되어 있지 않아 html.parser를 사용합니다.")
+    
+    return 'html.parser'
+
+
+def _has_visible_text(text) -> bool:
+    """공백이 아닌 텍스트 노드인지 확인합니다."""
+    return bool(text and text.strip())
+
 
 class ReportAnalyzer:
     """보고서 내용을 분석하여 필요한 데이터를 추출하는 클래스"""
     
-    def __init__(self):
-        """보고서 분석기를 초기화합니다."""
+    def __init__(self, parser_engine: Optional[str] = None):
+        """
+        보고서 분석기를 초기화합니다.
+        
+        Args:
+            parser_engine (Optional[str]): HTML 파서 엔진 ('auto', 'lxml', 'html.parser')
+        """
+        self.parser_engine = resolve_parser_engine(parser_engine)
         self.header_patterns = {
             '판매ㆍ공급계약 내용': [
                 r'1\.\s*판매ㆍ공급계약\s*내용',
@@ -63,7 +109,13 @@ class ReportAnalyzer:
             ]
         }
         
-        logger.info("보고서 분석기가 초기화되었습니다.")
+        # 정규식 패턴 사전 컴파일 (보고서마다 반복 컴파일하지 않도록)
+        self.compiled_patterns = {
+            field_name: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for field_name, patterns in self.header_patterns.items()
+        }
+        
+        logger.info(f"보고서 분석기가 초기화되었습니다. (파서: {self.parser_engine})")
     
     def analyze_report(self, html_content: str, rcept_no: str = None) -> Dict[str, Optional[str]]:
         """
@@ -125,10 +177,10 @@ class ReportAnalyzer:
             # 2단계: 핵심 로직 실행
             logger.debug(f"보고서 분석 시작: {len(html_content):,} 문자")
             
-            # BeautifulSoup으로 HTML 파싱
+            # BeautifulSoup으로 HTML 파싱 (첫 번째 텍스트 노드만 확인하여 빈 문서 판별)
             try:
-                soup = BeautifulSoup(html_content, 'html.parser')
-                if not soup or not soup.get_text(strip=True):
+                soup = BeautifulSoup(html_content, self.parser_engine)
+                if not soup or soup.find(string=_has_visible_text) is None:
                     raise ValueError("HTML 파싱 결과가 비어있음")
             except Exception as parse_error:
                 if error_handler:
@@ -138,18 +190,24 @@ class ReportAnalyzer:
                         operation="analyze_report_parse",
                         severity="ERROR",
                         related_stock=f"접수번호:{rcept_no}" if rcept_no else "알 수 없음",
-                        additional_context={"content_preview": html_content[:200]}
+                        additional_context={
+                            "content_preview": html_content[:200],
+                            "parser_engine": self.parser_engine
+                        }
                     )
                 logger.error(f"HTML 파싱 실패: {parse_error}")
                 return {}
             
+            # 문서를 한 번만 순회하여 표 행(tr) 인덱스 생성
+            table_rows = self._build_table_index(soup)
+            
             # 각 필드별로 데이터 추출
             extracted_data = {}
-            extraction_stats = {"success": 0, "failed": 0, "total": len(self.header_patterns)}
+            extraction_stats = {"success": 0, "failed": 0, "total": len(self.compiled_patterns)}
             
-            for field_name, patterns in self.header_patterns.items():
+            for field_name, patterns in self.compiled_patterns.items():
                 try:
-                    value = self._find_value_with_fallbacks(soup, patterns)
+                    value = self._find_value_with_fallbacks(table_rows, patterns)
                     extracted_data[field_name] = value
                     
                     if value and value.strip():
@@ -235,74 +293,63 @@ class ReportAnalyzer:
             logger.error(f"보고서 분석 중 예상치 못한 오류: {e}")
             return {}
     
-    def _find_value_with_fallbacks(self, soup: BeautifulSoup, patterns: List[str]) -> Optional[str]:
+    def _build_table_index(self, soup: BeautifulSoup) -> List[List[Tuple[str, Tag]]]:
         """
-        여러 패턴을 시도하여 가장 먼저 찾아지는 유효한 값을 반환합니다.
+        문서의 모든 표 행(tr)을 한 번 순회하여 셀 텍스트 인덱스를 생성합니다.
         
         Args:
             soup (BeautifulSoup): 파싱된 HTML 객체
-            patterns (List[str]): 검색할 패턴 목록
+            
+        Returns:
+            List[List[Tuple[str, Tag]]]: 행별 (셀 텍스트, 셀 태그) 목록 (문서 순서)
+        """
+        table_rows = []
+        for row in soup.find_all('tr'):
+            # 행의 직접 자식 셀만 사용 (중첩 표의 셀은 중첩 표의 행에서 따로 인덱싱됨)
+            cells = [(cell.get_text(), cell) for cell in row.find_all('td', recursive=False)]
+            if len(cells) >= 2:  # 헤더와 값이 모두 있는 행만 대상
+                table_rows.append(cells)
+        return table_rows
+    
+    def _find_value_with_fallbacks(self, table_rows: List[List[Tuple[str, Tag]]],
+                                   patterns: List[Pattern]) -> Optional[str]:
+        """
+        여러 패턴을 시도하여 가장 먼저 찾아지는 유효한 값을 반환합니다.
+        
+        Args:
+            table_rows (List[List[Tuple[str, Tag]]]): 표 행 인덱스
+            patterns (List[Pattern]): 검색할 정규식 패턴 목록 (우선순위 순)
             
         Returns:
             Optional[str]: 찾은 값 (없으면 None)
         """
         for pattern in patterns:
-            value = self._find_value_by_header(soup, pattern)
+            value = self._find_value_by_header(table_rows, pattern)
             if value and value.strip() != '-' and value.strip() != '':
                 return value.strip()
         return None
     
-    def _find_value_by_header(self, soup: BeautifulSoup, header_pattern: str) -> Optional[str]:
+    def _find_value_by_header(self, table_rows: List[List[Tuple[str, Tag]]], pattern: Pattern) -> Optional[str]:
         """
-        특정 헤더 패턴을 찾아 그 옆 셀의 값을 반환합니다.
+        헤더 패턴과 일치하는 첫 번째 셀을 찾아 같은 행의 다음 셀 값을 반환합니다.
         
         Args:
-            soup (BeautifulSoup): 파싱된 HTML 객체
-            header_pattern (str): 검색할 헤더 패턴 (정규식)
+            table_rows (List[List[Tuple[str, Tag]]]): 표 행 인덱스
+            pattern (Pattern): 검색할 헤더 패턴 (컴파일된 정규식)
             
         Returns:
             Optional[str]: 찾은 값 (없으면 None)
         """
         try:
-            # 정규식 패턴으로 헤더 찾기
-            pattern = re.compile(header_pattern, re.IGNORECASE)
-            
-            # span 또는 td 태그에서 패턴 매칭
-            header_tag = soup.find(['span', 'td', 'p', 'div'], string=pattern)
-            
-            if not header_tag:
-                # 텍스트가 정확히 매칭되지 않는 경우, 부분 매칭 시도
-                all_tags = soup.find_all(['span', 'td', 'p', 'div'])
-                for tag in all_tags:
-                    if tag.get_text() and pattern.search(tag.get_text()):
-                        header_tag = tag
-                        break
-            
-            if not header_tag:
-                return None
-            
-            # 헤더 태그의 부모 td에서 다음 형제 td 찾기
-            parent_td = header_tag.find_parent('td')
-            if parent_td:
-                next_td = parent_td.find_next_sibling('td')
-                if next_td:
-                    return next_td.get_text(strip=True)
-            
-            # 테이블 구조가 다른 경우, 다른 방법으로 시도
-            # 같은 행(tr)에서 다음 셀 찾기
-            parent_tr = header_tag.find_parent('tr')
-            if parent_tr:
-                all_tds = parent_tr.find_all('td')
-                for i, td in enumerate(all_tds):
-                    if pattern.search(td.get_text()):
-                        # 다음 td가 있으면 그 값을 반환
-                        if i + 1 < len(all_tds):
-                            return all_tds[i + 1].get_text(strip=True)
-            
+            for cells in table_rows:
+                # 마지막 셀은 다음 셀이 없으므로 헤더 후보에서 제외
+                for i in range(len(cells) - 1):
+                    if pattern.search(cells[i][0]):
+                        return cells[i + 1][1].get_text(strip=True)
             return None
             
         except Exception as e:
-            logger.debug(f"헤더 패턴 '{header_pattern}' 검색 중 오류: {e}")
+            logger.debug(f"헤더 패턴 '{pattern.pattern}' 검색 중 오류: {e}")
             return None
     
     def validate_extracted_data(self, data: Dict[str, Optional[str]]) -> bool:
@@ -0,0 +1,138 @@
+"""
+DART 공시 대량 재처리(백필) 파이프라인
+
+이 모듈은 과거 공시를 대량으로 처리할 때 보고서 다운로드는 스레드 풀(I/O)에서,
+HTML 파싱과 데이터 추출은 프로세스 풀(CPU)에서 수행하여 코어 수에 비례해
+처리량이 늘어나도록 합니다. 결과는 입력 순서대로 반환됩니다.
+"""
+
+import os
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+from loguru import logger
+
+from config.settings import DART_API_CONFIG
+from src.dart_api.analyzer import ReportAnalyzer
+
+# 작업 프로세스별 보고서 분석기 (프로세스 초기화 시 한 번 생성)
+_worker_analyzer: Optional[ReportAnalyzer] = None
+
+
+def _init_parse_worker(parser_engine: Optional[str]):
+    """파싱 작업 프로세스를 초기화합니다. (spawn으로 시작되어 부모의 오류 처리기/시트 클라이언트를 물려받지 않음)"""
+    global _worker_analyzer
+    _worker_analyzer = ReportAnalyzer(parser_engine=parser_engine)
+
+
+def _analyze_in_worker(rcept_no: str, report_content: str) -> Dict[str, Optional[str]]:
+    """
+    작업 프로세스에서 보고서를 분석하고 정제된 데이터를 반환합니다.
+
+    Args:
+        rcept_no (str): 공시 접수번호
+        report_content (str): 보고서 HTML/XML 내용
+
+    Returns:
+        Dict[str, Optional[str]]: 정제된 추출 데이터
+    """
+    extracted_data = _worker_analyzer.analyze_report(report_content, rcept_no)
+    return _worker_analyzer.clean_extracted_data(extracted_data)
+
+
+class ReportBackfillPipeline:
+    """다운로드(스레드 풀)와 분석(프로세스 풀)을 연결한 백필 파이프라인 클래스"""
+
+    def __init__(self, dart_client, download_workers: Optional[int] = None,
+                 parse_workers: Optional[int] = None, window_size: Optional[int] = None,
+                 parser_engine: Optional[str] = None):
+        """
+        백필 파이프라인을 초기화합니다.
+
+        Args:
+            dart_client: DART API 클라이언트 (보고서 다운로드용)
+            download_workers (Optional[int]): 다운로드 스레드 수 (None이면 설정값)
+            parse_workers (Optional[int]): 분석 프로세스 수 (None이면 CPU 코어 수)
+            window_size (Optional[int]): 동시에 진행 중인 최대 보고서 수 (메모리 사용량 제한)
+            parser_engine (Optional[str]): 분석 프로세스에서 사용할 파서 엔진
+        """
+        self.dart_client = dart_client
+        self.download_workers = download_workers or DART_API_CONFIG.get('backfill_download_workers', 4)
+        self.parse_workers = parse_workers or DART_API_CONFIG.get('backfill_parse_workers') or os.cpu_count() or 1
+        self.window_size = window_size or (self.download_workers + self.parse_workers) * 4
+        self.parser_engine = parser_engine
+
+        logger.info(
+            f"백필 파이프라인 초기화: 다운로드 스레드 {self.download_workers}개, "
+            f"분석 프로세스 {self.parse_workers}개, 처리 창 {self.window_size}건"
+        )
+
+    def run(self, jobs: Iterable[Tuple[Dict, Any]]) -> Iterator[Tuple[Dict, Any, Optional[Dict[str, Optional[str]]]]]:
+        """
+        공시 목록을 처리하고 결과를 입력 순서대로 반환합니다.
+
+        Args:
+            jobs (Iterable[Tuple[Dict, Any]]): (공시 정보, 호출자 컨텍스트) 목록
+
+        Yields:
+            Tuple[Dict, Any, Optional[Dict]]: (공시 정보, 호출자 컨텍스트, 정제된 데이터 - 실패 시 None)
+        """
+        with ThreadPoolExecutor(max_workers=self.download_workers, thread_name_prefix="backfill-io") as io_pool, \
+                ProcessPoolExecutor(max_workers=self.parse_workers, initializer=_init_parse_worker,
+                                    initargs=(self.parser_engine,),
+                                    mp_context=multiprocessing.get_context('spawn')) as cpu_pool:
+            # fork는 다운로드 스레드와 시트 쓰기 버퍼/잠금을 가진 프로세스를 복제하므로
+            # 작업 프로세스의 오류 기록이 사라지거나 복제된 잠금에서 멈출 수 있어 spawn을 사용
+            pending = deque()
+
+            for disclosure, context in jobs:
+                result_future = self._submit(io_pool, cpu_pool, disclosure['rcept_no'])
+                pending.append((disclosure, context, result_future))
+
+                # 처리 창이 가득 차면 가장 먼저 들어온 결과부터 반환
+                while len(pending) >= self.window_size:
+                    yield self._pop_result(pending)
+
+            while pending:
+                yield self._pop_result(pending)
+
+    def _submit(self, io_pool: ThreadPoolExecutor, cpu_pool: ProcessPoolExecutor, rcept_no: str) -> Future:
+        """
+        보고서 다운로드를 예약하고, 완료되면 분석 프로세스로 넘기는 Future를 반환합니다.
+
+        Args:
+            io_pool (ThreadPoolExecutor): 다운로드 스레드 풀
+            cpu_pool (ProcessPoolExecutor): 분석 프로세스 풀
+            rcept_no (str): 공시 접수번호
+
+        Returns:
+            Future: 정제된 데이터(실패 시 None)를 결과로 갖는 Future
+        """
+        result_future = Future()
+
+        def on_parsed(parse_future: Future):
+            try:
+                result_future.set_result(parse_future.result())
+            except Exception as e:
+                logger.warning(f"보고서({rcept_no}) 분석 실패: {e}")
+                result_future.set_result(None)
+
+        def on_downloaded(download_future: Future):
+            try:
+                report_content = download_future.result()
+                if not report_content:
+                    result_future.set_result(None)
+                    return
+                cpu_pool.submit(_analyze_in_worker, rcept_no, report_content).add_done_callback(on_parsed)
+            except Exception as e:
+                logger.warning(f"보고서({rcept_no}) 다운로드 실패: {e}")
+                result_future.set_result(None)
+
+        io_pool.submit(self.dart_client.get_report_content, rcept_no).add_done_callback(on_downloaded)
+        return result_future
+
+    def _pop_result(self, pending: deque) -> Tuple[Dict, Any, Optional[Dict[str, Optional[str]]]]:
+        """가장 먼저 예약된 작업의 결과를 기다려 반환합니다."""
+        disclosure, context, result_future = pending.popleft()
+        return disclosure, context, result_future.result()
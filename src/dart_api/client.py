@@ -6,34 +6,146 @@ DART API 클라이언트
 """
 
 import requests
-import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import io
 import os
+import re
+import codecs
 import zipfile
-import tempfile
-import shutil
-from typing import List, Dict, Optional
+import pytz
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Tuple
 from loguru import logger
 
 from config.settings import DART_API_KEY, DART_API_CONFIG, REPORT_SEARCH_CONFIG
 from src.utils.error_handler import get_error_handler
+from src.utils.rate_limiter import TokenBucketRateLimiter
+from src.dart_api.document_store import ReportDocumentStore
+
+# 보고서 본문으로 인정하는 파일 확장자
+DOCUMENT_EXTENSIONS = ('.xml', '.html', '.htm')
+
+# 문서 앞부분에 선언된 인코딩 (XML 선언 또는 HTML meta charset)
+DECLARED_ENCODING_PATTERN = re.compile(rb'(?:encoding|charset)\s*=\s*["\']?([A-Za-z0-9_\-]+)', re.IGNORECASE)
 
 
 class DartApiClient:
     """DART API와의 통신을 담당하는 클라이언트 클래스"""
     
-    def __init__(self, api_key: str = DART_API_KEY):
+    def __init__(self, api_key: str = DART_API_KEY, rate_limiter: Optional[TokenBucketRateLimiter] = None,
+                 document_store: Optional[ReportDocumentStore] = None):
         """
         DART API 클라이언트를 초기화합니다.
         
         Args:
             api_key (str): DART API 인증키
+            rate_limiter (Optional[TokenBucketRateLimiter]): 호출 제한기 (None이면 설정값으로 생성)
+            document_store (Optional[ReportDocumentStore]): 원본파일 저장소 (None이면 설정값으로 생성)
         """
         self.api_key = api_key
         self.base_url = DART_API_CONFIG['base_url']
         self.request_delay = DART_API_CONFIG['request_delay']
         
+        # 모든 작업 스레드가 공유하는 호출 제한기 (평균 호출 간격 = request_delay)
+        self.rate_limiter = rate_limiter or TokenBucketRateLimiter(
+            rate_per_second=1.0 / self.request_delay,
+            burst=DART_API_CONFIG.get('rate_limit_burst', 1)
+        )
+        
+        # 실행 전체에서 공유하는 연결 풀 세션 (keep-alive로 TLS 핸드셰이크 재사용)
+        self.session = self._create_session()
+        # 마지막 API 요청의 연결 성공 여부 (None: 아직 요청 없음, 상주 모드 상태 점검에 사용)
+        self.last_request_ok: Optional[bool] = None
+        
+        # 다운로드한 원본파일 로컬 저장소 (제출된 공시는 변경되지 않으므로 재사용)
+        self.document_store = document_store
+        if self.document_store is None and DART_API_CONFIG.get('use_document_cache', False):
+            try:
+                self.document_store = ReportDocumentStore(
+                    DART_API_CONFIG['document_cache_dir'],
+                    DART_API_CONFIG.get('document_cache_max_mb', 500)
+                )
+            except OSError as e:
+                logger.warning(f"공시 원본파일 저장소를 사용할 수 없어 매번 다운로드합니다: {e}")
+        
         logger.info(f"DART API 클라이언트가 초기화되었습니다. (API Key: {api_key[:10]}...)")
     
+    def _create_session(self) -> requests.Session:
+        """
+        연결 풀과 재시도 정책이 적용된 HTTP 세션을 생성합니다.
+        
+        Returns:
+            requests.Session: DART API 전용 세션
+        """
+        pool_size = DART_API_CONFIG.get('connection_pool_size', 10)
+        retry = Retry(
+            total=DART_API_CONFIG.get('http_max_retries', 3),
+            backoff_factor=DART_API_CONFIG.get('http_backoff_factor', 0.5),
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['GET']),
+            raise_on_status=False  # 최종 응답 상태는 호출부에서 확인
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+            'User-Agent': 'DART-Trading-System/1.0'
+        })
+        return session
+    
+    def reset_session(self):
+        """HTTP 세션을 새로 만들어 끊어진 연결 풀을 교체합니다. (상주 모드 재연결 시 호출)"""
+        old_session, self.session = self.session, self._create_session()
+        old_session.close()
+        self.last_request_ok = None
+        logger.info("DART API 세션을 새로 생성했습니다.")
+    
+    def is_healthy(self) -> bool:
+        """
+        마지막 API 요청이 연결 오류 없이 끝났는지 확인합니다.
+        
+        Returns:
+            bool: 정상 여부 (아직 요청하지 않은 경우 정상)
+        """
+        return self.last_request_ok is not False
+    
+    def _get(self, url: str, params: Dict, timeout: int) -> requests.Response:
+        """
+        세션으로 GET 요청을 보내고 연결 성공 여부를 기록합니다.
+        
+        Args:
+            url (str): 요청 주소
+            params (Dict): 요청 파라미터
+            timeout (int): 응답 대기 시간 (초)
+            
+        Returns:
+            requests.Response: 응답 (HTTP 오류 상태면 예외 발생)
+        """
+        try:
+            response = self.session.get(url, params=params, timeout=timeout)
+            response.raise_for_status()
+        except requests.exceptions.RequestException:
+            self.last_request_ok = False
+            raise
+        self.last_request_ok = True
+        return response
+    
+    def flush(self):
+        """원본파일 저장소의 인덱스를 파일에 저장합니다. (실행 주기 종료 시 호출)"""
+        if self.document_store:
+            self.document_store.flush()
+    
+    def close(self):
+        """HTTP 세션과 연결 풀을 정리합니다."""
+        self.flush()
+        self.session.close()
+        logger.debug("DART API 세션을 종료했습니다.")
+    
     def search_disclosures_all_pages(self, corp_code: str) -> List[Dict]:
         """
         특정 회사의 '단일판매ㆍ공급계약체결' 공시를 모든 페이지에서 검색합니다.
@@ -44,34 +156,114 @@ class DartApiClient:
         Returns:
             List[Dict]: 검색된 공시 목록
         """
+        disclosures, _ = self.search_disclosures_since(corp_code)
+        return disclosures
+    
+    def search_disclosures_since(self, corp_code: str,
+                                 watermark: Optional[Dict[str, str]] = None) -> Tuple[List[Dict], Optional[Dict[str, str]]]:
+        """
+        워터마크 이후에 접수된 '단일판매ㆍ공급계약체결' 공시를 검색합니다.
+        
+        워터마크가 있으면 해당 접수일자부터 조회하고, 이미 확인한 접수번호에
+        도달하는 즉시 페이지 조회를 중단합니다. 워터마크가 없으면 전체 기간을 조회합니다.
+        
+        Args:
+            corp_code (str): 회사의 고유번호 (8자리)
+            watermark (Optional[Dict[str, str]]): {'rcept_dt': ..., 'rcept_no': ...}
+            
+        Returns:
+            Tuple[List[Dict], Optional[Dict[str, str]]]: 
+                (검색된 공시 목록, 새 워터마크 - 조회가 중간에 실패한 경우 None)
+        """
+        bgn_de = watermark['rcept_dt'] if watermark else DART_API_CONFIG['search_start_date']
+        
+        logger.info(f"회사({corp_code})의 공시 검색을 시작합니다. (시작일: {bgn_de})")
+        all_results, new_watermark = self._search_list_pages(corp_code, bgn_de, watermark)
+        logger.info(f"회사({corp_code}) 검색 완료: 총 {len(all_results)}개의 관련 공시 발견")
+        
+        return all_results, new_watermark
+    
+    def search_market_disclosures(self, watermark: Optional[Dict[str, str]] = None) -> Tuple[List[Dict], Optional[Dict[str, str]]]:
+        """
+        회사 구분 없이 시장 전체의 '단일판매ㆍ공급계약체결' 공시를 검색합니다. (전체 피드 모드)
+        
+        corp_code 없이 list.json을 조회하므로 회사 수와 관계없이 당일 공시 페이지 수만큼만
+        API를 호출합니다. 워터마크가 있으면 해당 접수일자부터 조회하되, DART의 기간 제한
+        (회사 미지정 시 3개월)을 넘지 않도록 시작일을 보정합니다.
+        
+        Args:
+            watermark (Optional[Dict[str, str]]): {'rcept_dt': ..., 'rcept_no': ...}
+            
+        Returns:
+            Tuple[List[Dict], Optional[Dict[str, str]]]: 
+                (검색된 공시 목록, 새 워터마크 - 조회가 중간에 실패한 경우 None)
+        """
+        now = datetime.now(pytz.timezone('Asia/Seoul'))
+        bgn_de = now.strftime('%Y%m%d')
+        if watermark:
+            min_bgn_de = (now - timedelta(days=DART_API_CONFIG.get('market_feed_max_days', 90))).strftime('%Y%m%d')
+            bgn_de = max(watermark['rcept_dt'], min_bgn_de)
+        
+        logger.info(f"시장 전체 공시 검색을 시작합니다. (시작일: {bgn_de})")
+        all_results, new_watermark = self._search_list_pages(None, bgn_de, watermark)
+        logger.info(f"시장 전체 공시 검색 완료: 총 {len(all_results)}개의 관련 공시 발견")
+        
+        return all_results, new_watermark
+    
+    def _search_list_pages(self, corp_code: Optional[str], bgn_de: str,
+                           watermark: Optional[Dict[str, str]]) -> Tuple[List[Dict], Optional[Dict[str, str]]]:
+        """
+        list.json을 최신순으로 페이지 조회하며 워터마크 이후의 대상 공시를 수집합니다.
+        
+        Args:
+            corp_code (Optional[str]): 회사 고유번호 (None이면 시장 전체)
+            bgn_de (str): 검색 시작일 (YYYYMMDD)
+            watermark (Optional[Dict[str, str]]): 이미 확인한 마지막 공시
+            
+        Returns:
+            Tuple[List[Dict], Optional[Dict[str, str]]]: 
+                (검색된 공시 목록, 새 워터마크 - 조회가 중간에 실패한 경우 None)
+        """
         all_results = []
         current_page = 1
+        completed = False
+        target_label = f"회사({corp_code})" if corp_code else "시장 전체"
         
-        logger.info(f"회사({corp_code})의 공시 검색을 시작합니다.")
+        known_rcept_no = watermark.get('rcept_no', '') if watermark else ''
+        new_watermark = dict(watermark) if watermark else None
+        # 조회 시작 시점의 날짜 (공시가 없는 경우의 워터마크로 사용)
+        today = datetime.now(pytz.timezone('Asia/Seoul')).strftime('%Y%m%d')
         
         while True:
             # API 요청 파라미터 설정
             params = {
                 'crtfc_key': self.api_key,
-                'corp_code': corp_code,
-                'bgn_de': DART_API_CONFIG['search_start_date'],
+                'bgn_de': bgn_de,
                 'pblntf_ty': 'I',  # 정기공시가 아닌 수시공시
                 'sort': 'date',
                 'sort_mth': 'desc',  # 최신순 정렬
                 'page_no': current_page,
                 'page_count': DART_API_CONFIG['page_size']
             }
+            if corp_code:
+                params['corp_code'] = corp_code
             
             try:
-                # API 요청 실행
-                response = requests.get(
+                # API 요청 실행 (호출 제한 준수)
+                self.rate_limiter.acquire()
+                response = self._get(
                     f"{self.base_url}{DART_API_CONFIG['list_endpoint']}", 
                     params=params,
                     timeout=30
                 )
-                response.raise_for_status()
                 data = response.json()
                 
+                # 조회된 데이터가 없음 (정상 종료)
+                if data.get('status') == '013':
+                    logger.info(f"{target_label}의 조회 기간 내 공시가 없습니다.")
+                    completed = True
+                    break
+                
                 # API 응답 상태 확인
                 if data.get('status') != '000':
                     logger.warning(f"API 응답 오류: {data.get('message', '알 수 없는 오류')}")
@@ -80,20 +272,39 @@ class DartApiClient:
                 # 검색 결과가 있는지 확인
                 if 'list' not in data or not data['list']:
                     logger.info(f"페이지 {current_page}에서 더 이상 검색 결과가 없습니다.")
+                    completed = True
                     break
                 
+                # 이미 확인한 접수번호 이후의 공시만 남기기
+                new_reports = [
+                    report for report in data['list']
+                    if str(report.get('rcept_no', '')) > known_rcept_no
+                ]
+                reached_known = len(new_reports) < len(data['list'])
+                
+                # 가장 최근 공시를 새 워터마크로 기록
+                for report in new_reports:
+                    mark = (str(report.get('rcept_dt', '')), str(report.get('rcept_no', '')))
+                    if new_watermark is None or mark > (new_watermark['rcept_dt'], new_watermark['rcept_no']):
+                        new_watermark = {'rcept_dt': mark[0], 'rcept_no': mark[1]}
+                
                 # 단일판매 관련 공시만 필터링
-                filtered_list = self._filter_target_reports(data['list'])
+                filtered_list = self._filter_target_reports(new_reports)
                 all_results.extend(filtered_list)
                 
                 logger.debug(f"페이지 {current_page}: {len(filtered_list)}개의 관련 공시 발견")
                 
-                # 마지막 페이지 확인
+                # 이미 확인한 공시에 도달했거나 마지막 페이지인 경우 종료
+                if reached_known:
+                    logger.debug(f"{target_label}: 이미 확인한 공시({known_rcept_no})에 도달하여 검색을 종료합니다.")
+                    completed = True
+                    break
+                
                 if current_page >= data.get('total_page', 1):
+                    completed = True
                     break
                     
                 current_page += 1
-                time.sleep(self.request_delay)  # API 호출 제한 준수
                 
             except requests.exceptions.RequestException as e:
                 logger.error(f"API 요청 중 오류 발생: {e}")
@@ -102,8 +313,9 @@ class DartApiClient:
                 logger.error(f"예상치 못한 오류 발생: {e}")
                 break
         
-        logger.info(f"회사({corp_code}) 검색 완료: 총 {len(all_results)}개의 관련 공시 발견")
-        return all_results
+        if not completed:
+            return all_results, None
+        return all_results, new_watermark or {'rcept_dt': today, 'rcept_no': ''}
     
     def _filter_target_reports(self, reports: List[Dict]) -> List[Dict]:
         """
@@ -172,9 +384,9 @@ class DartApiClient:
         try:
             logger.debug(f"보고서({rcept_no}) 다운로드를 시작합니다.")
             
-            # 2단계: 핵심 로직 실행
-            response = requests.get(api_url, params=params, timeout=60)
-            response.raise_for_status()
+            # 2단계: 핵심 로직 실행 (호출 제한 준수)
+            self.rate_limiter.acquire()
+            response = self._get(api_url, params=params, timeout=60)
             
             # 3단계: 결과 검증
             if response.status_code == 200 and response.content:
@@ -261,6 +473,9 @@ class DartApiClient:
         """
         ZIP 파일에서 보고서 본문을 추출합니다.
         
+        디스크를 거치지 않고 메모리에서 ZIP을 열어 본문 파일 하나만 압축 해제합니다.
+        (압축 해제 시 CRC 검사가 함께 수행되므로 별도의 testzip 검사는 하지 않습니다.)
+        
         Args:
             zip_content (bytes): ZIP 파일 내용
             rcept_no (str): 접수번호 (로깅용)
@@ -269,7 +484,6 @@ class DartApiClient:
             Optional[str]: 추출된 HTML/XML 내용 (실패 시 None)
         """
         error_handler = get_error_handler()
-        temp_dir = None
         
         # 1단계: 입력값 검증
         if not zip_content or not isinstance(zip_content, bytes):
@@ -299,25 +513,34 @@ class DartApiClient:
             return None
         
         try:
-            # 2단계: 핵심 로직 실행
-            temp_dir = tempfile.mkdtemp()
+            # 2단계: 핵심 로직 실행 (메모리에서 ZIP 열기)
             logger.debug(f"보고서({rcept_no}) ZIP 압축 해제 시작: {len(zip_content):,} bytes")
             
-            # ZIP 파일을 임시 디렉토리에 저장
-            zip_file_path = os.path.join(temp_dir, f"{rcept_no}.zip")
-            with open(zip_file_path, 'wb') as f:
-                f.write(zip_content)
-            
-            # ZIP 파일 검증 및 압축 해제
             try:
-                with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-                    # ZIP 파일 무결성 검사
-                    bad_file = zip_ref.testzip()
-                    if bad_file:
-                        raise zipfile.BadZipFile(f"손상된 파일 발견: {bad_file}")
+                with zipfile.ZipFile(io.BytesIO(zip_content)) as zip_ref:
+                    members = [info for info in zip_ref.infolist() if not info.is_dir()]
+                    available_files = [info.filename for info in members]
+                    
+                    # 보고서 본문 파일 찾기 (HTML 또는 XML 파일)
+                    report_member = self._select_main_document(members, rcept_no)
+                    
+                    # 3단계: 결과 검증
+                    if report_member is None:
+                        error_msg = f"보고서 본문 파일을 찾을 수 없음. 사용 가능한 파일: {available_files}"
+                        logger.warning(error_msg)
+                        if error_handler:
+                            error_handler.handle_error(
+                                error=FileNotFoundError(error_msg),
+                                module="dart_api.client",
+                                operation="extract_document_from_zip",
+                                severity="WARNING",
+                                related_stock=f"접수번호:{rcept_no}",
+                                additional_context={"available_files": available_files}
+                            )
+                        return None
                     
-                    zip_ref.extractall(temp_dir)
-                    logger.debug(f"보고서({rcept_no}) ZIP 압축 해제 완료")
+                    logger.debug(f"보고서 본문 파일 발견: {report_member.filename} ({report_member.file_size:,} bytes)")
+                    raw_content = zip_ref.read(report_member)
                     
             except zipfile.BadZipFile as e:
                 if error_handler:
@@ -332,96 +555,26 @@ class DartApiClient:
                 logger.error(f"보고서({rcept_no}) ZIP 파일이 손상됨: {e}")
                 return None
             
-            # 보고서 본문 파일 찾기 (HTML 또는 XML 파일)
-            report_file_path = None
-            available_files = []
+            # 파일 내용 디코딩 (바이트 기준으로 인코딩을 한 번만 판별)
+            content, encoding = self._decode_document(raw_content)
             
-            for file_name in os.listdir(temp_dir):
-                if file_name != f"{rcept_no}.zip":  # ZIP 파일은 제외
-                    available_files.append(file_name)
-                    if file_name.endswith(('.xml', '.html', '.htm')):
-                        report_file_path = os.path.join(temp_dir, file_name)
-                        logger.debug(f"보고서 본문 파일 발견: {file_name}")
-                        break
-            
-            # 3단계: 결과 검증
-            if not report_file_path:
-                error_msg = f"보고서 본문 파일을 찾을 수 없음. 사용 가능한 파일: {available_files}"
-                logger.warning(error_msg)
+            # 내용 검증
+            if not content or len(content.strip()) < 100:
+                error_msg = f"추출된 내용이 너무 짧음: {len(content) if content else 0} 문자"
                 if error_handler:
                     error_handler.handle_error(
-                        error=FileNotFoundError(error_msg),
-                        module="dart_api.client",
-                        operation="extract_document_from_zip",
-                        severity="WARNING",
-                        related_stock=f"접수번호:{rcept_no}",
-                        additional_context={"available_files": available_files}
-                    )
-                return None
-            
-            # 파일 내용 읽기
-            try:
-                with open(report_file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                
-                # 내용 검증
-                if not content or len(content.strip()) < 100:
-                    raise ValueError(f"추출된 내용이 너무 짧음: {len(content)} 문자")
-                    
-                logger.debug(f"보고서({rcept_no}) 본문 추출 완료: {len(content):,} 문자")
-                return content
-                
-            except UnicodeDecodeError:
-                # UTF-8 실패 시 다른 인코딩 시도
-                logger.warning(f"UTF-8 디코딩 실패, 다른 인코딩 시도: {rcept_no}")
-                for encoding in ['cp949', 'euc-kr', 'iso-8859-1']:
-                    try:
-                        with open(report_file_path, 'r', encoding=encoding, errors='ignore') as f:
-                            content = f.read()
-                        if content and len(content.strip()) >= 100:
-                            logger.info(f"보고서({rcept_no}) {encoding} 인코딩으로 성공")
-                            return content
-                    except Exception:
-                        continue
-                
-                # 모든 인코딩 실패
-                error_msg = f"모든 인코딩 시도 실패"
-                if error_handler:
-                    error_handler.handle_error(
-                        error=UnicodeDecodeError('all-encodings', b'', 0, 1, error_msg),
+                        error=ValueError(error_msg),
                         module="dart_api.client",
                         operation="extract_document_from_zip",
                         severity="ERROR",
                         related_stock=f"접수번호:{rcept_no}",
-                        additional_context={"attempted_encodings": ['utf-8', 'cp949', 'euc-kr', 'iso-8859-1']}
+                        additional_context={"encoding": encoding, "raw_size": len(raw_content)}
                     )
+                logger.error(f"보고서({rcept_no}) {error_msg}")
                 return None
-                
-        except PermissionError as e:
-            if error_handler:
-                error_handler.handle_error(
-                    error=e,
-                    module="dart_api.client",
-                    operation="extract_document_from_zip",
-                    severity="ERROR",
-                    related_stock=f"접수번호:{rcept_no}",
-                    additional_context={"temp_dir": temp_dir}
-                )
-            logger.error(f"보고서({rcept_no}) 파일 권한 오류: {e}")
-            return None
             
-        except OSError as e:
-            if error_handler:
-                error_handler.handle_error(
-                    error=e,
-                    module="dart_api.client",
-                    operation="extract_document_from_zip",
-                    severity="ERROR",
-                    related_stock=f"접수번호:{rcept_no}",
-                    additional_context={"temp_dir": temp_dir}
-                )
-            logger.error(f"보고서({rcept_no}) 파일 시스템 오류: {e}")
-            return None
+            logger.debug(f"보고서({rcept_no}) 본문 추출 완료: {len(content):,} 문자 ({encoding})")
+            return content
             
         except Exception as e:
             if error_handler:
@@ -431,27 +584,69 @@ class DartApiClient:
                     operation="extract_document_from_zip",
                     severity="CRITICAL",
                     related_stock=f"접수번호:{rcept_no}",
-                    additional_context={"temp_dir": temp_dir, "zip_size": len(zip_content)}
+                    additional_context={"zip_size": len(zip_content)}
                 )
             logger.error(f"보고서({rcept_no}) ZIP 파일 처리 중 예상치 못한 오류: {e}")
             return None
+    
+    def _select_main_document(self, members: List[zipfile.ZipInfo], rcept_no: str) -> Optional[zipfile.ZipInfo]:
+        """
+        ZIP 멤버 중 보고서 본문 파일을 선택합니다.
+        
+        DART 원본파일은 본문이 '{접수번호}.xml', 첨부서류가 '{접수번호}_XXXXX.xml' 형태이므로
+        접수번호와 이름이 일치하는 파일을 우선하고, 없으면 가장 큰 HTML/XML 파일을 선택합니다.
+        
+        Args:
+            members (List[zipfile.ZipInfo]): ZIP 멤버 목록
+            rcept_no (str): 접수번호
             
-        finally:
-            # 임시 디렉토리 정리
-            if temp_dir and os.path.exists(temp_dir):
-                try:
-                    shutil.rmtree(temp_dir)
-                    logger.debug(f"임시 디렉토리 정리 완료: {temp_dir}")
-                except Exception as cleanup_error:
-                    logger.warning(f"임시 디렉토리 정리 실패: {cleanup_error}")
-                    if error_handler:
-                        error_handler.handle_error(
-                            error=cleanup_error,
-                            module="dart_api.client",
-                            operation="extract_document_from_zip_cleanup",
-                            severity="WARNING",
-                            additional_context={"temp_dir": temp_dir}
-                        )
+        Returns:
+            Optional[zipfile.ZipInfo]: 본문 파일 (없으면 None)
+        """
+        candidates = [
+            info for info in members
+            if info.filename.lower().endswith(DOCUMENT_EXTENSIONS)
+        ]
+        if not candidates:
+            return None
+        
+        for info in candidates:
+            base_name = os.path.splitext(os.path.basename(info.filename))[0]
+            if base_name == rcept_no:
+                return info
+        
+        return max(candidates, key=lambda info: info.file_size)
+    
+    def _decode_document(self, raw_content: bytes) -> Tuple[str, str]:
+        """
+        보고서 바이트를 문자열로 디코딩합니다.
+        
+        BOM과 문서에 선언된 인코딩을 먼저 확인한 뒤 UTF-8, CP949, EUC-KR 순으로 시도하며,
+        모두 실패하면 UTF-8로 디코딩하면서 깨진 문자를 무시합니다.
+        
+        Args:
+            raw_content (bytes): 보고서 원본 바이트
+            
+        Returns:
+            Tuple[str, str]: (디코딩된 내용, 사용된 인코딩)
+        """
+        if raw_content.startswith(codecs.BOM_UTF8):
+            return raw_content[len(codecs.BOM_UTF8):].decode('utf-8', errors='ignore'), 'utf-8-sig'
+        
+        candidates = []
+        declared = DECLARED_ENCODING_PATTERN.search(raw_content[:1024])
+        if declared:
+            candidates.append(declared.group(1).decode('ascii').lower())
+        candidates.extend(['utf-8', 'cp949', 'euc-kr'])
+        
+        for encoding in dict.fromkeys(candidates):
+            try:
+                return raw_content.decode(encoding), encoding
+            except (UnicodeDecodeError, LookupError):
+                continue
+        
+        logger.warning("보고서 인코딩 판별 실패, UTF-8로 디코딩하며 깨진 문자를 무시합니다.")
+        return raw_content.decode('utf-8', errors='ignore'), 'utf-8'
     
     def get_report_content(self, rcept_no: str) -> Optional[str]:
         """
@@ -463,6 +658,17 @@ class DartApiClient:
         Returns:
             Optional[str]: 보고서 HTML/XML 내용 (실패 시 None)
         """
+        # 0단계: 로컬 저장소에 보관된 원본파일 사용
+        if self.document_store:
+            cached_zip = self.document_store.get(rcept_no)
+            if cached_zip:
+                document_content = self.extract_document_from_zip(cached_zip, rcept_no)
+                if document_content:
+                    logger.debug(f"보고서({rcept_no}) 로컬 저장소에서 로드")
+                    return document_content
+                # 사용할 수 없는 원본파일은 폐기하고 다시 다운로드
+                self.document_store.discard(rcept_no)
+        
         # 1단계: ZIP 파일 다운로드
         zip_content = self.download_report_document(rcept_no)
         if not zip_content:
@@ -470,4 +676,9 @@ class DartApiClient:
         
         # 2단계: ZIP 파일에서 본문 추출
         document_content = self.extract_document_from_zip(zip_content, rcept_no)
+        
+        # 본문 추출에 성공한 원본파일만 보관
+        if document_content and self.document_store:
+            self.document_store.put(rcept_no, zip_content)
+        
         return document_content
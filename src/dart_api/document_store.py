@@ -0,0 +1,290 @@
+"""
+DART 공시 원본파일 로컬 저장소
+
+이 모듈은 다운로드한 공시 원본파일(ZIP)을 접수번호 기준으로 디스크에 보관합니다.
+제출된 공시는 변경되지 않으므로 재분석, 백필, 재시작 시 네트워크 호출 없이 재사용할 수 있습니다.
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from typing import Dict, List, Optional
+from loguru import logger
+
+
+class ReportDocumentStore:
+    """접수번호로 식별되는 공시 원본파일을 용량 제한(LRU)과 함께 관리하는 클래스"""
+
+    INDEX_FILE_NAME = 'index.json'
+    # 인덱스를 파일에 반영하는 변경 건수 (그 사이에는 flush/close 시 저장)
+    INDEX_SAVE_INTERVAL = 50
+
+    def __init__(self, directory: str, max_size_mb: int = 500):
+        """
+        원본파일 저장소를 초기화합니다.
+
+        Args:
+            directory (str): 저장 디렉토리
+            max_size_mb (int): 최대 저장 용량 (MB), 초과 시 오래 사용하지 않은 파일부터 삭제
+        """
+        self.directory = directory
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.index_path = os.path.join(directory, self.INDEX_FILE_NAME)
+        self._index: Dict[str, Dict] = {}
+        self._total_size_bytes = 0
+        self._dirty_count = 0
+        self._lock = threading.Lock()  # 인덱스(_index) 보호용, 파일 IO는 잠금 밖에서 수행
+        self._save_lock = threading.Lock()  # 인덱스 파일 쓰기 직렬화
+
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+        logger.info(
+            f"공시 원본파일 저장소 초기화 완료: {len(self._index)}건, "
+            f"{self._total_size_bytes / 1024 / 1024:.1f}MB / {max_size_mb}MB ({directory})"
+        )
+
+    def _load_index(self):
+        """
+        인덱스 파일을 불러오고 실제 파일이 없는 항목은 제거합니다.
+
+        인덱스는 일정 건수마다 저장되므로, 저장 전에 종료되어 인덱스에 없는 파일은 다시 등록합니다.
+        """
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+
+                self._index = {
+                    rcept_no: entry for rcept_no, entry in index.items()
+                    if os.path.exists(self._file_path(rcept_no))
+                }
+            except Exception as e:
+                logger.warning(f"원본파일 저장소 인덱스를 읽을 수 없어 새로 시작합니다: {e}")
+                self._index = {}
+
+        recovered = self._recover_unindexed_files()
+        self._total_size_bytes = sum(entry['size'] for entry in self._index.values())
+        if recovered:
+            logger.info(f"인덱스에 없는 원본파일 {recovered}건을 다시 등록했습니다.")
+            self._dirty_count = recovered
+            self.flush()
+
+    def _recover_unindexed_files(self) -> int:
+        """인덱스에 없는 원본파일을 등록하고 쓰다 만 임시 파일은 삭제합니다. (초기화 중 호출)"""
+        recovered = 0
+        for sub_dir in os.listdir(self.directory):
+            sub_path = os.path.join(self.directory, sub_dir)
+            if not os.path.isdir(sub_path):
+                continue
+
+            for file_name in os.listdir(sub_path):
+                file_path = os.path.join(sub_path, file_name)
+                if file_name.endswith('.tmp'):
+                    try:
+                        os.remove(file_path)
+                    except OSError:
+                        pass
+                    continue
+
+                rcept_no, ext = os.path.splitext(file_name)
+                if ext != '.zip' or rcept_no in self._index:
+                    continue
+                try:
+                    with open(file_path, 'rb') as f:
+                        content = f.read()
+                except OSError:
+                    continue
+                self._index[rcept_no] = self._make_entry(content, os.path.getmtime(file_path))
+                recovered += 1
+        return recovered
+
+    def _save_index(self):
+        """인덱스를 파일에 저장합니다. (잠금 밖에서 호출, 직렬화는 잠금 안에서 복사본으로 수행)"""
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty_count:
+                    return
+                data = json.dumps(self._index)
+                saved_count = self._dirty_count
+
+            temp_path = f"{self.index_path}.tmp"
+            try:
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(temp_path, self.index_path)
+            except Exception as e:
+                logger.warning(f"원본파일 저장소 인덱스 저장 실패: {e}")
+                return
+
+            with self._lock:
+                self._dirty_count = max(0, self._dirty_count - saved_count)
+
+    def _mark_dirty(self) -> bool:
+        """
+        인덱스 변경을 기록합니다. (잠금을 보유한 상태에서 호출)
+
+        Returns:
+            bool: 인덱스 파일을 저장할 때가 되었는지 여부
+        """
+        self._dirty_count += 1
+        return self._dirty_count >= self.INDEX_SAVE_INTERVAL
+
+    @staticmethod
+    def _make_entry(content: bytes, last_access: float) -> Dict:
+        """인덱스 항목을 만듭니다."""
+        return {
+            'size': len(content),
+            'sha256': hashlib.sha256(content).hexdigest(),
+            'last_access': last_access
+        }
+
+    def _file_path(self, rcept_no: str) -> str:
+        """접수번호에 해당하는 파일 경로를 반환합니다. (접수일자별 하위 디렉토리)"""
+        return os.path.join(self.directory, rcept_no[:8], f"{rcept_no}.zip")
+
+    def get(self, rcept_no: str) -> Optional[bytes]:
+        """
+        저장된 원본파일을 반환합니다.
+
+        Args:
+            rcept_no (str): 공시 접수번호
+
+        Returns:
+            Optional[bytes]: 원본파일 내용 (없거나 손상된 경우 None)
+        """
+        with self._lock:
+            entry = self._index.get(rcept_no)
+            if not entry:
+                return None
+            expected_sha256 = entry['sha256']
+
+        # 파일 읽기와 해시 검증은 잠금 밖에서 수행 (다른 스레드의 조회/저장을 막지 않도록)
+        try:
+            with open(self._file_path(rcept_no), 'rb') as f:
+                content = f.read()
+        except OSError as e:
+            logger.warning(f"저장된 원본파일({rcept_no})을 읽을 수 없습니다: {e}")
+            with self._lock:
+                if self._index.get(rcept_no) is entry:
+                    self._pop_entry(rcept_no)
+            return None
+
+        # 내용 해시 검증 (손상된 파일은 폐기)
+        if hashlib.sha256(content).hexdigest() != expected_sha256:
+            logger.warning(f"저장된 원본파일({rcept_no})이 손상되어 폐기합니다.")
+            with self._lock:
+                if self._index.get(rcept_no) is not entry:  # 그 사이 다시 저장된 경우 유지
+                    return None
+                self._pop_entry(rcept_no)
+                save_due = self._mark_dirty()
+            self._remove_files([rcept_no])
+            if save_due:
+                self._save_index()
+            return None
+
+        with self._lock:
+            entry['last_access'] = time.time()
+        return content
+
+    def put(self, rcept_no: str, content: bytes):
+        """
+        원본파일을 저장하고 용량 초과 시 오래 사용하지 않은 파일을 정리합니다.
+
+        Args:
+            rcept_no (str): 공시 접수번호
+            content (bytes): 원본파일 내용
+        """
+        if not rcept_no or not content:
+            return
+
+        file_path = self._file_path(rcept_no)
+        temp_path = f"{file_path}.{threading.get_ident()}.tmp"  # 같은 공시를 동시에 저장해도 임시 파일이 겹치지 않도록
+
+        # 파일 쓰기와 해시 계산은 잠금 밖에서 수행 (같은 접수번호의 내용은 항상 동일)
+        entry = self._make_entry(content, time.time())
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.write(content)
+            os.replace(temp_path, file_path)
+        except OSError as e:
+            logger.warning(f"원본파일({rcept_no}) 저장 실패: {e}")
+            return
+
+        with self._lock:
+            self._pop_entry(rcept_no)
+            self._index[rcept_no] = entry
+            self._total_size_bytes += entry['size']
+            evicted = self._evict_if_needed()
+            save_due = self._mark_dirty()
+
+        self._remove_files(evicted)
+        if save_due:
+            self._save_index()
+
+        logger.debug(f"원본파일({rcept_no}) 저장 완료: {len(content):,} bytes")
+
+    def discard(self, rcept_no: str):
+        """
+        저장된 원본파일을 삭제합니다. (추출 실패 등으로 사용할 수 없는 경우)
+
+        Args:
+            rcept_no (str): 공시 접수번호
+        """
+        with self._lock:
+            if not self._pop_entry(rcept_no):
+                return
+            save_due = self._mark_dirty()
+
+        self._remove_files([rcept_no])
+        if save_due:
+            self._save_index()
+
+    def flush(self):
+        """최근 사용 시각을 포함한 인덱스를 파일에 저장합니다."""
+        with self._lock:
+            # 최근 사용 시각만 바뀐 경우에도 저장하도록 표시
+            self._dirty_count = max(self._dirty_count, 1)
+        self._save_index()
+
+    def _evict_if_needed(self) -> List[str]:
+        """
+        전체 용량이 제한을 넘으면 가장 오래 사용하지 않은 파일부터 인덱스에서 제거합니다. (잠금을 보유한 상태에서 호출)
+
+        Returns:
+            List[str]: 제거한 접수번호 목록 (파일 삭제는 호출부에서 잠금 밖에서 수행)
+        """
+        if self._total_size_bytes <= self.max_size_bytes:
+            return []
+
+        evicted = []
+        for rcept_no, _ in sorted(self._index.items(), key=lambda item: item[1]['last_access']):
+            if self._total_size_bytes <= self.max_size_bytes:
+                break
+            self._pop_entry(rcept_no)
+            evicted.append(rcept_no)
+
+        logger.info(f"원본파일 저장소 용량 정리: {len(evicted)}건 삭제 "
+                    f"(현재 {self._total_size_bytes / 1024 / 1024:.1f}MB)")
+        return evicted
+
+    def _pop_entry(self, rcept_no: str) -> Optional[Dict]:
+        """인덱스 항목을 제거하고 전체 크기에서 뺍니다. (잠금을 보유한 상태에서 호출)"""
+        entry = self._index.pop(rcept_no, None)
+        if entry is not None:
+            self._total_size_bytes -= entry['size']
+        return entry
+
+    def _remove_files(self, rcept_nos: List[str]):
+        """인덱스에서 제거한 원본파일을 삭제합니다. (잠금 밖에서 호출)"""
+        for rcept_no in rcept_nos:
+            with self._lock:
+                if rcept_no in self._index:  # 그 사이 다시 저장된 경우 유지
+                    continue
+            try:
+                os.remove(self._file_path(rcept_no))
+            except OSError:
+                pass
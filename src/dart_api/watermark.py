@@ -0,0 +1,120 @@
+"""
+DART 공시 검색 워터마크 저장소
+
+이 모듈은 회사(corp_code)별로 마지막으로 확인한 공시의 접수일자/접수번호를
+파일에 저장하여, 다음 실행 시 이후 공시만 조회할 수 있도록 합니다.
+"""
+
+import os
+import json
+import threading
+from typing import Dict, Optional
+from loguru import logger
+
+
+class DisclosureWatermarkStore:
+    """회사별 공시 검색 워터마크(최신 접수일자/접수번호)를 관리하는 클래스"""
+
+    def __init__(self, file_path: str):
+        """
+        워터마크 저장소를 초기화하고 저장된 파일을 불러옵니다.
+
+        Args:
+            file_path (str): 워터마크 JSON 파일 경로
+        """
+        self.file_path = file_path
+        self._marks: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        self._load()
+        logger.info(f"공시 워터마크 저장소 초기화 완료: {len(self._marks)}개 회사 ({file_path})")
+
+    def _load(self):
+        """파일에서 워터마크를 불러옵니다. 파일이 없거나 손상된 경우 빈 상태로 시작합니다."""
+        if not os.path.exists(self.file_path):
+            return
+
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            if isinstance(data, dict):
+                self._marks = {
+                    str(corp_code): mark for corp_code, mark in data.items()
+                    if isinstance(mark, dict) and mark.get('rcept_dt')
+                }
+        except Exception as e:
+            logger.warning(f"워터마크 파일을 읽을 수 없어 전체 검색으로 시작합니다: {e}")
+            self._marks = {}
+
+    def get(self, corp_code: str) -> Optional[Dict[str, str]]:
+        """
+        회사의 워터마크를 반환합니다.
+
+        Args:
+            corp_code (str): 회사 고유번호
+
+        Returns:
+            Optional[Dict[str, str]]: {'rcept_dt': ..., 'rcept_no': ...} (없으면 None)
+        """
+        with self._lock:
+            mark = self._marks.get(str(corp_code))
+            return dict(mark) if mark else None
+
+    def update(self, corp_code: str, mark: Dict[str, str]):
+        """
+        회사의 워터마크를 갱신합니다. 기존 워터마크보다 오래된 값은 무시합니다.
+
+        Args:
+            corp_code (str): 회사 고유번호
+            mark (Dict[str, str]): {'rcept_dt': ..., 'rcept_no': ...}
+        """
+        if not mark or not mark.get('rcept_dt'):
+            return
+
+        corp_code = str(corp_code)
+        new_mark = {
+            'rcept_dt': str(mark['rcept_dt']),
+            'rcept_no': str(mark.get('rcept_no') or '')
+        }
+
+        with self._lock:
+            current = self._marks.get(corp_code)
+            if current and (current['rcept_dt'], current['rcept_no']) >= (new_mark['rcept_dt'], new_mark['rcept_no']):
+                return
+
+            self._marks[corp_code] = new_mark
+            self._dirty = True
+
+    def save(self) -> bool:
+        """
+        변경된 워터마크를 파일에 저장합니다. (임시 파일에 쓴 뒤 교체)
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        with self._lock:
+            if not self._dirty:
+                return True
+            snapshot = dict(self._marks)
+            self._dirty = False
+
+        temp_path = f"{self.file_path}.tmp"
+        try:
+            directory = os.path.dirname(self.file_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(temp_path, self.file_path)
+
+            logger.debug(f"공시 워터마크 저장 완료: {len(snapshot)}개 회사")
+            return True
+
+        except Exception as e:
+            logger.warning(f"공시 워터마크 저장 실패: {e}")
+            with self._lock:
+                self._dirty = True
+            return False
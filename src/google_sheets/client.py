@@ -11,13 +11,19 @@ from google.oauth2.service_account import Credentials
 from typing import Dict, List, Optional, Tuple
 from loguru import logger
 import os
+import time
+from decimal import Decimal
 
 from config.settings import (
     SPREADSHEET_URL, 
     SHEET_NAMES, 
     SHEET_COLUMNS,
+    GOOGLE_SHEETS_CONFIG,
     ENVIRONMENT
 )
+from src.google_sheets.replica import SheetReplica
+from src.google_sheets.write_buffer import SheetWriteBuffer
+from src.google_sheets.trade_ledger import TradeLedger
 from src.utils.error_handler import get_error_handler
 
 
@@ -36,6 +42,7 @@ class GoogleSheetsClient:
         self.sheet_names = SHEET_NAMES
         self.sheet_columns = SHEET_COLUMNS
         self.document = None
+        self._worksheets: Dict[str, gspread.Worksheet] = {}  # 제목별 워크시트 객체 캐시
         self.is_cloudtype = ENVIRONMENT == 'production'
         
         # 구글 API 권한 범위 설정
@@ -44,6 +51,28 @@ class GoogleSheetsClient:
             'https://www.googleapis.com/auth/drive'
         ]
         
+        # 로컬 복제본 (매 실행마다 전체 시트를 내려받지 않고 새로 추가된 행만 동기화)
+        self.replica: Optional[SheetReplica] = None
+        if GOOGLE_SHEETS_CONFIG.get('use_local_replica', False):
+            try:
+                self.replica = SheetReplica(GOOGLE_SHEETS_CONFIG['replica_db_path'], source=self.spreadsheet_url)
+            except Exception as e:
+                logger.warning(f"구글 시트 로컬 복제본을 사용할 수 없어 매번 전체 시트를 조회합니다: {e}")
+        
+        # 쓰기 버퍼 (행 추가/셀 수정을 모아 실행 종료 시 또는 임계치 도달 시 일괄 전송)
+        self.write_buffer: Optional[SheetWriteBuffer] = None
+        if GOOGLE_SHEETS_CONFIG.get('use_write_buffer', False):
+            self.write_buffer = SheetWriteBuffer(
+                GOOGLE_SHEETS_CONFIG['write_spill_file'],
+                max_pending=GOOGLE_SHEETS_CONFIG.get('write_buffer_max_pending', 100),
+                max_delay_seconds=GOOGLE_SHEETS_CONFIG.get('write_buffer_max_delay_seconds', 30)
+            )
+        
+        # 거래내역 보유중 거래 색인 (종목코드 -> 행 번호)
+        self.trade_ledger = TradeLedger()
+        self._ledger_synced_at = 0.0
+        self._ledger_full_synced_at: Optional[float] = None
+        
         logger.info(f"구글 스프레드시트 클라이언트가 초기화되었습니다. (환경: {ENVIRONMENT})")
     
     def connect(self) -> bool:
@@ -153,6 +182,7 @@ class GoogleSheetsClient:
             # 스프레드시트 문서 열기
             try:
                 self.document = gc.open_by_url(self.spreadsheet_url)
+                self._worksheets = {}
                 logger.debug(f"스프레드시트 문서 열기 완료: {self.document.title}")
             except gspread.exceptions.SpreadsheetNotFound as e:
                 if error_handler:
@@ -195,9 +225,10 @@ class GoogleSheetsClient:
                 logger.error(error_msg)
                 return False
             
-            # 워크시트 접근 테스트
+            # 워크시트 접근 테스트 (조회한 워크시트 목록은 캐시에 보관)
             try:
                 worksheets = self.document.worksheets()
+                self._worksheets = {worksheet.title: worksheet for worksheet in worksheets}
                 logger.info(f"구글 스프레드시트 연결 성공: {len(worksheets)}개 시트 발견")
                 return True
                 
@@ -242,6 +273,46 @@ class GoogleSheetsClient:
             logger.error(f"구글 스프레드시트 연결 중 예상치 못한 오류: {e}")
             return False
     
+    def _get_worksheet(self, sheet_name: str) -> gspread.Worksheet:
+        """
+        워크시트 객체를 캐시에서 가져옵니다. (캐시에 없으면 문서 메타데이터를 한 번 다시 조회)
+        
+        Args:
+            sheet_name (str): 시트 이름
+            
+        Returns:
+            gspread.Worksheet: 워크시트 객체
+            
+        Raises:
+            gspread.WorksheetNotFound: 시트가 존재하지 않는 경우
+        """
+        worksheet = self._worksheets.get(sheet_name)
+        if worksheet is not None:
+            return worksheet
+        
+        self._refresh_worksheet_cache()
+        worksheet = self._worksheets.get(sheet_name)
+        if worksheet is None:
+            raise gspread.WorksheetNotFound(sheet_name)
+        return worksheet
+    
+    def _refresh_worksheet_cache(self):
+        """문서 메타데이터를 조회하여 워크시트 캐시를 새로 채웁니다."""
+        self._worksheets = {worksheet.title: worksheet for worksheet in self.document.worksheets()}
+        logger.debug(f"워크시트 캐시 갱신: {len(self._worksheets)}개 시트")
+    
+    def invalidate_worksheet_cache(self, sheet_name: Optional[str] = None):
+        """
+        워크시트 캐시를 무효화합니다. (시트 삭제/이름 변경 등 구조 변경 시)
+        
+        Args:
+            sheet_name (Optional[str]): 시트 이름 (None이면 전체)
+        """
+        if sheet_name is None:
+            self._worksheets = {}
+        else:
+            self._worksheets.pop(sheet_name, None)
+    
     def get_worksheet_data(self, sheet_name: str) -> Tuple[Optional[object], Optional[pd.DataFrame]]:
         """
         지정된 시트의 데이터를 DataFrame으로 가져옵니다.
@@ -258,7 +329,7 @@ class GoogleSheetsClient:
         
         try:
             # 워크시트 가져오기
-            worksheet = self.document.worksheet(sheet_name)
+            worksheet = self._get_worksheet(sheet_name)
             
             # 모든 데이터 가져오기
             records = worksheet.get_all_values()
@@ -275,11 +346,140 @@ class GoogleSheetsClient:
             
         except gspread.WorksheetNotFound:
             logger.error(f"'{sheet_name}' 시트를 찾을 수 없습니다.")
+            self.invalidate_worksheet_cache(sheet_name)
             return None, None
         except Exception as e:
             logger.error(f"'{sheet_name}' 시트 데이터 가져오기 실패: {e}")
+            self.invalidate_worksheet_cache(sheet_name)
             return None, None
     
+    def sync_sheet_replica(self, sheet_name: str, full_sync_minutes: Optional[float] = None,
+                           incremental: bool = True) -> bool:
+        """
+        시트를 로컬 복제본과 동기화합니다.
+        
+        동기화 이력이 없거나 전체 재동기화 주기가 지났으면 시트 전체를 받아오고,
+        그 외에는 헤더, 마지막으로 동기화한 행, 그 이후에 추가된 행만 한 번의 요청으로 받아옵니다.
+        헤더가 바뀌었거나 마지막으로 동기화한 행이 비어 있으면(행 삭제) 전체를 다시 받아옵니다.
+        
+        Args:
+            sheet_name (str): 시트 이름
+            full_sync_minutes (Optional[float]): 전체 재동기화 주기 (분, None이면 설정값)
+            incremental (bool): False이면 전체 재동기화 주기 사이에는 요청 없이 복제본을 그대로 사용
+            
+        Returns:
+            bool: 동기화 성공 여부
+        """
+        if not self.replica or not self.document:
+            return False
+        
+        if full_sync_minutes is None:
+            full_sync_minutes = GOOGLE_SHEETS_CONFIG.get('replica_full_sync_minutes', 60)
+        
+        try:
+            state = self.replica.get_state(sheet_name)
+            needs_full_sync = state is None or time.time() - state['full_synced_at'] >= full_sync_minutes * 60
+            
+            if not needs_full_sync and not incremental:
+                logger.debug(f"'{sheet_name}' 시트는 로컬 복제본을 그대로 사용합니다.")
+                return True
+            
+            worksheet = self._get_worksheet(sheet_name)
+            if needs_full_sync:
+                return self._full_sync_sheet(worksheet, sheet_name)
+            
+            header = state['header']
+            row_count = state['row_count']
+            if worksheet.row_count <= row_count + 1:
+                # 캐시된 워크시트의 행 크기가 오래되었을 수 있으므로 메타데이터 갱신
+                self._refresh_worksheet_cache()
+                worksheet = self._get_worksheet(sheet_name)
+            last_column = gspread.utils.rowcol_to_a1(1, max(len(header), 1))[:-1]
+            
+            # 헤더 + 마지막 동기화 행 + 이후 추가된 행을 한 번에 요청
+            ranges = ['1:1']
+            if row_count:
+                ranges.append(f"A{row_count + 1}:{last_column}{row_count + 1}")
+            has_tail = worksheet.row_count > row_count + 1
+            if has_tail:
+                ranges.append(f"A{row_count + 2}:{last_column}")
+            
+            results = worksheet.batch_get(ranges)
+            
+            current_header = results[0][0] if results[0] else []
+            if self._trim_row(current_header) != self._trim_row(header):
+                logger.info(f"'{sheet_name}' 시트 헤더가 변경되어 전체를 다시 동기화합니다.")
+                return self._full_sync_sheet(worksheet, sheet_name)
+            
+            if row_count and not any(self._trim_row(row) for row in results[1]):
+                logger.info(f"'{sheet_name}' 시트에서 삭제된 행이 감지되어 전체를 다시 동기화합니다.")
+                return self._full_sync_sheet(worksheet, sheet_name)
+            
+            new_rows = [self._fit_row(row, len(header)) for row in results[-1]] if has_tail else []
+            self.replica.append(sheet_name, new_rows)
+            
+            logger.debug(f"'{sheet_name}' 시트 증분 동기화 완료: 신규 {len(new_rows)}행 (전체 {row_count + len(new_rows)}행)")
+            return True
+            
+        except Exception as e:
+            logger.warning(f"'{sheet_name}' 시트 로컬 복제본 동기화 실패: {e}")
+            self.invalidate_worksheet_cache(sheet_name)
+            return False
+    
+    def _full_sync_sheet(self, worksheet, sheet_name: str) -> bool:
+        """
+        시트 전체를 받아 로컬 복제본을 교체합니다.
+        
+        Args:
+            worksheet: 워크시트 객체
+            sheet_name (str): 시트 이름
+            
+        Returns:
+            bool: 동기화 성공 여부
+        """
+        records = worksheet.get_all_values()
+        header = records[0] if records else []
+        rows = [self._fit_row(row, len(header)) for row in records[1:]]
+        
+        self.replica.replace(sheet_name, header, rows)
+        logger.info(f"'{sheet_name}' 시트 전체를 로컬 복제본에 동기화했습니다: {len(rows)}행")
+        return True
+    
+    @staticmethod
+    def _trim_row(row: List[str]) -> List[str]:
+        """행 끝의 빈 셀을 제거합니다."""
+        row = list(row)
+        while row and row[-1] == '':
+            row.pop()
+        return row
+    
+    @staticmethod
+    def _fit_row(row: List[str], width: int) -> List[str]:
+        """행을 헤더 길이에 맞게 채우거나 자릅니다."""
+        row = list(row)[:width]
+        return row + [''] * (width - len(row))
+    
+    def get_sheet_dataframe(self, sheet_name: str, full_sync_minutes: Optional[float] = None,
+                            incremental: bool = True) -> Optional[pd.DataFrame]:
+        """
+        시트 데이터를 로컬 복제본에서 가져옵니다. (복제본을 사용할 수 없으면 시트 전체 조회)
+        
+        Args:
+            sheet_name (str): 시트 이름
+            full_sync_minutes (Optional[float]): 전체 재동기화 주기 (분, None이면 설정값)
+            incremental (bool): 전체 재동기화 주기 사이에 새로 추가된 행을 동기화할지 여부
+            
+        Returns:
+            Optional[pd.DataFrame]: 시트 데이터 (실패 시 None)
+        """
+        if self.sync_sheet_replica(sheet_name, full_sync_minutes, incremental):
+            df = self.replica.get_dataframe(sheet_name)
+            logger.info(f"'{sheet_name}' 시트에서 {len(df)}개의 레코드를 가져왔습니다. (로컬 복제본)")
+            return df
+        
+        _, df = self.get_worksheet_data(sheet_name)
+        return df
+    
     def get_company_list(self) -> Optional[pd.DataFrame]:
         """
         분석 대상 회사 목록을 가져옵니다.
@@ -287,7 +487,12 @@ class GoogleSheetsClient:
         Returns:
             Optional[pd.DataFrame]: 분석 대상 회사 목록 (실패 시 None)
         """
-        worksheet, df = self.get_worksheet_data(self.sheet_names['COMPANY_LIST'])
+        # 회사 목록은 행이 수정되는 시트이므로 주기적으로 전체를 다시 받음
+        df = self.get_sheet_dataframe(
+            self.sheet_names['COMPANY_LIST'],
+            full_sync_minutes=GOOGLE_SHEETS_CONFIG.get('company_list_sync_minutes', 10),
+            incremental=False
+        )
         
         if df is None:
             return None
@@ -311,15 +516,23 @@ class GoogleSheetsClient:
         existing_numbers = set()
         
         # '계약' 시트에서 접수번호 가져오기
-        _, contract_df = self.get_worksheet_data(self.sheet_names['CONTRACT'])
+        contract_df = self.get_sheet_dataframe(self.sheet_names['CONTRACT'])
         if contract_df is not None and '접수번호' in contract_df.columns:
             existing_numbers.update(contract_df['접수번호'].tolist())
         
         # '분석제외' 시트에서 접수번호 가져오기
-        _, excluded_df = self.get_worksheet_data(self.sheet_names['EXCLUDED'])
+        excluded_df = self.get_sheet_dataframe(self.sheet_names['EXCLUDED'])
         if excluded_df is not None and '접수번호' in excluded_df.columns:
             existing_numbers.update(excluded_df['접수번호'].tolist())
         
+        # 아직 전송되지 않은 (쓰기 버퍼/보관 파일의) 행도 처리된 것으로 간주
+        if self.write_buffer:
+            rcept_no_index = self.sheet_columns.index('접수번호')
+            for sheet_key in ('CONTRACT', 'EXCLUDED'):
+                for row in self.write_buffer.pending_rows(self.sheet_names[sheet_key]):
+                    if len(row) > rcept_no_index:
+                        existing_numbers.add(row[rcept_no_index])
+        
         # 빈 문자열 제거
         existing_numbers.discard('')
         existing_numbers.discard(None)
@@ -379,17 +592,12 @@ class GoogleSheetsClient:
             return False
         
         try:
-            # 워크시트 가져오기
-            worksheet = self.document.worksheet(sheet_name)
-            
             # 데이터를 리스트로 변환
             data_to_append = df.values.tolist()
             
             # 시트에 데이터 추가
-            worksheet.append_rows(
-                data_to_append, 
-                value_input_option='USER_ENTERED'
-            )
+            if not self._append_rows(sheet_name, data_to_append):
+                return False
             
             logger.info(f"'{sheet_name}' 시트에 {len(data_to_append)}개의 데이터를 성공적으로 추가했습니다.")
             return True
@@ -398,6 +606,62 @@ class GoogleSheetsClient:
             logger.error(f"'{sheet_name}' 시트에 데이터 추가 실패: {e}")
             return False
     
+    def _append_rows(self, sheet_name: str, rows: List[List]) -> bool:
+        """
+        시트에 행을 추가합니다. 쓰기 버퍼가 있으면 대기열에 넣고 임계치를 넘으면 전송합니다.
+        
+        Args:
+            sheet_name (str): 대상 시트 이름
+            rows (List[List]): 추가할 행 목록
+            
+        Returns:
+            bool: 추가(또는 대기열 등록 및 보관 파일 기록) 성공 여부
+        """
+        if self.write_buffer:
+            # 보관 파일에 기록되어야 성공으로 처리 (호출부가 워터마크를 진행해도 종료 시 유실되지 않도록)
+            persisted = self.write_buffer.add_append(sheet_name, rows)
+            if self.write_buffer.should_flush():
+                self.flush_writes()
+            return persisted
+        
+        worksheet = self._get_worksheet(sheet_name)
+        worksheet.append_rows(rows, value_input_option='USER_ENTERED')
+        return True
+    
+    def _update_range(self, sheet_name: str, cell_range: str, values: List[List]) -> bool:
+        """
+        시트의 셀 범위를 수정합니다. 쓰기 버퍼가 있으면 대기열에 넣고 임계치를 넘으면 전송합니다.
+        
+        Args:
+            sheet_name (str): 대상 시트 이름
+            cell_range (str): A1 표기 범위
+            values (List[List]): 범위에 쓸 값
+            
+        Returns:
+            bool: 수정(또는 대기열 등록 및 보관 파일 기록) 성공 여부
+        """
+        if self.write_buffer:
+            # 보관 파일에 기록되어야 성공으로 처리 (호출부가 워터마크를 진행해도 종료 시 유실되지 않도록)
+            persisted = self.write_buffer.add_update(sheet_name, cell_range, values)
+            if self.write_buffer.should_flush():
+                self.flush_writes()
+            return persisted
+        
+        worksheet = self._get_worksheet(sheet_name)
+        worksheet.update(values, cell_range, value_input_option='USER_ENTERED')
+        return True
+    
+    def flush_writes(self) -> bool:
+        """
+        쓰기 버퍼에 쌓인 작업을 모두 전송합니다. (실행 주기 종료 시 호출)
+        
+        Returns:
+            bool: 전송 성공 여부 (실패한 작업은 디스크에 보관되어 다음 전송 때 재시도)
+        """
+        if not self.write_buffer:
+            return True
+        return self.write_buffer.flush(self.document)
+    
     def save_contract_data(self, data_list: List[Dict]) -> bool:
         """
         계약 데이터를 '계약' 시트에 저장합니다.
@@ -436,12 +700,23 @@ class GoogleSheetsClient:
         """
         각 시트의 데이터 개수를 반환합니다.
         
+        로컬 복제본이 있으면 마지막 동기화 시점의 행 수를 사용하며,
+        동기화 이력이 없는 시트만 받아옵니다.
+        
         Returns:
             Dict[str, int]: 시트별 데이터 개수
         """
         stats = {}
         
         for sheet_key, sheet_name in self.sheet_names.items():
+            if self.replica:
+                row_count = self.replica.row_count(sheet_name)
+                if row_count is None and self.sync_sheet_replica(sheet_name):
+                    row_count = self.replica.row_count(sheet_name)
+                if row_count is not None:
+                    stats[sheet_name] = row_count
+                    continue
+            
             _, df = self.get_worksheet_data(sheet_name)
             stats[sheet_name] = len(df) if df is not None else 0
         
@@ -461,15 +736,16 @@ class GoogleSheetsClient:
             
             sheet_name = "거래내역"
             
-            # 시트 존재 여부 확인
+            # 시트 존재 여부 확인 (캐시된 워크시트가 있으면 요청 없이 확인)
             try:
-                worksheet = self.document.worksheet(sheet_name)
+                worksheet = self._get_worksheet(sheet_name)
                 logger.debug(f"'{sheet_name}' 시트가 이미 존재합니다.")
                 return True
             except gspread.exceptions.WorksheetNotFound:
                 # 시트가 없으면 새로 생성
                 logger.info(f"'{sheet_name}' 시트를 생성합니다...")
                 worksheet = self.document.add_worksheet(title=sheet_name, rows=1000, cols=15)
+                self._worksheets[sheet_name] = worksheet
                 
                 # 헤더 추가
                 headers = [
@@ -484,6 +760,7 @@ class GoogleSheetsClient:
                 
         except Exception as e:
             logger.error(f"거래내역 시트 준비 중 오류 발생: {e}")
+            self.invalidate_worksheet_cache("거래내역")
             return False
     
     def save_buy_transaction(self, trade_info: Dict) -> bool:
@@ -507,8 +784,6 @@ class GoogleSheetsClient:
             if not self.ensure_trading_history_sheet():
                 return False
             
-            worksheet = self.document.worksheet("거래내역")
-            
             from decimal import Decimal
             buy_price = trade_info['executed_price']
             quantity = trade_info['quantity']
@@ -532,7 +807,7 @@ class GoogleSheetsClient:
                 trade_info.get('order_number', '')
             ]
             
-            worksheet.append_row(row_data, value_input_option='USER_ENTERED')
+            self._append_rows("거래내역", [row_data])
             logger.info(f"매수 거래 정보 저장 완료: {trade_info['stock_name']}")
             return True
             
@@ -561,43 +836,51 @@ class GoogleSheetsClient:
                 logger.error("스프레드시트에 연결되지 않았습니다.")
                 return False
             
-            worksheet = self.document.worksheet("거래내역")
+            # 매도 기록은 최신 시트 상태 기준으로 행을 찾음
+            if not self._sync_trade_ledger(force=True):
+                return False
+            
+            # 해당 종목의 보유중 거래 찾기 (색인 조회)
+            open_trade = self.trade_ledger.find_open(stock_code)
+            if not open_trade:
+                logger.warning(f"보유중인 거래를 찾을 수 없습니다: {stock_code}")
+                return False
             
-            # 전체 데이터 가져오기
-            all_records = worksheet.get_all_records()
+            row_num, record = open_trade
             
-            # 해당 종목의 보유중 거래 찾기
-            for idx, record in enumerate(all_records):
-                if record['종목코드'] == stock_code and record['상태'] == '보유중':
-                    row_num = idx + 2  # 헤더 행 제외 및 1-based index
-                    
-                    from decimal import Decimal
-                    buy_price = Decimal(str(record['매수가']))
-                    buy_amount = Decimal(str(record['매수금액']))
-                    sell_price = sell_info['executed_price']
-                    quantity = sell_info['quantity']
-                    sell_amount = sell_price * Decimal(str(quantity))
-                    profit = sell_amount - buy_amount
-                    profit_rate = sell_info['profit_rate']
-                    
-                    # 매도 정보 업데이트
-                    worksheet.update_cell(row_num, 7, sell_info['sell_time'].strftime('%Y-%m-%d %H:%M:%S'))  # 매도일시
-                    worksheet.update_cell(row_num, 8, float(sell_price))  # 매도가
-                    worksheet.update_cell(row_num, 9, quantity)  # 매도수량
-                    worksheet.update_cell(row_num, 10, float(sell_amount))  # 매도금액
-                    worksheet.update_cell(row_num, 11, float(profit))  # 수익금
-                    worksheet.update_cell(row_num, 12, float(profit_rate * 100))  # 수익률(%)
-                    worksheet.update_cell(row_num, 13, '매도완료')  # 상태
-                    worksheet.update_cell(row_num, 14, sell_info.get('reason', '매도 체결'))  # 사유
-                    
-                    logger.info(f"매도 거래 정보 업데이트 완료: {record['종목명']} (수익률: {profit_rate*100:.2f}%)")
-                    return True
+            from decimal import Decimal
+            buy_price = self._to_decimal(record['매수가'])
+            buy_amount = self._to_decimal(record['매수금액'])
+            sell_price = sell_info['executed_price']
+            quantity = sell_info['quantity']
+            sell_amount = sell_price * Decimal(str(quantity))
+            profit = sell_amount - buy_amount
+            profit_rate = sell_info['profit_rate']
             
-            logger.warning(f"보유중인 거래를 찾을 수 없습니다: {stock_code}")
-            return False
+            # 매도 정보 업데이트 (매도일시~사유 G:N 열을 한 번에 수정)
+            sell_values = [
+                sell_info['sell_time'].strftime('%Y-%m-%d %H:%M:%S'),  # 매도일시
+                float(sell_price),  # 매도가
+                quantity,  # 매도수량
+                float(sell_amount),  # 매도금액
+                float(profit),  # 수익금
+                float(profit_rate * 100),  # 수익률(%)
+                TradeLedger.CLOSED_STATUS,  # 상태
+                sell_info.get('reason', '매도 체결')  # 사유
+            ]
+            self._update_range("거래내역", f"G{row_num}:N{row_num}", [sell_values])
+            
+            # 색인과 로컬 복제본에도 반영 (다음 동기화 전까지 일관성 유지)
+            self.trade_ledger.mark_closed(stock_code, row_num)
+            if self.replica:
+                self.replica.update_cells("거래내역", row_num - 1, 6, [str(value) for value in sell_values])
+            
+            logger.info(f"매도 거래 정보 업데이트 완료: {record['종목명']} (수익률: {profit_rate*100:.2f}%)")
+            return True
             
         except Exception as e:
             logger.error(f"매도 거래 정보 업데이트 중 오류 발생: {e}")
+            self.invalidate_worksheet_cache("거래내역")
             return False
     
     def get_latest_buy_transaction(self, stock_code: str) -> Optional[Dict]:
@@ -618,27 +901,76 @@ class GoogleSheetsClient:
                 logger.error("스프레드시트에 연결되지 않았습니다.")
                 return None
             
-            worksheet = self.document.worksheet("거래내역")
-            all_records = worksheet.get_all_records()
+            if not self._sync_trade_ledger():
+                return None
             
-            # 해당 종목의 보유중 거래 찾기
-            for record in reversed(all_records):  # 최신 거래부터 확인
-                if record['종목코드'] == stock_code and record['상태'] == '보유중':
-                    from datetime import datetime
-                    from decimal import Decimal
-                    
-                    return {
-                        'buy_date': datetime.strptime(record['매수일시'], '%Y-%m-%d %H:%M:%S'),
-                        'buy_price': Decimal(str(record['매수가'])),
-                        'quantity': int(record['매수수량'])
-                    }
+            # 해당 종목의 보유중 거래 찾기 (최신 거래, 색인 조회)
+            open_trade = self.trade_ledger.find_open(stock_code, latest=True)
+            if not open_trade:
+                return None
             
-            return None
+            from datetime import datetime
+            _, record = open_trade
+            
+            return {
+                'buy_date': datetime.strptime(record['매수일시'], '%Y-%m-%d %H:%M:%S'),
+                'buy_price': self._to_decimal(record['매수가']),
+                'quantity': int(self._to_decimal(record['매수수량']))
+            }
             
         except Exception as e:
             logger.error(f"매수 거래 정보 조회 중 오류 발생: {e}")
+            self.invalidate_worksheet_cache("거래내역")
             return None
     
+    def _sync_trade_ledger(self, force: bool = False) -> bool:
+        """
+        거래내역 색인을 시트와 맞춥니다.
+        
+        로컬 복제본이 있으면 새로 추가된 행만 색인에 반영하고(전체 재동기화된 경우에만 재색인),
+        trade_ledger_sync_seconds 이내에 동기화했다면 요청 없이 기존 색인을 사용합니다.
+        
+        Args:
+            force (bool): 동기화 주기와 관계없이 시트와 맞출지 여부
+            
+        Returns:
+            bool: 동기화 성공 여부
+        """
+        sheet_name = TradeLedger.SHEET_NAME
+        
+        # 아직 전송되지 않은 거래 기록이 있으면 먼저 전송 (행 번호 확정)
+        if self.write_buffer and self.write_buffer.has_pending(sheet_name):
+            if not self.flush_writes():
+                return False
+            force = True
+        
+        sync_interval = GOOGLE_SHEETS_CONFIG.get('trade_ledger_sync_seconds', 30)
+        if not force and self._ledger_synced_at and time.time() - self._ledger_synced_at < sync_interval:
+            return True
+        
+        if self.replica and self.sync_sheet_replica(sheet_name):
+            state = self.replica.get_state(sheet_name)
+            if state['full_synced_at'] != self._ledger_full_synced_at:
+                header, rows = self.replica.get_rows(sheet_name)
+                self.trade_ledger.rebuild(header, rows)
+                self._ledger_full_synced_at = state['full_synced_at']
+            else:
+                _, rows = self.replica.get_rows(sheet_name, start_number=self.trade_ledger.indexed_rows + 1)
+                self.trade_ledger.extend(rows)
+        else:
+            records = self._get_worksheet(sheet_name).get_all_values()
+            self.trade_ledger.rebuild(records[0] if records else [], records[1:])
+            self._ledger_full_synced_at = None
+        
+        self._ledger_synced_at = time.time()
+        logger.debug(f"거래내역 색인 동기화 완료: 보유중 {self.trade_ledger.open_count()}건")
+        return True
+    
+    @staticmethod
+    def _to_decimal(value) -> Decimal:
+        """시트 값(천 단위 구분기호 포함 가능)을 Decimal로 변환합니다."""
+        return Decimal(str(value).replace(',', '').strip())
+    
     def ensure_error_log_sheet(self) -> bool:
         """
         오류 로그 시트가 존재하는지 확인하고, 없으면 생성합니다.
@@ -653,15 +985,16 @@ class GoogleSheetsClient:
             
             sheet_name = "오류"
             
-            # 시트 존재 여부 확인
+            # 시트 존재 여부 확인 (캐시된 워크시트가 있으면 요청 없이 확인)
             try:
-                worksheet = self.document.worksheet(sheet_name)
+                worksheet = self._get_worksheet(sheet_name)
                 logger.debug(f"'{sheet_name}' 시트가 이미 존재합니다.")
                 return True
             except gspread.exceptions.WorksheetNotFound:
                 # 시트가 없으면 새로 생성
                 logger.info(f"'{sheet_name}' 시트를 생성합니다...")
                 worksheet = self.document.add_worksheet(title=sheet_name, rows=1000, cols=10)
+                self._worksheets[sheet_name] = worksheet
                 
                 # 헤더 추가
                 headers = [
@@ -682,6 +1015,7 @@ class GoogleSheetsClient:
                 
         except Exception as e:
             logger.error(f"오류 로그 시트 준비 중 오류 발생: {e}")
+            self.invalidate_worksheet_cache("오류")
             return False
     
     def log_error_to_sheet(self, error_log: Dict) -> bool:
@@ -708,8 +1042,6 @@ class GoogleSheetsClient:
             if not self.ensure_error_log_sheet():
                 return False
             
-            worksheet = self.document.worksheet("오류")
-            
             # 기본값 설정
             from datetime import datetime
             
@@ -728,7 +1060,7 @@ class GoogleSheetsClient:
                 error_log.get('details', '')  # 상세 정보
             ]
             
-            worksheet.append_row(row_data, value_input_option='USER_ENTERED')
+            self._append_rows("오류", [row_data])
             logger.info(f"오류 로그 시트에 기록 완료: {error_log.get('error_type', 'Unknown')}")
             return True
             
@@ -0,0 +1,253 @@
+"""
+구글 스프레드시트 로컬 복제본
+
+이 모듈은 구글 시트의 내용을 SQLite 파일에 복제해 둡니다.
+시트별로 헤더와 동기화된 행 수를 기록하므로, 이후에는 새로 추가된 행만 받아오면 되고
+접수번호 집합과 회사 목록을 매 실행마다 전체 시트를 내려받지 않고 조회할 수 있습니다.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Tuple
+import pandas as pd
+from loguru import logger
+
+
+class SheetReplica:
+    """구글 시트 내용을 SQLite에 복제하여 보관하는 클래스"""
+
+    def __init__(self, db_path: str, source: str = ''):
+        """
+        로컬 복제본을 초기화합니다.
+
+        Args:
+            db_path (str): SQLite 파일 경로
+            source (str): 복제 대상 스프레드시트 식별자 (URL 등, 다른 문서의 데이터와 구분)
+        """
+        self.db_path = db_path
+        self.source = source or ''
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._create_tables()
+
+        logger.info(f"구글 시트 로컬 복제본 초기화 완료: {db_path}")
+
+    def _create_tables(self):
+        """복제본 테이블을 생성합니다."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS sheet_state (
+                    source TEXT NOT NULL,
+                    sheet_name TEXT NOT NULL,
+                    header TEXT NOT NULL,
+                    row_count INTEGER NOT NULL,
+                    synced_at REAL NOT NULL,
+                    full_synced_at REAL NOT NULL,
+                    PRIMARY KEY (source, sheet_name)
+                )
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS sheet_rows (
+                    source TEXT NOT NULL,
+                    sheet_name TEXT NOT NULL,
+                    row_number INTEGER NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (source, sheet_name, row_number)
+                )
+                """
+            )
+
+    def get_state(self, sheet_name: str) -> Optional[Dict]:
+        """
+        시트의 동기화 상태를 반환합니다.
+
+        Args:
+            sheet_name (str): 시트 이름
+
+        Returns:
+            Optional[Dict]: header, row_count, synced_at, full_synced_at (동기화 이력이 없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT header, row_count, synced_at, full_synced_at FROM sheet_state "
+                "WHERE source = ? AND sheet_name = ?",
+                (self.source, sheet_name)
+            ).fetchone()
+
+        if not row:
+            return None
+
+        return {
+            'header': json.loads(row[0]),
+            'row_count': row[1],
+            'synced_at': row[2],
+            'full_synced_at': row[3]
+        }
+
+    def replace(self, sheet_name: str, header: List[str], rows: List[List[str]]):
+        """
+        시트 전체 내용으로 복제본을 교체합니다.
+
+        Args:
+            sheet_name (str): 시트 이름
+            header (List[str]): 헤더 행
+            rows (List[List[str]]): 데이터 행 목록 (헤더 제외)
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM sheet_rows WHERE source = ? AND sheet_name = ?",
+                (self.source, sheet_name)
+            )
+            self._insert_rows(sheet_name, 1, rows)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sheet_state "
+                "(source, sheet_name, header, row_count, synced_at, full_synced_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (self.source, sheet_name, json.dumps(header, ensure_ascii=False), len(rows), now, now)
+            )
+
+    def append(self, sheet_name: str, rows: List[List[str]]):
+        """
+        새로 추가된 행을 복제본 끝에 덧붙입니다.
+
+        Args:
+            sheet_name (str): 시트 이름 (replace()로 한 번 이상 동기화된 시트)
+            rows (List[List[str]]): 추가된 데이터 행 목록
+        """
+        with self._lock, self._conn:
+            row_count = self._conn.execute(
+                "SELECT row_count FROM sheet_state WHERE source = ? AND sheet_name = ?",
+                (self.source, sheet_name)
+            ).fetchone()[0]
+
+            self._insert_rows(sheet_name, row_count + 1, rows)
+            self._conn.execute(
+                "UPDATE sheet_state SET row_count = ?, synced_at = ? WHERE source = ? AND sheet_name = ?",
+                (row_count + len(rows), time.time(), self.source, sheet_name)
+            )
+
+    def _insert_rows(self, sheet_name: str, start_number: int, rows: List[List[str]]):
+        """데이터 행을 저장합니다. (잠금과 트랜잭션을 보유한 상태에서 호출)"""
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO sheet_rows (source, sheet_name, row_number, data) VALUES (?, ?, ?, ?)",
+            (
+                (self.source, sheet_name, start_number + offset, json.dumps(row, ensure_ascii=False))
+                for offset, row in enumerate(rows)
+            )
+        )
+
+    def update_cells(self, sheet_name: str, row_number: int, start_column: int, values: List[str]):
+        """
+        복제된 행의 일부 셀을 수정합니다. (시트에 직접 수정한 내용을 복제본에도 반영)
+
+        Args:
+            sheet_name (str): 시트 이름
+            row_number (int): 데이터 행 번호 (헤더 제외, 1부터 시작)
+            start_column (int): 수정을 시작할 열 위치 (0부터 시작)
+            values (List[str]): 새 값 목록
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT data FROM sheet_rows WHERE source = ? AND sheet_name = ? AND row_number = ?",
+                (self.source, sheet_name, row_number)
+            ).fetchone()
+            if not row:
+                return
+
+            data = json.loads(row[0])
+            end_column = start_column + len(values)
+            if len(data) < end_column:
+                data.extend([''] * (end_column - len(data)))
+            data[start_column:end_column] = values
+
+            self._conn.execute(
+                "UPDATE sheet_rows SET data = ? WHERE source = ? AND sheet_name = ? AND row_number = ?",
+                (json.dumps(data, ensure_ascii=False), self.source, sheet_name, row_number)
+            )
+
+    def get_rows(self, sheet_name: str, start_number: int = 1) -> Tuple[Optional[List[str]], List[List[str]]]:
+        """
+        복제된 헤더와 데이터 행을 반환합니다.
+
+        Args:
+            sheet_name (str): 시트 이름
+            start_number (int): 이 번호(헤더 제외, 1부터 시작)의 행부터 반환
+
+        Returns:
+            Tuple[Optional[List[str]], List[List[str]]]: (헤더 - 동기화 이력이 없으면 None, 데이터 행 목록)
+        """
+        state = self.get_state(sheet_name)
+        if not state:
+            return None, []
+
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT data FROM sheet_rows WHERE source = ? AND sheet_name = ? AND row_number >= ? "
+                "ORDER BY row_number",
+                (self.source, sheet_name, start_number)
+            )
+            rows = [json.loads(data) for (data,) in cursor]
+
+        return state['header'], rows
+
+    def get_dataframe(self, sheet_name: str) -> Optional[pd.DataFrame]:
+        """
+        복제된 시트 내용을 DataFrame으로 반환합니다.
+
+        Args:
+            sheet_name (str): 시트 이름
+
+        Returns:
+            Optional[pd.DataFrame]: 시트 데이터 (동기화 이력이 없으면 None)
+        """
+        header, rows = self.get_rows(sheet_name)
+        if header is None:
+            return None
+
+        return pd.DataFrame(rows, columns=header)
+
+    def row_count(self, sheet_name: str) -> Optional[int]:
+        """
+        복제된 데이터 행 수를 반환합니다.
+
+        Args:
+            sheet_name (str): 시트 이름
+
+        Returns:
+            Optional[int]: 데이터 행 수 (동기화 이력이 없으면 None)
+        """
+        state = self.get_state(sheet_name)
+        return state['row_count'] if state else None
+
+    def invalidate(self, sheet_name: str):
+        """
+        시트의 복제본을 삭제하여 다음 동기화 때 전체를 다시 받도록 합니다.
+
+        Args:
+            sheet_name (str): 시트 이름
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM sheet_rows WHERE source = ? AND sheet_name = ?",
+                (self.source, sheet_name)
+            )
+            self._conn.execute(
+                "DELETE FROM sheet_state WHERE source = ? AND sheet_name = ?",
+                (self.source, sheet_name)
+            )
+
+    def close(self):
+        """SQLite 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
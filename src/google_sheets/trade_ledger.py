@@ -0,0 +1,101 @@
+"""
+거래내역 색인
+
+이 모듈은 '거래내역' 시트의 보유중 거래를 종목코드별로 색인합니다.
+시트 전체를 매번 훑지 않고 종목코드로 보유중 거래의 행 번호와 내용을 바로 찾을 수 있으며,
+새로 추가된 행만 반영하는 증분 갱신을 지원합니다.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+
+class TradeLedger:
+    """'거래내역' 시트의 보유중 거래를 종목코드로 색인하는 클래스"""
+
+    SHEET_NAME = '거래내역'
+    OPEN_STATUS = '보유중'
+    CLOSED_STATUS = '매도완료'
+
+    def __init__(self):
+        """거래내역 색인을 초기화합니다."""
+        # 종목코드 -> [(시트 행 번호, 거래 기록)] (행 번호 오름차순)
+        self._open_positions: Dict[str, List[Tuple[int, Dict[str, str]]]] = {}
+        self._header: List[str] = []
+        self.indexed_rows = 0  # 색인에 반영된 데이터 행 수 (헤더 제외)
+
+    @staticmethod
+    def normalize_code(stock_code) -> str:
+        """
+        종목코드를 색인 키로 변환합니다. (시트에서 숫자로 저장되어 앞자리 0이 빠진 코드 보정)
+
+        Args:
+            stock_code: 종목코드
+
+        Returns:
+            str: 6자리 종목코드 (숫자 코드인 경우)
+        """
+        code = str(stock_code).strip()
+        return code.zfill(6) if code.isdigit() else code
+
+    def rebuild(self, header: List[str], rows: List[List[str]]):
+        """
+        시트 전체 내용으로 색인을 다시 만듭니다.
+
+        Args:
+            header (List[str]): 헤더 행
+            rows (List[List[str]]): 데이터 행 목록 (헤더 제외)
+        """
+        self._open_positions = {}
+        self._header = list(header)
+        self.indexed_rows = 0
+        self.extend(rows)
+
+    def extend(self, rows: List[List[str]]):
+        """
+        새로 추가된 행을 색인에 반영합니다.
+
+        Args:
+            rows (List[List[str]]): 마지막으로 색인한 행 다음부터의 데이터 행 목록
+        """
+        for row in rows:
+            self.indexed_rows += 1
+            record = dict(zip(self._header, row))
+            if record.get('상태') == self.OPEN_STATUS:
+                row_number = self.indexed_rows + 1  # 헤더 행 제외 및 1-based index
+                code = self.normalize_code(record.get('종목코드', ''))
+                self._open_positions.setdefault(code, []).append((row_number, record))
+
+    def find_open(self, stock_code, latest: bool = False) -> Optional[Tuple[int, Dict[str, str]]]:
+        """
+        종목의 보유중 거래를 찾습니다.
+
+        Args:
+            stock_code: 종목코드
+            latest (bool): True이면 가장 최근 거래, False이면 가장 오래된 거래
+
+        Returns:
+            Optional[Tuple[int, Dict[str, str]]]: (시트 행 번호, 거래 기록) (없으면 None)
+        """
+        entries = self._open_positions.get(self.normalize_code(stock_code))
+        if not entries:
+            return None
+        return entries[-1] if latest else entries[0]
+
+    def mark_closed(self, stock_code, row_number: int):
+        """
+        매도 완료된 거래를 색인에서 제거합니다.
+
+        Args:
+            stock_code: 종목코드
+            row_number (int): 시트 행 번호
+        """
+        code = self.normalize_code(stock_code)
+        entries = [entry for entry in self._open_positions.get(code, []) if entry[0] != row_number]
+        if entries:
+            self._open_positions[code] = entries
+        else:
+            self._open_positions.pop(code, None)
+
+    def open_count(self) -> int:
+        """보유중 거래 수를 반환합니다."""
+        return sum(len(entries) for entries in self._open_positions.values())
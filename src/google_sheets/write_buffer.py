@@ -0,0 +1,233 @@
+"""
+구글 스프레드시트 쓰기 버퍼
+
+이 모듈은 시트에 대한 행 추가와 셀 수정을 모아 두었다가 한 번에 전송합니다.
+행 추가는 시트별로 하나의 values.append 요청으로, 셀 수정은 문서 전체에서 하나의
+values.batchUpdate 요청으로 합쳐집니다. 대기 중인 작업은 대기열에 넣을 때마다 디스크에 기록하므로
+전송 전에 프로세스가 종료되어도 다음 실행에서 불러와 다시 전송합니다.
+"""
+
+import os
+import json
+import time
+import threading
+from typing import Dict, List, Optional
+from gspread.utils import absolute_range_name
+from loguru import logger
+
+
+class SheetWriteBuffer:
+    """시트 쓰기 작업을 모아 일괄 전송하는 지연 쓰기 버퍼 클래스"""
+
+    def __init__(self, spill_file: str, max_pending: int = 100, max_delay_seconds: float = 30):
+        """
+        쓰기 버퍼를 초기화합니다.
+
+        Args:
+            spill_file (str): 전송 전/전송 실패한 작업을 보관할 파일 경로
+            max_pending (int): 이 개수 이상의 작업(행/범위)이 쌓이면 전송
+            max_delay_seconds (float): 가장 오래된 작업이 이 시간(초) 이상 대기하면 전송
+        """
+        self.spill_file = spill_file
+        self.max_pending = max_pending
+        self.max_delay_seconds = max_delay_seconds
+
+        # 시트별 추가 행 (입력 순서 유지) / 셀 범위 수정 목록
+        self._appends: Dict[str, List[List]] = {}
+        self._updates: List[Dict] = []
+        self._first_queued_at: Optional[float] = None
+        self._lock = threading.RLock()
+
+        self._load_spill()
+
+    def _load_spill(self):
+        """이전 실행에서 전송하지 못한 작업(전송 전 종료 포함)을 불러옵니다."""
+        if not os.path.exists(self.spill_file):
+            return
+
+        try:
+            with open(self.spill_file, 'r', encoding='utf-8') as f:
+                spilled = json.load(f)
+
+            self._appends = {sheet_name: rows for sheet_name, rows in spilled.get('appends', {}).items() if rows}
+            self._updates = spilled.get('updates', [])
+            if self.pending_count():
+                self._first_queued_at = time.time()
+                logger.warning(f"전송하지 못한 시트 쓰기 작업 {self.pending_count()}건을 불러왔습니다.")
+        except Exception as e:
+            logger.error(f"시트 쓰기 보관 파일을 읽을 수 없습니다: {self.spill_file} ({e})")
+
+    def _spill(self):
+        """전송에 실패하고 남은 작업을 디스크에 보관합니다. (잠금을 보유한 상태에서 호출)"""
+        if self._write_spill():
+            logger.warning(f"시트 쓰기 작업 {self.pending_count()}건을 디스크에 보관했습니다: {self.spill_file}")
+
+    def _write_spill(self) -> bool:
+        """
+        대기 중인 작업 전체를 보관 파일에 기록합니다. (잠금을 보유한 상태에서 호출)
+
+        Returns:
+            bool: 기록 성공 여부
+        """
+        try:
+            directory = os.path.dirname(self.spill_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            temp_path = f"{self.spill_file}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'appends': self._appends, 'updates': self._updates}, f, ensure_ascii=False, default=str)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.spill_file)
+            return True
+        except Exception as e:
+            logger.error(f"시트 쓰기 작업 보관 실패 (메모리에만 유지): {e}")
+            return False
+
+    def _clear_spill(self):
+        """보관 파일을 삭제합니다. (잠금을 보유한 상태에서 호출)"""
+        try:
+            if os.path.exists(self.spill_file):
+                os.remove(self.spill_file)
+        except OSError as e:
+            logger.warning(f"시트 쓰기 보관 파일 삭제 실패: {e}")
+
+    def add_append(self, sheet_name: str, rows: List[List]) -> bool:
+        """
+        시트 끝에 추가할 행을 대기열에 넣고 보관 파일에 기록합니다.
+
+        Args:
+            sheet_name (str): 시트 이름
+            rows (List[List]): 추가할 행 목록
+
+        Returns:
+            bool: 보관 파일 기록 성공 여부 (실패해도 메모리 대기열에는 남아 전송됨)
+        """
+        if not rows:
+            return True
+
+        with self._lock:
+            self._appends.setdefault(sheet_name, []).extend(rows)
+            if self._first_queued_at is None:
+                self._first_queued_at = time.time()
+            return self._write_spill()
+
+    def add_update(self, sheet_name: str, cell_range: str, values: List[List]) -> bool:
+        """
+        셀 범위 수정을 대기열에 넣고 보관 파일에 기록합니다.
+
+        Args:
+            sheet_name (str): 시트 이름
+            cell_range (str): A1 표기 범위 (예: 'G5:N5')
+            values (List[List]): 범위에 쓸 값
+
+        Returns:
+            bool: 보관 파일 기록 성공 여부 (실패해도 메모리 대기열에는 남아 전송됨)
+        """
+        with self._lock:
+            self._updates.append({'range': absolute_range_name(sheet_name, cell_range), 'values': values})
+            if self._first_queued_at is None:
+                self._first_queued_at = time.time()
+            return self._write_spill()
+
+    def pending_count(self) -> int:
+        """대기 중인 작업(추가 행 + 수정 범위) 수를 반환합니다."""
+        with self._lock:
+            return sum(len(rows) for rows in self._appends.values()) + len(self._updates)
+
+    def pending_rows(self, sheet_name: str) -> List[List]:
+        """
+        시트에 아직 전송되지 않은 추가 행을 반환합니다.
+
+        Args:
+            sheet_name (str): 시트 이름
+
+        Returns:
+            List[List]: 대기 중인 행 목록 (복사본)
+        """
+        with self._lock:
+            return list(self._appends.get(sheet_name, []))
+
+    def has_pending(self, sheet_name: Optional[str] = None) -> bool:
+        """
+        대기 중인 작업이 있는지 확인합니다.
+
+        Args:
+            sheet_name (Optional[str]): 시트 이름 (None이면 전체)
+
+        Returns:
+            bool: 대기 작업 존재 여부
+        """
+        with self._lock:
+            if sheet_name is None:
+                return bool(self._appends or self._updates)
+
+            prefix = absolute_range_name(sheet_name, '')
+            return bool(self._appends.get(sheet_name)) or any(
+                update['range'].startswith(prefix) for update in self._updates
+            )
+
+    def should_flush(self) -> bool:
+        """크기 또는 대기 시간 기준을 넘어 전송이 필요한지 확인합니다."""
+        with self._lock:
+            if self._first_queued_at is None:
+                return False
+            return (self.pending_count() >= self.max_pending or
+                    time.time() - self._first_queued_at >= self.max_delay_seconds)
+
+    def flush(self, document) -> bool:
+        """
+        대기 중인 작업을 모두 전송합니다.
+
+        시트별 추가 행은 values.append 한 번으로, 셀 수정은 values.batchUpdate 한 번으로 전송합니다.
+        실패한 작업은 대기열에 남기고 디스크에 보관합니다.
+
+        Args:
+            document: gspread Spreadsheet 객체
+
+        Returns:
+            bool: 모든 작업 전송 성공 여부
+        """
+        with self._lock:
+            if not self._appends and not self._updates:
+                return True
+
+            if document is None:
+                logger.error("스프레드시트에 연결되지 않아 시트 쓰기 작업을 전송할 수 없습니다.")
+                self._spill()
+                return False
+
+            success = True
+
+            for sheet_name in list(self._appends):
+                rows = self._appends[sheet_name]
+                try:
+                    document.values_append(
+                        absolute_range_name(sheet_name),
+                        params={'valueInputOption': 'USER_ENTERED'},
+                        body={'values': rows}
+                    )
+                    del self._appends[sheet_name]
+                    logger.info(f"'{sheet_name}' 시트에 {len(rows)}개의 행을 일괄 추가했습니다.")
+                except Exception as e:
+                    success = False
+                    logger.error(f"'{sheet_name}' 시트 일괄 추가 실패: {e}")
+
+            if self._updates:
+                updates = self._updates
+                try:
+                    document.values_batch_update(body={'valueInputOption': 'USER_ENTERED', 'data': updates})
+                    self._updates = []
+                    logger.info(f"시트 셀 범위 {len(updates)}개를 일괄 수정했습니다.")
+                except Exception as e:
+                    success = False
+                    logger.error(f"시트 셀 일괄 수정 실패: {e}")
+
+            if success:
+                self._first_queued_at = None
+                self._clear_spill()
+            else:
+                self._spill()
+
+            return success
@@ -9,26 +9,35 @@ DART 공시 스크래핑 및 자동매매 시스템 메인 실행 모듈
 
 import time
 import os
-from typing import List, Dict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional
 from loguru import logger
 from datetime import datetime
 
 from config.settings import (
     LOGGING_CONFIG, REQUIRED_FIELDS, SLACK_WEBHOOK_URL, TRADING_CONFIG,
-    SERVICE_ACCOUNT_FILE, GOOGLE_DRIVE_FOLDER_ID
+    SERVICE_ACCOUNT_FILE, GOOGLE_DRIVE_FOLDER_ID, DART_API_CONFIG
 )
 from src.dart_api.client import DartApiClient
+from src.dart_api.watermark import DisclosureWatermarkStore
 from src.dart_api.analyzer import ReportAnalyzer
+from src.dart_api.backfill import ReportBackfillPipeline
 from src.google_sheets.client import GoogleSheetsClient
 from src.utils.slack_notifier import SlackNotifier
 from src.utils.market_schedule import should_run_dart_scraping, get_market_status, is_market_open
 from src.trading.auto_trading_system import AutoTradingSystem
 from src.utils.error_handler import initialize_error_handler, get_error_handler
 
+# 시장 전체 피드 모드의 워터마크 저장 키
+MARKET_FEED_WATERMARK_KEY = '__market__'
+
 
 class DartScrapingSystem:
     """DART 공시 스크래핑 시스템의 메인 클래스"""
     
+    # 상주 모드에서 비정상 구성요소 재연결 시도 최소 간격 (초)
+    RECONNECT_INTERVAL_SECONDS = 300
+    
     def __init__(self):
         """시스템 컴포넌트들을 초기화합니다."""
         print("🚀 DART 스크래핑 및 자동매매 시스템 초기화 시작")
@@ -38,6 +47,10 @@ class DartScrapingSystem:
         
         print("  ├─ DART API 클라이언트 초기화 중...")
         self.dart_client = DartApiClient()
+        # 회사별 공시 검색 워터마크 (마지막 확인 공시 이후만 조회)
+        self.watermark_store = None
+        if DART_API_CONFIG.get('use_watermark', False):
+            self.watermark_store = DisclosureWatermarkStore(DART_API_CONFIG['watermark_file'])
         print("  ├─ 보고서 분석기 초기화 중...")
         self.analyzer = ReportAnalyzer()
         print("  ├─ 구글 시트 클라이언트 초기화 중...")
@@ -59,6 +72,10 @@ class DartScrapingSystem:
         print("  ├─ 자동매매 시스템 초기화 중...")
         self.auto_trading = AutoTradingSystem(self.sheets_client, self.slack_notifier)
         
+        # 신규 계약 알림 (차트 생성/업로드 포함)은 매수 처리 이후 백그라운드에서 전송
+        self.notification_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slack-notifier")
+        self.pending_notifications: List[Future] = []
+        
         # 로깅 설정
         print("  ├─ 로깅 설정 중...")
         self._setup_logging()
@@ -66,6 +83,11 @@ class DartScrapingSystem:
         # 중복 실행 방지 락
         self.lock_file = "logs/trading.lock"
         
+        # 상주 모드 상태 (구성요소를 여러 실행 주기에 걸쳐 재사용)
+        self.sheets_needs_reconnect = True  # 첫 실행 시 연결
+        self.last_reconnect_attempt: Dict[str, float] = {}
+        self.is_stopped = False
+        
         print("✅ DART 스크래핑 및 자동매매 시스템 초기화 완료!")
         logger.info("✅ DART 스크래핑 및 자동매매 시스템이 초기화되었습니다.")
         logger.info("="*80)
@@ -101,12 +123,21 @@ class DartScrapingSystem:
         try:
             result = self._run_with_error_handling()
             print(f"✅ DartScrapingSystem.run() 완료 (결과: {result})")
+            if not result:
+                # 실패한 실행 이후에는 시트 연결을 새로 맺음
+                self.sheets_needs_reconnect = True
             return result
         except Exception as e:
             print(f"❌ DartScrapingSystem.run() 예외 발생: {e}")
+            self.sheets_needs_reconnect = True
             # 전역 예외 처리 - 모든 예상치 못한 오류 캐치
             self._handle_critical_error("시스템 전체 실행 실패", e)
             return False
+        finally:
+            # 이번 실행 주기의 알림 전송 완료 대기 후 쌓인 시트 쓰기 작업 일괄 전송
+            self._wait_for_notifications()
+            self.sheets_client.flush_writes()
+            self.dart_client.flush()
     
     def _run_with_error_handling(self) -> bool:
         """
@@ -149,9 +180,12 @@ class DartScrapingSystem:
                 return False
             print(f"✅ 기존 데이터 로드 완료 (회사 {len(company_list)}개)")
             
-            # 4단계: 각 회사별 공시 처리
+            # 4단계: 각 회사별 공시 처리 (전체 피드 모드에서는 시장 전체 공시를 한 번에 조회)
             print(f"📊 [4/6] {len(company_list)}개 회사의 DART 공시 처리 시작...")
-            total_new_contracts = self._process_companies(company_list, existing_reports)
+            if DART_API_CONFIG.get('scan_mode') == 'market':
+                total_new_contracts = self._process_market_feed(company_list, existing_reports)
+            else:
+                total_new_contracts = self._process_companies(company_list, existing_reports)
             print(f"✅ 공시 처리 완료 (신규 계약: {total_new_contracts}건)")
             
             # 5단계: 완료 알림
@@ -192,10 +226,15 @@ class DartScrapingSystem:
             return False
     
     def _connect_to_sheets(self) -> bool:
-        """구글 스프레드시트에 연결합니다."""
+        """구글 스프레드시트에 연결합니다. (이미 연결된 경우 기존 연결 재사용)"""
+        if self.sheets_client.document and not self.sheets_needs_reconnect:
+            logger.debug("기존 구글 시트 연결을 재사용합니다.")
+            return True
+        
         try:
             success = self.sheets_client.connect()
             if success:
+                self.sheets_needs_reconnect = False
                 # 시트 통계 출력
                 stats = self.sheets_client.get_sheet_statistics()
                 logger.info(f"✅ 구글 시트 연결 성공. 현재 데이터: {stats}")
@@ -224,8 +263,22 @@ class DartScrapingSystem:
             logger.error(f"❌ 기존 데이터 로드 실패: {e}")
             return set(), None
     
-    def _process_companies(self, company_list, existing_reports: set) -> int:
-        """각 회사별로 공시를 처리합니다."""
+    def _process_companies(self, company_list, existing_reports: set,
+                           executor: Optional[Executor] = None) -> int:
+        """
+        각 회사별로 공시를 처리합니다.
+        
+        공시 검색과 보고서 분석은 작업 스레드에서 동시에 수행하고(DART 호출 제한기는 공유),
+        시트 저장, 알림, 자동매매, existing_reports 갱신은 호출 스레드에서만 수행합니다.
+        
+        Args:
+            company_list: 분석 대상 회사 목록 (DataFrame)
+            existing_reports (set): 이미 처리된 접수번호 집합
+            executor (Optional[Executor]): 작업 실행기 (None이면 설정값 기준 스레드 풀 생성)
+            
+        Returns:
+            int: 저장된 신규 계약 수
+        """
         total_companies = len(company_list)
         total_new_contracts = 0
         failed_companies = []
@@ -237,69 +290,88 @@ class DartScrapingSystem:
         logger.info(f"📊 회사별 공시 처리 시작 (총 {total_companies}개 회사)")
         logger.info(f"{'='*60}")
         
-        for idx, (index, company_row) in enumerate(company_list.iterrows()):
-            corp_code = company_row['조회코드']
-            corp_name = company_row['종목명']
-            current_num = idx + 1  # 1부터 시작하는 현재 번호
-            progress = (current_num / total_companies * 100)
-            
-            # 진행 바 생성 (20칸)
-            bar_length = 20
-            filled = int(bar_length * current_num / total_companies)
-            bar = '█' * filled + '░' * (bar_length - filled)
-            
-            # 10개마다 또는 첫 번째/마지막 회사일 때 진행 상황 출력
-            if current_num % 10 == 0 or idx == 0 or current_num == total_companies:
-                print(f"🔍 [{current_num}/{total_companies}] {bar} {progress:.1f}% | 최근: {corp_name[:15]}...")
-            
-            logger.info(f"\n🔎 [{current_num}/{total_companies}] '{corp_name}'({corp_code}) 처리 시작...")
-            self.error_handler.log_operation(
-                module="공시 처리",
-                operation=f"{corp_name} 분석",
-                status="시작",
-                details=f"진행률: {progress:.1f}%"
-            )
+        owns_executor = executor is None
+        if owns_executor:
+            max_workers = max(1, DART_API_CONFIG.get('max_workers', 1))
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dart-worker")
+            logger.info(f"⚙️ 공시 처리 작업 스레드 {max_workers}개로 실행합니다.")
+        
+        try:
+            futures = {
+                executor.submit(self._process_company_disclosures, company_row, existing_reports): company_row
+                for _, company_row in company_list.iterrows()
+            }
             
-            try:
-                # 회사별 공시 처리
-                new_contracts, new_excluded = self._process_company_disclosures(
-                    company_row, existing_reports
-                )
-                
-                # 결과 저장 및 슬랙 알림
-                saved_contracts = self._save_company_results(corp_name, new_contracts, new_excluded)
-                total_new_contracts += saved_contracts
-                
-                # 중요한 결과만 즉시 출력
-                if saved_contracts > 0:
-                    print(f"  ✅ [{current_num}] {corp_name[:20]:20s} → 🎉 신규 계약 {saved_contracts}건 발견!")
-                elif len(new_excluded) > 0:
-                    print(f"  ⚠️ [{current_num}] {corp_name[:20]:20s} → 분석제외 {len(new_excluded)}건")
-                # 신규 없으면 출력 안 함 (로그만)
+            # 처리가 끝난 회사부터 순서대로 결과 저장 (단일 작성자)
+            for idx, future in enumerate(as_completed(futures)):
+                company_row = futures[future]
+                corp_code = company_row['조회코드']
+                corp_name = company_row['종목명']
+                current_num = idx + 1  # 1부터 시작하는 완료 번호
+                progress = (current_num / total_companies * 100)
                 
-                self.error_handler.log_operation(
-                    module="공시 처리",
-                    operation=f"{corp_name} 분석",
-                    status="완료",
-                    details=f"신규 계약: {saved_contracts}건, 제외: {len(new_excluded)}건"
-                )
+                # 진행 바 생성 (20칸)
+                bar_length = 20
+                filled = int(bar_length * current_num / total_companies)
+                bar = '█' * filled + '░' * (bar_length - filled)
                 
-            except Exception as e:
-                print(f"  ❌ [{current_num}] {corp_name[:20]:20s} → 오류: {str(e)[:40]}...")
-                logger.error(f"❌ 회사 '{corp_name}' 처리 중 오류 발생: {e}")
-                failed_companies.append(corp_name)
+                # 10개마다 또는 첫 번째/마지막 회사일 때 진행 상황 출력
+                if current_num % 10 == 0 or idx == 0 or current_num == total_companies:
+                    print(f"🔍 [{current_num}/{total_companies}] {bar} {progress:.1f}% | 최근: {corp_name[:15]}...")
                 
-                # 오류 처리 (시트 기록 + 로그, 슬랙 알림은 생략)
-                self.error_handler.handle_error(
-                    error=e,
-                    module="공시 처리",
-                    operation=f"{corp_name} 공시 분석",
-                    severity='WARNING',
-                    related_stock=f"{corp_name}({corp_code})",
-                    send_slack=False,  # 개별 회사 오류는 슬랙 스팸 방지
-                    log_to_sheet=True
-                )
-                continue
+                try:
+                    # 회사별 공시 처리 결과
+                    new_contracts, new_excluded, new_watermark = future.result()
+                    
+                    # 처리된 보고서로 표시
+                    for report_data in new_contracts + new_excluded:
+                        existing_reports.add(report_data['접수번호'])
+                    
+                    # 결과 저장 및 슬랙 알림
+                    saved_contracts, save_success = self._save_company_results(corp_name, new_contracts, new_excluded)
+                    total_new_contracts += saved_contracts
+                    
+                    # 저장까지 성공한 경우에만 워터마크 전진 (실패 시 다음 실행에서 재조회)
+                    if self.watermark_store and new_watermark and save_success:
+                        self.watermark_store.update(corp_code, new_watermark)
+                    
+                    # 중요한 결과만 즉시 출력
+                    if saved_contracts > 0:
+                        print(f"  ✅ [{current_num}] {corp_name[:20]:20s} → 🎉 신규 계약 {saved_contracts}건 발견!")
+                    elif len(new_excluded) > 0:
+                        print(f"  ⚠️ [{current_num}] {corp_name[:20]:20s} → 분석제외 {len(new_excluded)}건")
+                    # 신규 없으면 출력 안 함 (로그만)
+                    
+                    self.error_handler.log_operation(
+                        module="공시 처리",
+                        operation=f"{corp_name} 분석",
+                        status="완료",
+                        details=f"신규 계약: {saved_contracts}건, 제외: {len(new_excluded)}건 (진행률: {progress:.1f}%)"
+                    )
+                    
+                except Exception as e:
+                    print(f"  ❌ [{current_num}] {corp_name[:20]:20s} → 오류: {str(e)[:40]}...")
+                    logger.error(f"❌ 회사 '{corp_name}' 처리 중 오류 발생: {e}")
+                    failed_companies.append(corp_name)
+                    
+                    # 오류 처리 (시트 기록 + 로그, 슬랙 알림은 생략)
+                    self.error_handler.handle_error(
+                        error=e,
+                        module="공시 처리",
+                        operation=f"{corp_name} 공시 분석",
+                        severity='WARNING',
+                        related_stock=f"{corp_name}({corp_code})",
+                        send_slack=False,  # 개별 회사 오류는 슬랙 스팸 방지
+                        log_to_sheet=True
+                    )
+                    continue
+        finally:
+            if owns_executor:
+                executor.shutdown(wait=True)
+        
+        # 워터마크 저장
+        if self.watermark_store:
+            self.watermark_store.save()
         
         # 마지막 진행 상황 줄바꿈
         print()
@@ -327,14 +399,111 @@ class DartScrapingSystem:
         
         return total_new_contracts
     
+    def _process_market_feed(self, company_list, existing_reports: set) -> int:
+        """
+        시장 전체 공시 피드를 조회하여 분석 대상 회사의 공시만 처리합니다.
+        
+        회사별로 list.json을 호출하는 대신 corp_code 없이 당일 공시를 페이지 단위로 조회한 뒤,
+        '조회코드' 인덱스와 메모리에서 조인합니다.
+        
+        Returns:
+            int: 저장된 신규 계약 수
+        """
+        total_new_contracts = 0
+        
+        # 조회코드 → 회사 정보 인덱스
+        company_index = {}
+        for _, company_row in company_list.iterrows():
+            corp_code = str(company_row['조회코드']).strip().zfill(8)
+            company_index[corp_code] = company_row
+        
+        logger.info(f"📡 시장 전체 공시 피드 조회 시작 (분석 대상 {len(company_index)}개 회사)")
+        self.error_handler.log_api_call(
+            api_name="DART API",
+            endpoint="/api/list.json",
+            method="GET",
+            params={'scan_mode': 'market'},
+            status='시작'
+        )
+        
+        watermark = self.watermark_store.get(MARKET_FEED_WATERMARK_KEY) if self.watermark_store else None
+        disclosures, new_watermark = self.dart_client.search_market_disclosures(watermark)
+        
+        self.error_handler.log_api_call(
+            api_name="DART API",
+            endpoint="/api/list.json",
+            status='성공' if new_watermark else '실패',
+            response_code=200 if new_watermark else None
+        )
+        
+        # 분석 대상 회사의 공시만 회사별로 묶기
+        disclosures_by_company = {}
+        for disclosure in disclosures:
+            corp_code = str(disclosure.get('corp_code', '')).zfill(8)
+            if corp_code in company_index:
+                disclosures_by_company.setdefault(corp_code, []).append(disclosure)
+        
+        print(f"  └─ 관련 공시 {len(disclosures)}건 중 분석 대상 회사 공시 {sum(len(v) for v in disclosures_by_company.values())}건")
+        logger.info(f"✅ 시장 전체 공시 {len(disclosures)}건 중 분석 대상 회사 {len(disclosures_by_company)}곳의 공시를 처리합니다.")
+        
+        for corp_code, company_disclosures in disclosures_by_company.items():
+            company_row = company_index[corp_code]
+            corp_name = company_row['종목명']
+            
+            try:
+                new_contracts, new_excluded, all_analyzed = self._analyze_new_disclosures(
+                    company_row, company_disclosures, existing_reports
+                )
+                
+                # 처리된 보고서로 표시
+                for report_data in new_contracts + new_excluded:
+                    existing_reports.add(report_data['접수번호'])
+                
+                saved_contracts, save_success = self._save_company_results(corp_name, new_contracts, new_excluded)
+                total_new_contracts += saved_contracts
+                
+                if saved_contracts > 0:
+                    print(f"  ✅ {corp_name[:20]:20s} → 🎉 신규 계약 {saved_contracts}건 발견!")
+                
+                if not (all_analyzed and save_success):
+                    new_watermark = None
+                    
+            except Exception as e:
+                logger.error(f"❌ 회사 '{corp_name}' 처리 중 오류 발생: {e}")
+                new_watermark = None
+                self.error_handler.handle_error(
+                    error=e,
+                    module="공시 처리",
+                    operation=f"{corp_name} 공시 분석",
+                    severity='WARNING',
+                    related_stock=f"{corp_name}({corp_code})",
+                    send_slack=False,  # 개별 회사 오류는 슬랙 스팸 방지
+                    log_to_sheet=True
+                )
+        
+        # 모든 공시를 처리한 경우에만 워터마크 전진 (실패 시 다음 실행에서 재조회)
+        if self.watermark_store and new_watermark:
+            self.watermark_store.update(MARKET_FEED_WATERMARK_KEY, new_watermark)
+            self.watermark_store.save()
+        
+        logger.info(f"📊 시장 전체 공시 처리 완료 (신규 계약: {total_new_contracts}건)")
+        return total_new_contracts
+    
     def _process_company_disclosures(self, company_row, existing_reports: set) -> tuple:
-        """특정 회사의 공시를 처리합니다."""
+        """
+        특정 회사의 공시를 처리합니다.
+        
+        Returns:
+            tuple: (신규 계약 목록, 분석제외 목록, 새 워터마크 - 갱신 불가 시 None)
+        """
         corp_code = company_row['조회코드']
         corp_name = company_row['종목명']
         
         new_contracts = []
         new_excluded = []
         
+        logger.info(f"\n🔎 '{corp_name}'({corp_code}) 처리 시작...")
+        
         # 1단계: 공시 검색
         logger.info(f"  → 1단계: DART API 공시 검색 중...")
         self.error_handler.log_api_call(
@@ -345,7 +514,8 @@ class DartScrapingSystem:
             status='시작'
         )
         
-        disclosures = self.dart_client.search_disclosures_all_pages(corp_code)
+        watermark = self.watermark_store.get(corp_code) if self.watermark_store else None
+        disclosures, new_watermark = self.dart_client.search_disclosures_since(corp_code, watermark)
         
         if not disclosures:
             logger.info(f"  ✅ 공시 검색 완료 → 관련 공시 없음")
@@ -355,7 +525,7 @@ class DartScrapingSystem:
                 status='성공',
                 response_code=200
             )
-            return new_contracts, new_excluded
+            return new_contracts, new_excluded, new_watermark
         
         logger.info(f"  ✅ 공시 검색 완료 → {len(disclosures)}개 발견")
         self.error_handler.log_api_call(
@@ -366,6 +536,29 @@ class DartScrapingSystem:
         )
         
         # 2단계: 각 공시별 처리
+        new_contracts, new_excluded, all_analyzed = self._analyze_new_disclosures(
+            company_row, disclosures, existing_reports
+        )
+        if not all_analyzed:
+            # 다음 실행에서 다시 조회되도록 워터마크를 유지
+            new_watermark = None
+        
+        return new_contracts, new_excluded, new_watermark
+    
+    def _analyze_new_disclosures(self, company_row, disclosures: List[Dict], existing_reports: set) -> tuple:
+        """
+        회사의 공시 목록 중 아직 처리되지 않은 공시를 분석하고 분류합니다.
+        
+        작업 스레드에서 호출되므로 existing_reports는 읽기만 하며,
+        처리 완료 표시는 결과를 저장하는 쪽에서 수행합니다.
+        
+        Returns:
+            tuple: (신규 계약 목록, 분석제외 목록, 모든 신규 공시 분석 성공 여부)
+        """
+        new_contracts = []
+        new_excluded = []
+        all_analyzed = True
+        
         for disclosure in disclosures:
             rcept_no = disclosure['rcept_no']
             
@@ -379,6 +572,7 @@ class DartScrapingSystem:
             contract_data = self._analyze_disclosure(disclosure, company_row)
             if not contract_data:
                 logger.warning(f"   - 보고서({rcept_no}) 분석 실패. 건너뜁니다.")
+                all_analyzed = False
                 continue
             
             # 4단계: 데이터 완전성 검증 및 분류
@@ -389,13 +583,7 @@ class DartScrapingSystem:
                 new_excluded.append(contract_data)
                 logger.info(f"   ⚠️ 불완전한 데이터. '분석제외' 시트로 분류됩니다.")
             
-            # 처리된 보고서로 표시
-            existing_reports.add(rcept_no)
-            
-            # API 호출 제한 준수
-            time.sleep(0.5)
-        
-        return new_contracts, new_excluded
+        return new_contracts, new_excluded, all_analyzed
     
     def _analyze_disclosure(self, disclosure: Dict, company_row) -> Dict:
         """개별 공시를 분석합니다."""
@@ -415,26 +603,35 @@ class DartScrapingSystem:
             cleaned_data = self.analyzer.clean_extracted_data(extracted_data)
             
             # 4단계: 회사 정보와 공시 정보 결합
-            report_url = f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={rcept_no}"
-            
-            final_data = {
-                **company_row.to_dict(),  # 회사 기본 정보
-                '접수일자': disclosure['rcept_dt'],
-                '보고서명': disclosure['report_nm'],
-                '접수번호': rcept_no,
-                '보고서링크': report_url,
-                **cleaned_data  # 추출된 계약 정보
-            }
-            
-            return final_data
+            return self._build_report_record(disclosure, company_row, cleaned_data)
             
         except Exception as e:
             logger.error(f"   - 공시({rcept_no}) 분석 중 오류 발생: {e}")
             return None
     
-    def _save_company_results(self, corp_name: str, new_contracts: List, new_excluded: List) -> int:
-        """회사별 처리 결과를 저장하고 슬랙 알림을 전송합니다."""
+    def _build_report_record(self, disclosure: Dict, company_row, cleaned_data: Dict) -> Dict:
+        """회사 정보, 공시 정보, 추출된 계약 정보를 하나의 시트 행 데이터로 결합합니다."""
+        rcept_no = disclosure['rcept_no']
+        report_url = f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={rcept_no}"
+        
+        return {
+            **company_row.to_dict(),  # 회사 기본 정보
+            '접수일자': disclosure['rcept_dt'],
+            '보고서명': disclosure['report_nm'],
+            '접수번호': rcept_no,
+            '보고서링크': report_url,
+            **cleaned_data  # 추출된 계약 정보
+        }
+    
+    def _save_company_results(self, corp_name: str, new_contracts: List, new_excluded: List) -> tuple:
+        """
+        회사별 처리 결과를 저장하고 슬랙 알림을 전송합니다.
+        
+        Returns:
+            tuple: (저장된 계약 수, 전체 저장 성공 여부)
+        """
         saved_contracts_count = 0
+        all_saved = True
         
         try:
             # 계약 데이터 저장
@@ -444,10 +641,7 @@ class DartScrapingSystem:
                     saved_contracts_count = len(new_contracts)
                     logger.info(f"   ✅ '{corp_name}': {len(new_contracts)}개 계약 데이터 저장 완료")
                     
-                    # 슬랙 알림 전송
-                    self.slack_notifier.send_new_contract_notification(new_contracts)
-                    
-                    # 자동매매 처리: 각 신규 계약에 대해 매수 조건 확인
+                    # 자동매매 처리: 각 신규 계약에 대해 매수 조건 확인 (알림보다 먼저 주문)
                     for contract in new_contracts:
                         try:
                             self.auto_trading.process_new_contract(contract)
@@ -455,7 +649,11 @@ class DartScrapingSystem:
                             logger.error(f"자동매매 처리 중 오류 발생: {e}")
                             # 자동매매 실패는 시스템을 중단시키지 않음
                     
+                    # 슬랙 알림 전송 (차트 생성/업로드는 백그라운드에서 수행)
+                    self._send_contract_notification_async(new_contracts)
+                    
                 else:
+                    all_saved = False
                     logger.error(f"   ❌ '{corp_name}': 계약 데이터 저장 실패")
                     # 데이터 저장 실패는 중요한 오류이므로 슬랙 알림
                     self.slack_notifier.send_system_notification(
@@ -469,6 +667,7 @@ class DartScrapingSystem:
                 if success:
                     logger.info(f"   ✅ '{corp_name}': {len(new_excluded)}개 분석제외 데이터 저장 완료")
                 else:
+                    all_saved = False
                     logger.error(f"   ❌ '{corp_name}': 분석제외 데이터 저장 실패")
             
             # 새로운 데이터가 없는 경우
@@ -476,6 +675,7 @@ class DartScrapingSystem:
                 logger.info(f" -> '{corp_name}': 새로운 공시가 없습니다.")
                 
         except Exception as e:
+            all_saved = False
             logger.error(f"'{corp_name}' 결과 저장 중 오류 발생: {e}")
             # 저장 오류는 중요하므로 슬랙 알림
             self.slack_notifier.send_system_notification(
@@ -483,7 +683,189 @@ class DartScrapingSystem:
                 "error"
             )
         
-        return saved_contracts_count
+        return saved_contracts_count, all_saved
+    
+    def health_check(self) -> Dict[str, bool]:
+        """
+        상주 모드에서 재사용 중인 구성요소의 상태를 확인합니다.
+        
+        Returns:
+            Dict[str, bool]: 구성요소별 정상 여부
+        """
+        return {
+            'dart_api': not self.is_stopped and self.dart_client.is_healthy(),
+            'google_sheets': bool(self.sheets_client.document) and not self.sheets_needs_reconnect,
+            'auto_trading': self.auto_trading.health_check()
+        }
+    
+    def reconnect(self, component: str) -> bool:
+        """
+        구성요소를 다시 연결합니다.
+        
+        Args:
+            component: 'dart_api', 'google_sheets', 'auto_trading' 중 하나
+            
+        Returns:
+            bool: 재연결 성공 여부
+        """
+        # 인증 엔드포인트를 반복 호출하지 않도록 재연결 시도 간격 제한
+        now = time.time()
+        last_attempt = self.last_reconnect_attempt.get(component, 0)
+        if now - last_attempt < self.RECONNECT_INTERVAL_SECONDS:
+            logger.debug(f"'{component}' 재연결 대기 중 ({now - last_attempt:.0f}초 전 시도)")
+            return False
+        self.last_reconnect_attempt[component] = now
+        
+        logger.info(f"🔄 '{component}' 재연결 시도...")
+        try:
+            if component == 'dart_api':
+                self.dart_client.reset_session()
+                self.is_stopped = False
+                return True
+            if component == 'google_sheets':
+                self.sheets_needs_reconnect = True
+                return self._connect_to_sheets()
+            if component == 'auto_trading':
+                return self.auto_trading.reconnect()
+            
+            logger.warning(f"알 수 없는 구성요소: {component}")
+            return False
+            
+        except Exception as e:
+            logger.error(f"❌ '{component}' 재연결 중 오류 발생: {e}")
+            return False
+    
+    def ensure_healthy(self) -> bool:
+        """
+        상태 점검 후 비정상 구성요소를 재연결합니다. (상주 모드의 실행 주기 사이에 호출)
+        
+        Returns:
+            bool: 모든 구성요소 정상 여부
+        """
+        status = self.health_check()
+        unhealthy = [component for component, healthy in status.items() if not healthy]
+        if not unhealthy:
+            return True
+        
+        logger.warning(f"⚠️ 비정상 구성요소 발견: {', '.join(unhealthy)}")
+        results = [self.reconnect(component) for component in unhealthy]
+        return all(results)
+    
+    def _send_contract_notification_async(self, contracts: List[Dict]):
+        """
+        신규 계약 알림을 백그라운드 스레드에서 전송합니다.
+        
+        Args:
+            contracts (List[Dict]): 신규 계약 정보 목록
+        """
+        future = self.notification_executor.submit(
+            self.slack_notifier.send_new_contract_notification, list(contracts)
+        )
+        self.pending_notifications.append(future)
+    
+    def _wait_for_notifications(self):
+        """백그라운드에서 전송 중인 신규 계약 알림이 모두 끝날 때까지 기다립니다."""
+        pending, self.pending_notifications = self.pending_notifications, []
+        for future in pending:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"신규 계약 알림 전송 중 오류 발생: {e}")
+    
+    def stop(self):
+        """상주 모드 종료 시 연결과 저장 중인 상태를 정리합니다."""
+        if self.is_stopped:
+            return
+        self.is_stopped = True
+        
+        if self.watermark_store:
+            self.watermark_store.save()
+        self._wait_for_notifications()
+        self.notification_executor.shutdown(wait=True)
+        self.sheets_client.flush_writes()
+        self.dart_client.close()
+        self.auto_trading.stop()
+        logger.info("🛑 DART 스크래핑 시스템을 종료했습니다.")
+    
+    def run_backfill(self) -> bool:
+        """
+        분석 대상 회사의 과거 공시 중 아직 처리되지 않은 공시를 대량으로 재처리합니다.
+        
+        신규 회사 추가나 검색 조건 변경 후 사용합니다. 보고서 다운로드는 스레드 풀,
+        분석은 프로세스 풀에서 수행하고, 시트 저장은 결과가 입력 순서대로 도착하는 대로
+        배치 단위로 수행합니다. 과거 공시이므로 슬랙 알림과 자동매매는 수행하지 않습니다.
+        
+        Returns:
+            bool: 실행 성공 여부
+        """
+        logger.info("📦 공시 백필을 시작합니다.")
+        
+        if not self._connect_to_sheets():
+            return False
+        
+        existing_reports, company_list = self._load_existing_data()
+        if company_list is None:
+            return False
+        
+        # 1단계: 회사별 전체 기간 공시 검색 (워터마크 무시, 호출 제한기 공유)
+        companies = [company_row for _, company_row in company_list.iterrows()]
+        max_workers = max(1, DART_API_CONFIG.get('max_workers', 1))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dart-worker") as executor:
+            search_results = executor.map(
+                lambda company_row: self.dart_client.search_disclosures_all_pages(company_row['조회코드']),
+                companies
+            )
+            jobs = [
+                (disclosure, company_row)
+                for company_row, disclosures in zip(companies, search_results)
+                for disclosure in disclosures
+                if disclosure['rcept_no'] not in existing_reports
+            ]
+        
+        print(f"📦 백필 대상 공시 {len(jobs)}건 (회사 {len(companies)}개)")
+        logger.info(f"📦 백필 대상 공시 {len(jobs)}건 (회사 {len(companies)}개)")
+        if not jobs:
+            return True
+        
+        # 2단계: 다운로드/분석 파이프라인 실행 및 배치 저장
+        batch_size = DART_API_CONFIG.get('backfill_batch_size', 50)
+        pipeline = ReportBackfillPipeline(self.dart_client, parser_engine=self.analyzer.parser_engine)
+        contracts_batch, excluded_batch = [], []
+        saved_contracts = saved_excluded = failed = 0
+        all_saved = True
+        
+        for idx, (disclosure, company_row, cleaned_data) in enumerate(pipeline.run(jobs), start=1):
+            if cleaned_data is None:
+                failed += 1
+            else:
+                record = self._build_report_record(disclosure, company_row, cleaned_data)
+                if self.analyzer.validate_extracted_data(record):
+                    contracts_batch.append(record)
+                else:
+                    excluded_batch.append(record)
+                existing_reports.add(disclosure['rcept_no'])
+            
+            if len(contracts_batch) + len(excluded_batch) >= batch_size or idx == len(jobs):
+                if contracts_batch:
+                    if self.sheets_client.save_contract_data(contracts_batch):
+                        saved_contracts += len(contracts_batch)
+                    else:
+                        all_saved = False
+                if excluded_batch:
+                    if self.sheets_client.save_excluded_data(excluded_batch):
+                        saved_excluded += len(excluded_batch)
+                    else:
+                        all_saved = False
+                contracts_batch, excluded_batch = [], []
+                if not self.sheets_client.flush_writes():
+                    all_saved = False
+                print(f"  └─ [{idx}/{len(jobs)}] 계약 {saved_contracts}건, 분석제외 {saved_excluded}건 저장, 실패 {failed}건")
+        
+        self.dart_client.flush()
+        summary = f"📦 공시 백필 완료: 계약 {saved_contracts}건, 분석제외 {saved_excluded}건 저장, 분석 실패 {failed}건"
+        print(summary)
+        logger.info(summary)
+        return all_saved
     
     def _send_startup_notification(self):
         """
@@ -740,8 +1122,13 @@ def release_lock(lock_file: str):
         logger.error(f"락 해제 중 오류 발생: {e}")
 
 
-def main():
-    """메인 실행 함수"""
+def main(backfill: bool = False):
+    """
+    메인 실행 함수
+    
+    Args:
+        backfill: True면 정규 스크래핑 대신 과거 공시 백필을 실행
+    """
     lock_file = "logs/trading.lock"
     
     # 중복 실행 방지
@@ -750,7 +1137,7 @@ def main():
     
     try:
         system = DartScrapingSystem()
-        success = system.run()
+        success = system.run_backfill() if backfill else system.run()
         
         if success:
             logger.info("✅ 시스템이 성공적으로 완료되었습니다.")
@@ -5,12 +5,14 @@
 """
 
 from src.trading.kiwoom_client import KiwoomAPIClient
+from src.trading.order_events import OrderEventStream
 from src.trading.order_manager import OrderManager
 from src.trading.position_manager import PositionManager
 from src.trading.trading_strategy import TradingStrategy
 
 __all__ = [
     'KiwoomAPIClient',
+    'OrderEventStream',
     'OrderManager',
     'PositionManager',
     'TradingStrategy',
@@ -19,28 +19,37 @@ from config.settings import (
 )
 
 from src.trading.kiwoom_client import KiwoomAPIClient
+from src.trading.order_events import OrderEventStream, create_order_event_stream
 from src.trading.order_manager import OrderManager
 from src.trading.position_manager import PositionManager
 from src.trading.trading_strategy import TradingStrategy
+from src.trading.warmup import TradingWarmup
 from src.google_sheets.client import GoogleSheetsClient
 from src.utils.slack_notifier import SlackNotifier
-from src.utils.stock_analyzer import StockAnalyzer
+from src.utils.stock_analyzer import get_stock_analyzer
 
 
 class AutoTradingSystem:
     """자동매매 시스템 메인 클래스"""
     
-    def __init__(self, sheets_client: GoogleSheetsClient, slack_notifier: SlackNotifier):
+    def __init__(self, sheets_client: GoogleSheetsClient, slack_notifier: SlackNotifier,
+                 kiwoom_client: Optional[KiwoomAPIClient] = None,
+                 order_events: Optional[OrderEventStream] = None):
         """
         자동매매 시스템을 초기화합니다.
         
         Args:
             sheets_client: 구글 시트 클라이언트
             slack_notifier: 슬랙 알림 클라이언트
+            kiwoom_client: 키움증권 API 클라이언트 (None이면 설정값으로 생성, 로컬 시뮬레이터 연결 시 지정)
+            order_events: 실시간 주문체결 수신기 (None이면 start_order_stream() 호출 전까지 체결 조회 API 사용)
         """
         self.sheets_client = sheets_client
         self.slack_notifier = slack_notifier
-        self.stock_analyzer = StockAnalyzer()
+        self.stock_analyzer = get_stock_analyzer()  # 슬랙 알림과 같은 분석 결과 사용
+        self.warmup: Optional[TradingWarmup] = None
+        self.order_events: Optional[OrderEventStream] = None
+        self.order_stream_requested = False  # 상주 모드에서 웹소켓 수신을 요청했는지 (재연결 시 다시 연결)
         
         # 거래 모드 확인
         self.trading_enabled = TRADING_MODE == 'LIVE'
@@ -56,7 +65,7 @@ class AutoTradingSystem:
         
         # 거래 시스템 초기화
         try:
-            self.kiwoom_client = KiwoomAPIClient(
+            self.kiwoom_client = kiwoom_client or KiwoomAPIClient(
                 app_key=KIWOOM_APP_KEY,
                 app_secret=KIWOOM_APP_SECRET,
                 account_number=KIWOOM_ACCOUNT_NUMBER
@@ -100,7 +109,9 @@ class AutoTradingSystem:
                 
                 return
             
-            self.order_mgr = OrderManager(self.kiwoom_client)
+            self._attach_order_events(order_events)
+            
+            self.order_mgr = OrderManager(self.kiwoom_client, order_events=self.order_events)
             self.position_mgr = PositionManager(self.kiwoom_client)
             self.trading_strategy = TradingStrategy(
                 self.kiwoom_client,
@@ -145,6 +156,123 @@ class AutoTradingSystem:
             except Exception as log_error:
                 logger.error(f"오류 로그 시트 기록 실패: {log_error}")
     
+    def _attach_order_events(self, order_events: Optional[OrderEventStream]):
+        """
+        실시간 주문체결 수신기를 연결합니다. (None이면 체결 조회 API로 확인)
+        
+        Args:
+            order_events: 사용할 수신기
+        """
+        # 체결되면 예수금/보유 수량이 바뀌므로 보관된 계좌 정보 폐기
+        if order_events is not None:
+            order_events.add_listener(self.kiwoom_client.invalidate_account_snapshot)
+        
+        self.order_events = order_events
+        if hasattr(self, 'order_mgr'):
+            self.order_mgr.order_events = order_events
+    
+    def start_order_stream(self) -> bool:
+        """
+        키움증권 웹소켓 실시간 주문체결 수신을 시작합니다. (상주 모드에서 호출)
+        
+        수신 스레드는 연결이 끊겨도 계속 재연결하므로, 인스턴스가 실행 주기마다 새로 만들어지는
+        경우에는 호출하지 않습니다. (stop()으로 중지)
+        
+        Returns:
+            bool: 수신기 사용 여부 (거래 비활성화, 설정으로 끈 경우, 연결할 수 없는 경우 False)
+        """
+        if not TRADING_CONFIG.get('use_order_stream', True):
+            return False
+        
+        # 초기화 시 인증에 실패했더라도 reconnect()에서 연결하도록 요청 기록
+        self.order_stream_requested = True
+        if not self.trading_enabled or not hasattr(self, 'kiwoom_client'):
+            return False
+        
+        if self.order_events is None:
+            self._attach_order_events(create_order_event_stream(self.kiwoom_client))
+        return self.order_events is not None
+    
+    def start_warmup(self) -> bool:
+        """
+        개장 전 거래 경로 준비와 장중 연결 유지를 시작합니다. (상주 모드에서 호출)
+        
+        Returns:
+            bool: 시작 여부 (거래 비활성화 또는 설정으로 끈 경우 False)
+        """
+        if not self.trading_enabled or not TRADING_CONFIG.get('use_warmup', True):
+            return False
+        if self.warmup is not None:
+            return True
+        
+        self.warmup = TradingWarmup(
+            self,
+            minutes_before_open=TRADING_CONFIG.get('warmup_minutes_before_open', 10),
+            keepalive_seconds=TRADING_CONFIG.get('warmup_keepalive_seconds', 30)
+        ).start()
+        return True
+    
+    def stop(self):
+        """거래 경로 준비 스레드와 실시간 주문체결 수신을 중지합니다."""
+        if self.warmup is not None:
+            self.warmup.stop()
+            self.warmup = None
+        if self.order_events is not None:
+            self.order_events.stop()
+    
+    def health_check(self) -> bool:
+        """
+        자동매매 구성요소가 사용 가능한 상태인지 확인합니다.
+        
+        Returns:
+            bool: 정상 여부 (거래가 설정되지 않은 DRY_RUN 등은 항상 정상)
+        """
+        # 키움증권 클라이언트가 없는 경우 (DRY_RUN 또는 설정 누락) 점검 대상 아님
+        if not hasattr(self, 'kiwoom_client'):
+            return True
+        
+        if not self.trading_enabled:
+            return False
+        
+        # 토큰이 없거나 만료된 경우 (다음 API 호출 시 자동 재인증되지만 미리 확인)
+        return bool(
+            self.kiwoom_client.access_token
+            and self.kiwoom_client.token_expires_at
+            and datetime.now() < self.kiwoom_client.token_expires_at
+        )
+    
+    def reconnect(self) -> bool:
+        """
+        키움증권 API를 다시 인증하고 거래 구성요소를 재구성합니다.
+        
+        Returns:
+            bool: 재연결 성공 여부
+        """
+        if not hasattr(self, 'kiwoom_client'):
+            return True
+        
+        logger.info("🔄 키움증권 API 재연결 시도...")
+        if not self.kiwoom_client.authenticate():
+            logger.error("❌ 키움증권 API 재연결 실패")
+            self.trading_enabled = False
+            return False
+        
+        # 초기화 시 인증 실패로 실시간 주문체결 수신을 만들지 못한 경우 지금 연결
+        if self.order_stream_requested and self.order_events is None:
+            self._attach_order_events(create_order_event_stream(self.kiwoom_client))
+        
+        self.order_mgr = OrderManager(self.kiwoom_client, order_events=self.order_events)
+        self.position_mgr = PositionManager(self.kiwoom_client)
+        self.trading_strategy = TradingStrategy(
+            self.kiwoom_client,
+            self.order_mgr,
+            self.position_mgr
+        )
+        self.trading_enabled = True
+        
+        logger.info("✅ 키움증권 API 재연결 완료 - 자동매매가 다시 활성화되었습니다")
+        return True
+    
     def process_new_contract(self, contract_data: dict) -> bool:
         """
         신규 계약 정보를 처리하고 매수 조건을 확인합니다.
@@ -167,9 +295,9 @@ class AutoTradingSystem:
             logger.info(f"신규 계약 처리: {stock_name}({stock_code})")
             logger.info(f"{'='*60}")
             
-            # 1. 주식 분석 수행
+            # 1. 주식 분석 수행 (매수 판단에 필요 없는 차트는 생성하지 않음)
             logger.info("1단계: 주식 분석 수행...")
-            analysis_result = self.stock_analyzer.analyze_stock_for_contract(contract_data)
+            analysis_result = self.stock_analyzer.analyze_stock_for_contract(contract_data, include_chart=False)
             
             if not analysis_result:
                 logger.warning("주식 분석 실패")
@@ -7,61 +7,29 @@
 
 import os
 import time
+import threading
 import requests
-from typing import Dict, Optional, Any
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Tuple
 from decimal import Decimal
 from datetime import datetime, timedelta
 from loguru import logger
 import hashlib
 
+from src.trading.token_cache import TokenCache
+from src.utils.rate_limiter import SharedTokenBucketRateLimiter
 
-class APIRateLimiter:
-    """API 호출 제한을 관리하는 클래스"""
+
+@dataclass
+class AccountSnapshot:
+    """ka01690 한 번의 조회로 얻은 예수금과 보유 종목"""
+    balance: Dict[str, Any]  # get_balance() 형식
+    positions: List[Dict[str, Any]] = field(default_factory=list)  # get_positions() 형식
+    fetched_at: float = 0.0  # time.monotonic() 기준 조회 시각
     
-    def __init__(self, max_calls_per_second: int = 5, max_calls_per_day: int = 10000):
-        """
-        API 호출 제한 관리자를 초기화합니다.
-        
-        Args:
-            max_calls_per_second: 초당 최대 호출 횟수 (기본 5회)
-            max_calls_per_day: 일일 최대 호출 횟수 (기본 10,000회)
-        """
-        self.max_calls_per_second = max_calls_per_second
-        self.max_calls_per_day = max_calls_per_day
-        self.call_timestamps = []
-        self.daily_call_count = 0
-        self.last_reset_date = datetime.now().date()
-    
-    def wait_if_needed(self):
-        """필요한 경우 API 호출 전 대기합니다."""
-        now = datetime.now()
-        
-        # 일일 호출 횟수 초기화 (날짜가 바뀐 경우)
-        if now.date() != self.last_reset_date:
-            self.daily_call_count = 0
-            self.last_reset_date = now.date()
-            logger.info(f"API 호출 카운터 초기화: {now.date()}")
-        
-        # 일일 호출 한도 체크
-        if self.daily_call_count >= self.max_calls_per_day:
-            error_msg = f"🚨 키움증권 API 일일 호출 한도 초과! 현재: {self.daily_call_count}/{self.max_calls_per_day}회"
-            logger.error(error_msg)
-            raise Exception(error_msg)
-        
-        # 최근 1초 이내의 호출만 유지
-        one_second_ago = now - timedelta(seconds=1)
-        self.call_timestamps = [ts for ts in self.call_timestamps if ts > one_second_ago]
-        
-        # 초당 호출 제한 체크
-        if len(self.call_timestamps) >= self.max_calls_per_second:
-            wait_time = 1.0 - (now - self.call_timestamps[0]).total_seconds()
-            if wait_time > 0:
-                logger.debug(f"API 호출 제한으로 {wait_time:.2f}초 대기 중...")
-                time.sleep(wait_time)
-        
-        # 현재 호출 기록
-        self.call_timestamps.append(datetime.now())
-        self.daily_call_count += 1
+    def age(self) -> float:
+        """조회 후 경과 시간 (초)"""
+        return time.monotonic() - self.fetched_at
 
 
 class KiwoomAPIClient:
@@ -71,7 +39,25 @@ class KiwoomAPIClient:
     BASE_URL_LIVE = "https://api.kiwoom.com"  # 실전투자
     BASE_URL_MOCK = "https://mockapi.kiwoom.com"  # 모의투자 (KRX만 지원)
     
-    def __init__(self, app_key: str, app_secret: str, account_number: str):
+    # 실시간 시세/주문체결 웹소켓 URL
+    WEBSOCKET_URL_LIVE = "wss://api.kiwoom.com:10000/api/dostk/websocket"
+    WEBSOCKET_URL_MOCK = "wss://mockapi.kiwoom.com:10000/api/dostk/websocket"
+    
+    # 연속조회 최대 페이지 수
+    MAX_CONTINUOUS_PAGES = 20
+    
+    # 계좌 정보(ka01690) 재사용 시간 (초)
+    ACCOUNT_SNAPSHOT_TTL = 3
+    
+    # 접속 토큰 만료 전 미리 갱신하는 여유 시간
+    TOKEN_REFRESH_MARGIN = timedelta(hours=1)
+    
+    # 서버 호출 제한(HTTP 429) 응답 시 재시도 대기 시간 (초)
+    RATE_LIMITED_RETRY_DELAYS = [1.0, 2.0, 3.0]
+    
+    def __init__(self, app_key: str, app_secret: str, account_number: str,
+                 base_url: Optional[str] = None,
+                 rate_limiter: Optional[SharedTokenBucketRateLimiter] = None):
         """
         키움증권 API 클라이언트를 초기화합니다.
         
@@ -79,6 +65,8 @@ class KiwoomAPIClient:
             app_key: 키움증권 앱 키
             app_secret: 키움증권 앱 시크릿
             account_number: 계좌번호
+            base_url: 접속 주소 (None이면 거래 모드에 따라 실전/모의투자 서버, 로컬 시뮬레이터 연결 시 지정)
+            rate_limiter: 호출 제한기 (None이면 KIWOOM_RATE_LIMIT_CONFIG로 생성, 같은 앱 키의 프로세스 간 공유)
         """
         # 입력 검증
         if not app_key or not app_secret or not account_number:
@@ -90,23 +78,38 @@ class KiwoomAPIClient:
         
         # 거래 모드에 따른 BASE_URL 설정
         from config.settings import TRADING_MODE
-        if TRADING_MODE == 'LIVE':
+        if base_url:
+            self.base_url = base_url.rstrip('/')
+            self.websocket_url: Optional[str] = None  # 직접 지정한 서버는 실시간 수신 미지원
+            logger.info(f"✅ 키움증권 접속 주소 직접 지정: {self.base_url}")
+        elif TRADING_MODE == 'LIVE':
             self.base_url = self.BASE_URL_LIVE
+            self.websocket_url = self.WEBSOCKET_URL_LIVE
             logger.info("✅ 키움증권 실전투자 모드로 초기화")
         else:
             self.base_url = self.BASE_URL_MOCK
+            self.websocket_url = self.WEBSOCKET_URL_MOCK
             logger.info("✅ 키움증권 모의투자 모드로 초기화")
         
         # 민감정보 마스킹을 위한 해시
         self.app_key_masked = self._mask_sensitive_data(app_key)
         self.account_masked = self._mask_sensitive_data(account_number)
         
-        # 토큰 관리
+        # 토큰 관리 (재시작 후에도 만료 전까지 보관된 토큰 재사용)
         self.access_token: Optional[str] = None
         self.token_expires_at: Optional[datetime] = None
+        self._token_lock = threading.Lock()
+        self.token_cache = self._create_token_cache()
         
-        # API 호출 제한 관리
-        self.rate_limiter = APIRateLimiter()
+        # API 호출 제한 관리 (TR 종류별 초당 한도, 여러 프로세스가 같은 앱 키 한도를 공유)
+        self.rate_limiter = rate_limiter or self._create_rate_limiter(app_key)
+        
+        # 계좌 정보 캐시 (잔고/포지션 조회가 같은 ka01690 응답을 공유)
+        from config.settings import TRADING_CONFIG
+        self.account_snapshot_ttl = float(TRADING_CONFIG.get('account_snapshot_ttl', self.ACCOUNT_SNAPSHOT_TTL))
+        self._account_snapshot: Optional[AccountSnapshot] = None
+        self._snapshot_generation = 0
+        self._snapshot_lock = threading.Lock()
         
         # 세션 설정
         self.session = requests.Session()
@@ -123,6 +126,57 @@ class KiwoomAPIClient:
             return "****"
         return data[:2] + "*" * (len(data) - 4) + data[-2:]
     
+    def _create_rate_limiter(self, app_key: str) -> SharedTokenBucketRateLimiter:
+        """설정값으로 앱 키별 공유 호출 제한기를 생성합니다."""
+        from config.settings import KIWOOM_RATE_LIMIT_CONFIG
+        
+        # 공유 파일에는 앱 키 원문 대신 해시를 기록
+        scope = hashlib.sha256(app_key.encode()).hexdigest()[:16]
+        try:
+            return SharedTokenBucketRateLimiter(
+                buckets=KIWOOM_RATE_LIMIT_CONFIG['buckets'],
+                db_path=KIWOOM_RATE_LIMIT_CONFIG.get('shared_state_path'),
+                scope=scope,
+                max_calls_per_day=KIWOOM_RATE_LIMIT_CONFIG.get('max_calls_per_day', 10000),
+                name='키움증권 API'
+            )
+        except Exception as e:
+            logger.warning(f"호출 제한 공유 파일을 사용할 수 없어 프로세스 내에서만 제한합니다: {e}")
+            return SharedTokenBucketRateLimiter(
+                buckets=KIWOOM_RATE_LIMIT_CONFIG['buckets'],
+                scope=scope,
+                max_calls_per_day=KIWOOM_RATE_LIMIT_CONFIG.get('max_calls_per_day', 10000),
+                name='키움증권 API'
+            )
+    
+    def _create_token_cache(self) -> Optional[TokenCache]:
+        """설정값으로 접속 토큰 보관 파일을 준비합니다. (사용하지 않거나 준비할 수 없으면 None)"""
+        from config.settings import TRADING_CONFIG
+        
+        file_path = TRADING_CONFIG.get('token_cache_file')
+        if not file_path:
+            return None
+        
+        try:
+            return TokenCache(file_path)
+        except OSError as e:
+            logger.warning(f"접속 토큰 보관 파일을 준비할 수 없어 메모리에만 보관합니다: {e}")
+            return None
+    
+    @staticmethod
+    def _rate_limit_buckets(api_id: str) -> list:
+        """
+        TR이 소모할 호출 제한 버킷 이름을 반환합니다.
+        
+        Args:
+            api_id: TR명 (예: ka01690, kt10000)
+            
+        Returns:
+            list: 전체 버킷, TR 종류 버킷(주문 kt*, 조회 그 외), TR별 버킷 (설정에 있는 것만 적용)
+        """
+        group = 'order' if api_id.startswith('kt') else 'inquiry'
+        return ['total', group, api_id]
+    
     def _analyze_kiwoom_error(self, return_code: int, return_msg: str) -> Optional[Dict[str, str]]:
         """
         키움증권 API 오류 코드를 분석하여 원인과 해결방법을 제공합니다.
@@ -283,10 +337,15 @@ class KiwoomAPIClient:
         max_retries = 3
         backoff_delays = [0.5, 1.0, 2.0]
         
-        for attempt in range(max_retries):
+        api_id = (kwargs.get('headers') or {}).get('api-id', '')
+        rate_limited_retries = 0
+        token_refreshed = False
+        
+        attempt = 0
+        while attempt < max_retries:
             try:
                 # API 호출 제한 체크 및 대기
-                self.rate_limiter.wait_if_needed()
+                self.rate_limiter.acquire(self._rate_limit_buckets(api_id))
                 
                 # 타임아웃 설정
                 if 'timeout' not in kwargs:
@@ -298,6 +357,23 @@ class KiwoomAPIClient:
                 # 응답 로깅 (민감정보 제외)
                 logger.debug(f"API 요청: {method} {url} - 상태: {response.status_code}")
                 
+                # 보관 중 폐기된 토큰을 재사용한 경우 한 번만 새 토큰으로 재시도
+                if not token_refreshed and 'authorization' in kwargs.get('headers', {}) and self._is_token_rejected(response):
+                    token_refreshed = True
+                    logger.warning(f"접속 토큰이 거부되어 새 토큰으로 재시도합니다 ({api_id})")
+                    if not self.authenticate(force_refresh=True):
+                        return response
+                    kwargs['headers']['authorization'] = f'Bearer {self.access_token}'
+                    continue
+                
+                # 다른 클라이언트와 한도를 나눠 써서 서버가 거절한 경우 잠시 후 재시도 (재시도 횟수 별도)
+                if response.status_code == 429 and rate_limited_retries < len(self.RATE_LIMITED_RETRY_DELAYS):
+                    delay = self.RATE_LIMITED_RETRY_DELAYS[rate_limited_retries]
+                    rate_limited_retries += 1
+                    logger.warning(f"서버 호출 제한 응답 ({api_id}) - {delay}초 후 재시도 ({rate_limited_retries}/{len(self.RATE_LIMITED_RETRY_DELAYS)})")
+                    time.sleep(delay)
+                    continue
+                
                 # 성공 또는 비가역 오류인 경우 즉시 반환
                 if response.status_code < 500:
                     return response
@@ -321,17 +397,136 @@ class KiwoomAPIClient:
                     time.sleep(backoff_delays[attempt])
                 else:
                     raise
+            
+            attempt += 1
         
         raise Exception(f"API 요청 실패: 최대 재시도 횟수 초과 ({max_retries}회)")
     
-    def authenticate(self) -> bool:
+    @staticmethod
+    def _is_token_rejected(response: requests.Response) -> bool:
+        """응답이 토큰 만료/무효로 인한 인증 실패인지 확인합니다. (HTTP 401 또는 return_code -1)"""
+        if response.status_code == 401:
+            return True
+        if response.status_code != 200:
+            return False
+        try:
+            return response.json().get('return_code') == -1
+        except ValueError:
+            return False
+    
+    def _request_continuous(self, url: str, api_id: str, data: Dict[str, Any],
+                            list_key: str) -> Tuple[requests.Response, Optional[Dict[str, Any]]]:
+        """
+        연속조회(cont-yn/next-key)를 따라가며 목록 필드를 모두 합쳐 조회합니다.
+        
+        Args:
+            url: 요청 URL
+            api_id: TR명 (예: ka01690, ka10076)
+            data: 요청 Body
+            list_key: 페이지별로 나뉘어 오는 목록 필드명 (예: day_bal_rt, cntr)
+            
+        Returns:
+            Tuple[requests.Response, Optional[Dict]]: 마지막 응답과 합쳐진 결과 (HTTP 오류 시 결과 None)
+        """
+        merged: Optional[Dict[str, Any]] = None
+        cont_yn, next_key = 'N', ''
+        
+        for page in range(self.MAX_CONTINUOUS_PAGES):
+            headers = self._get_headers(api_id=api_id, cont_yn=cont_yn, next_key=next_key)
+            response = self._request_with_retry('POST', url, headers=headers, json=data)
+            if response.status_code != 200:
+                return response, None
+            
+            result = response.json()
+            if result.get('return_code') != 0:
+                # 중간 페이지 실패 시 일부 목록만 반환하지 않도록 오류 응답을 그대로 전달
+                return response, result
+            
+            if merged is None:
+                merged = result
+            else:
+                merged[list_key] = (merged.get(list_key) or []) + (result.get(list_key) or [])
+            
+            if response.headers.get('cont-yn') != 'Y' or not response.headers.get('next-key'):
+                break
+            cont_yn, next_key = 'Y', response.headers['next-key']
+            logger.debug(f"연속조회 {api_id}: {page + 2}페이지 요청 (next-key: {next_key})")
+        else:
+            logger.warning(f"연속조회 {api_id}: 최대 {self.MAX_CONTINUOUS_PAGES}페이지까지만 조회했습니다")
+        
+        return response, merged
+    
+    def authenticate(self, force_refresh: bool = False) -> bool:
         """
         OAuth 2.0 인증을 수행하고 액세스 토큰을 획득합니다.
         키움증권 REST API 공식 문서: TR au10001
         
+        만료 전인 토큰(메모리 또는 토큰 보관 파일)이 있으면 발급 요청 없이 재사용합니다.
+        여러 스레드/프로세스가 동시에 갱신하려 하면 한 곳만 발급받고 나머지는 그 토큰을 사용합니다.
+        
+        Args:
+            force_refresh: True이면 현재 토큰을 서버가 거부한 것으로 보고 다른 토큰을 사용
+            
         Returns:
             bool: 인증 성공 여부
         """
+        with self._token_lock:
+            rejected_token = self.access_token if force_refresh else None
+            if not force_refresh and self._is_token_valid():
+                return True
+            
+            if self.token_cache is None:
+                return self._issue_token()
+            
+            try:
+                with self.token_cache.lock():
+                    # 잠금을 기다리는 동안 다른 프로세스가 새로 발급받았을 수 있으므로 다시 확인
+                    if self._load_cached_token(rejected_token):
+                        return True
+                    return self._issue_token()
+            except OSError as e:
+                logger.warning(f"접속 토큰 보관 파일을 사용할 수 없어 새로 발급받습니다: {e}")
+                return self._issue_token()
+    
+    def _is_token_valid(self) -> bool:
+        """메모리의 토큰이 갱신 시점 전인지 확인합니다."""
+        return bool(self.access_token and self.token_expires_at and datetime.now() < self.token_expires_at)
+    
+    def _load_cached_token(self, rejected_token: Optional[str] = None) -> bool:
+        """
+        토큰 보관 파일의 토큰을 불러옵니다. (token_cache.lock() 안에서 호출)
+        
+        Args:
+            rejected_token: 서버가 거부한 토큰 (보관된 토큰이 이 토큰이면 보관 파일에서 삭제)
+            
+        Returns:
+            bool: 갱신 시점 전인 토큰을 불러왔는지 여부
+        """
+        cached = self.token_cache.load(self.app_key, self.base_url)
+        if not cached:
+            return False
+        
+        token, expires_at = cached
+        if token == rejected_token:
+            # 다른 프로세스나 재시작 후에도 거부된 토큰으로 먼저 요청하지 않도록 삭제
+            self.token_cache.delete(self.app_key, self.base_url)
+            logger.info("🗑️ 서버가 거부한 키움증권 접속 토큰을 보관 파일에서 삭제했습니다.")
+            return False
+        if datetime.now() >= expires_at - self.TOKEN_REFRESH_MARGIN:
+            return False
+        
+        self.access_token = token
+        self.token_expires_at = expires_at - self.TOKEN_REFRESH_MARGIN
+        logger.info(f"✅ 보관된 키움증권 접속 토큰 재사용 (만료: {self.token_expires_at.strftime('%Y-%m-%d %H:%M:%S')})")
+        return True
+    
+    def _issue_token(self) -> bool:
+        """
+        접속 토큰을 새로 발급받고 토큰 보관 파일에 기록합니다. (TR: au10001)
+        
+        Returns:
+            bool: 발급 성공 여부
+        """
         try:
             logger.info("🔐 키움증권 API 인증 시작... (TR: au10001)")
             
@@ -368,17 +563,22 @@ class KiwoomAPIClient:
                 # 만료 시간 파싱 (키움증권은 'expires_dt' 문자열 사용)
                 # 형식: "20241107083713" (YYYYMMDDHHmmss)
                 expires_dt_str = result.get('expires_dt', '')
+                expires_at = datetime.now() + timedelta(hours=24)  # 만료 시간 없으면 기본 24시간
                 if expires_dt_str:
                     try:
-                        self.token_expires_at = datetime.strptime(expires_dt_str, '%Y%m%d%H%M%S')
-                        # 안전을 위해 1시간 전에 갱신하도록 설정
-                        self.token_expires_at = self.token_expires_at - timedelta(hours=1)
+                        expires_at = datetime.strptime(expires_dt_str, '%Y%m%d%H%M%S')
                     except ValueError:
-                        logger.warning(f"만료 시간 파싱 실패: {expires_dt_str}, 기본값(23시간) 사용")
-                        self.token_expires_at = datetime.now() + timedelta(hours=23)
-                else:
-                    # 만료 시간 없으면 기본 23시간
-                    self.token_expires_at = datetime.now() + timedelta(hours=23)
+                        logger.warning(f"만료 시간 파싱 실패: {expires_dt_str}, 기본값(24시간) 사용")
+                
+                # 안전을 위해 만료 1시간 전에 갱신하도록 설정
+                self.token_expires_at = expires_at - self.TOKEN_REFRESH_MARGIN
+                
+                # 다음 실행/다른 프로세스가 재사용하도록 보관
+                if self.token_cache is not None:
+                    try:
+                        self.token_cache.save(self.app_key, self.base_url, self.access_token, expires_at)
+                    except OSError as e:
+                        logger.warning(f"접속 토큰 보관 실패 (다음 실행 시 새로 발급): {e}")
                 
                 logger.info(f"✅ 키움증권 API 인증 성공! (만료: {self.token_expires_at.strftime('%Y-%m-%d %H:%M:%S')})")
                 return True
@@ -411,65 +611,121 @@ class KiwoomAPIClient:
             if not self.authenticate():
                 raise Exception("키움증권 API 재인증 실패")
     
-    def get_balance(self) -> Optional[Dict[str, Any]]:
+    def get_account_snapshot(self, force_refresh: bool = False) -> Optional[AccountSnapshot]:
         """
-        일별잔고수익률 조회 (예수금 포함)
+        일별잔고수익률을 한 번 조회하여 예수금과 보유 종목을 함께 반환합니다.
         키움증권 REST API: TR ka01690
         
+        조회 결과는 account_snapshot_ttl초 동안 재사용하고, 주문을 접수하거나 체결을
+        수신하면 즉시 폐기합니다. 여러 스레드가 동시에 요청해도 조회는 한 번만 수행합니다.
+        
+        Args:
+            force_refresh: True이면 보관된 결과를 무시하고 새로 조회
+            
         Returns:
-            Optional[Dict]: 잔고 정보 (실패 시 None)
-                - deposit: 예수금 (Decimal)
-                - total_buy_amount: 총 매입가 (Decimal)
-                - total_eval_amount: 총 평가금액 (Decimal)
-                - estimated_asset: 추정자산 (Decimal)
+            Optional[AccountSnapshot]: 계좌 정보 (실패 시 None)
         """
+        with self._snapshot_lock:
+            snapshot = self._account_snapshot
+            if not force_refresh and snapshot is not None and snapshot.age() < self.account_snapshot_ttl:
+                logger.debug(f"계좌 정보 재사용 ({snapshot.age():.1f}초 전 조회)")
+                return snapshot
+            
+            generation = self._snapshot_generation
+            snapshot = self._fetch_account_snapshot()
+            
+            # 조회 중에 주문/체결이 있었다면 이미 지난 정보이므로 보관하지 않음
+            if snapshot is not None and generation == self._snapshot_generation:
+                self._account_snapshot = snapshot
+            return snapshot
+    
+    def invalidate_account_snapshot(self, *args):
+        """보관된 계좌 정보를 폐기합니다. (주문 접수/체결 시 호출, 체결 이벤트 콜백으로도 사용)"""
+        self._snapshot_generation += 1
+        self._account_snapshot = None
+    
+    def _fetch_account_snapshot(self) -> Optional[AccountSnapshot]:
+        """ka01690을 조회하여 예수금과 보유 종목을 파싱합니다."""
         try:
             self._ensure_authenticated()
             
             # 키움증권 일별잔고수익률 API (TR: ka01690)
             url = f"{self.base_url}/api/dostk/acnt"
-            headers = self._get_headers(api_id='ka01690')
             
             # Body: 조회일자 (오늘)
             data = {
                 'qry_dt': datetime.now().strftime('%Y%m%d')  # 예: "20250825"
             }
             
-            response = self._request_with_retry('POST', url, headers=headers, json=data)
+            # 보유 종목이 많으면 연속조회로 나뉘어 오므로 모든 페이지를 합침
+            response, result = self._request_continuous(url, 'ka01690', data, 'day_bal_rt')
             
-            if response.status_code == 200:
-                result = response.json()
-                
-                # 키움증권 API 응답 검증 (return_code 체크)
-                if result.get('return_code') != 0:
-                    logger.error(f"잔고 조회 실패: {result.get('return_msg', 'Unknown error')}")
-                    return None
-                
-                # 응답 파싱
-                balance_info = {
-                    'deposit': Decimal(str(result.get('dbst_bal', '0'))),  # 예수금
-                    'total_buy_amount': Decimal(str(result.get('tot_buy_amt', '0'))),  # 총 매입가
-                    'total_eval_amount': Decimal(str(result.get('tot_evlt_amt', '0'))),  # 총 평가금액
-                    'estimated_asset': Decimal(str(result.get('day_stk_asst', '0'))),  # 추정자산
-                    'available_amount': Decimal(str(result.get('dbst_bal', '0'))),  # 매수가능금액 (예수금과 동일)
-                }
-                
-                logger.info(f"✅ 잔고 조회 성공 - 예수금: {balance_info['deposit']:,}원, 추정자산: {balance_info['estimated_asset']:,}원")
-                return balance_info
-            else:
+            if response.status_code != 200:
                 logger.error(f"잔고 조회 API HTTP 오류: {response.status_code}, {response.text}")
                 return None
-                
+            
+            # 키움증권 API 응답 검증 (return_code 체크)
+            if result.get('return_code') != 0:
+                logger.error(f"잔고 조회 실패: {result.get('return_msg', 'Unknown error')}")
+                return None
+            
+            # 예수금/평가금액 파싱
+            balance_info = {
+                'deposit': Decimal(str(result.get('dbst_bal', '0'))),  # 예수금
+                'total_buy_amount': Decimal(str(result.get('tot_buy_amt', '0'))),  # 총 매입가
+                'total_eval_amount': Decimal(str(result.get('tot_evlt_amt', '0'))),  # 총 평가금액
+                'estimated_asset': Decimal(str(result.get('day_stk_asst', '0'))),  # 추정자산
+                'available_amount': Decimal(str(result.get('dbst_bal', '0'))),  # 매수가능금액 (예수금과 동일)
+            }
+            
+            # day_bal_rt 배열 파싱 (보유수량이 0이 아닌 종목만)
+            positions = []
+            for item in result.get('day_bal_rt', []):
+                quantity = int(item.get('rmnd_qty', '0'))
+                if quantity > 0:
+                    positions.append({
+                        'stock_code': item.get('stk_cd', ''),
+                        'stock_name': item.get('stk_nm', ''),
+                        'quantity': quantity,
+                        'avg_price': Decimal(str(item.get('buy_uv', '0'))),  # 매입단가
+                        'current_price': Decimal(str(item.get('cur_prc', '0'))),
+                        'eval_amount': Decimal(str(item.get('evlt_amt', '0'))),
+                        'profit_loss': Decimal(str(item.get('evltv_prft', '0'))),
+                        'profit_rate': Decimal(str(item.get('prft_rt', '0')))
+                    })
+            
+            return AccountSnapshot(balance=balance_info, positions=positions, fetched_at=time.monotonic())
+            
         except Exception as e:
             logger.error(f"잔고 조회 중 오류 발생: {e}")
             import traceback
             logger.error(traceback.format_exc())
             return None
     
+    def get_balance(self) -> Optional[Dict[str, Any]]:
+        """
+        일별잔고수익률 조회 (예수금 포함)
+        키움증권 REST API: TR ka01690 (get_account_snapshot() 결과 사용)
+        
+        Returns:
+            Optional[Dict]: 잔고 정보 (실패 시 None)
+                - deposit: 예수금 (Decimal)
+                - total_buy_amount: 총 매입가 (Decimal)
+                - total_eval_amount: 총 평가금액 (Decimal)
+                - estimated_asset: 추정자산 (Decimal)
+        """
+        snapshot = self.get_account_snapshot()
+        if snapshot is None:
+            return None
+        
+        balance_info = dict(snapshot.balance)
+        logger.info(f"✅ 잔고 조회 성공 - 예수금: {balance_info['deposit']:,}원, 추정자산: {balance_info['estimated_asset']:,}원")
+        return balance_info
+    
     def get_positions(self) -> Optional[list]:
         """
         보유 주식 잔고를 조회합니다.
-        키움증권 REST API: TR ka01690 (day_bal_rt 배열 사용)
+        키움증권 REST API: TR ka01690 (get_account_snapshot() 결과 사용)
         
         Returns:
             Optional[list]: 보유 종목 리스트 (실패 시 None)
@@ -483,59 +739,13 @@ class KiwoomAPIClient:
                 - profit_loss: 평가손익 (Decimal)
                 - profit_rate: 수익률 (Decimal, %)
         """
-        try:
-            self._ensure_authenticated()
-            
-            # 키움증권 일별잔고수익률 API (TR: ka01690)
-            url = f"{self.base_url}/api/dostk/acnt"
-            headers = self._get_headers(api_id='ka01690')
-            
-            # Body: 조회일자 (오늘)
-            data = {
-                'qry_dt': datetime.now().strftime('%Y%m%d')
-            }
-            
-            response = self._request_with_retry('POST', url, headers=headers, json=data)
-            
-            if response.status_code == 200:
-                result = response.json()
-                
-                # 키움증권 API 응답 검증
-                if result.get('return_code') != 0:
-                    logger.error(f"포지션 조회 실패: {result.get('return_msg', 'Unknown error')}")
-                    return None
-                
-                # day_bal_rt 배열 파싱
-                day_bal_rt = result.get('day_bal_rt', [])
-                positions = []
-                
-                for item in day_bal_rt:
-                    # 보유수량이 0이 아닌 종목만 추가
-                    quantity = int(item.get('rmnd_qty', '0'))
-                    if quantity > 0:
-                        position = {
-                            'stock_code': item.get('stk_cd', ''),
-                            'stock_name': item.get('stk_nm', ''),
-                            'quantity': quantity,
-                            'avg_price': Decimal(str(item.get('buy_uv', '0'))),  # 매입단가
-                            'current_price': Decimal(str(item.get('cur_prc', '0'))),
-                            'eval_amount': Decimal(str(item.get('evlt_amt', '0'))),
-                            'profit_loss': Decimal(str(item.get('evltv_prft', '0'))),
-                            'profit_rate': Decimal(str(item.get('prft_rt', '0')))
-                        }
-                        positions.append(position)
-                
-                logger.info(f"✅ 포지션 조회 성공 - 보유 종목: {len(positions)}개")
-                return positions
-            else:
-                logger.error(f"포지션 조회 API HTTP 오류: {response.status_code}, {response.text}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"포지션 조회 중 오류 발생: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+        snapshot = self.get_account_snapshot()
+        if snapshot is None:
             return None
+        
+        positions = [dict(position) for position in snapshot.positions]
+        logger.info(f"✅ 포지션 조회 성공 - 보유 종목: {len(positions)}개")
+        return positions
     
     def get_current_price(self, stock_code: str) -> Optional[Dict[str, Any]]:
         """
@@ -657,6 +867,9 @@ class KiwoomAPIClient:
             
             response = self._request_with_retry('POST', url, headers=headers, json=data)
             
+            # 주문 결과와 관계없이 예수금/보유 수량이 바뀌었을 수 있으므로 계좌 정보 폐기
+            self.invalidate_account_snapshot()
+            
             if response.status_code == 200:
                 result = response.json()
                 
@@ -735,7 +948,6 @@ class KiwoomAPIClient:
             
             # 키움증권 체결요청 API (TR: ka10076)
             url = f"{self.base_url}/api/dostk/acnt"
-            headers = self._get_headers(api_id='ka10076')
             
             # Body
             data = {
@@ -746,11 +958,9 @@ class KiwoomAPIClient:
                 'stex_tp': '0'  # 0:통합, 1:KRX, 2:NXT
             }
             
-            response = self._request_with_retry('POST', url, headers=headers, json=data)
+            response, result = self._request_continuous(url, 'ka10076', data, 'cntr')
             
             if response.status_code == 200:
-                result = response.json()
-                
                 # 키움증권 API 응답 검증
                 if result.get('return_code') != 0:
                     logger.error(f"체결 조회 실패: {result.get('return_msg', 'Unknown error')}")
@@ -816,7 +1026,6 @@ class KiwoomAPIClient:
             
             # 키움증권 미체결요청 API (TR: ka10075)
             url = f"{self.base_url}/api/dostk/acnt"
-            headers = self._get_headers(api_id='ka10075')
             
             # Body
             data = {
@@ -826,11 +1035,9 @@ class KiwoomAPIClient:
                 'stex_tp': '0'  # 0:통합, 1:KRX, 2:NXT
             }
             
-            response = self._request_with_retry('POST', url, headers=headers, json=data)
+            response, result = self._request_continuous(url, 'ka10075', data, 'oso')
             
             if response.status_code == 200:
-                result = response.json()
-                
                 # 키움증권 API 응답 검증
                 if result.get('return_code') != 0:
                     logger.error(f"미체결 조회 실패: {result.get('return_msg', 'Unknown error')}")
@@ -0,0 +1,327 @@
+"""
+주문체결 실시간 이벤트 모듈
+
+이 모듈은 키움증권 실시간 주문체결(웹소켓 TR 타입 '00')을 수신하여 주문번호별 체결 상태를
+보관하고, 체결이 들어오는 즉시 대기 중인 주문 처리를 깨웁니다. 체결 확인을 위해
+체결 조회 API(ka10076)를 일정 간격으로 호출하며 기다리던 방식을 대체합니다.
+
+- OrderEventStream: 실시간 메시지를 해석하고 체결을 기다리는 기본 클래스
+  (로컬 시뮬레이터 LocalKiwoomServer.create_order_stream()도 이 클래스를 사용)
+- KiwoomWebSocketOrderStream: 키움증권 웹소켓 연결 (websocket-client 필요)
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, List, Optional
+from loguru import logger
+
+try:
+    import websocket
+    WEBSOCKET_AVAILABLE = True
+except ImportError:
+    WEBSOCKET_AVAILABLE = False
+
+
+# 실시간 주문체결(타입 '00') 필드 번호
+FID_ORDER_NUMBER = '9203'
+FID_STOCK_CODE = '9001'
+FID_ORDER_STATUS = '913'
+FID_ORDER_QUANTITY = '900'
+FID_UNEXECUTED_QUANTITY = '902'
+FID_EXECUTED_AMOUNT = '903'  # 체결누계금액
+FID_ORDER_SIDE = '905'
+FID_EXECUTED_PRICE = '910'  # 단위 체결가
+FID_EXECUTED_QUANTITY = '911'  # 단위 체결량
+
+REAL_TYPE_ORDER_EXECUTION = '00'
+ORDER_STATUS_EXECUTED = '체결'  # 주문상태(913): 접수, 확인, 체결, 거부 등
+
+
+def _to_int(value: Any) -> int:
+    """키움 실시간 값('+000123', '' 등)을 정수로 변환합니다."""
+    text = str(value or '').strip().replace('+', '').replace('-', '').replace(',', '')
+    return int(text) if text.isdigit() else 0
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """키움 실시간 값을 Decimal로 변환합니다. (부호 제거)"""
+    text = str(value or '').strip().replace('+', '').replace('-', '').replace(',', '')
+    try:
+        return Decimal(text) if text else Decimal('0')
+    except InvalidOperation:
+        return Decimal('0')
+
+
+class OrderEventStream:
+    """실시간 주문체결 메시지를 보관하고 체결 대기를 처리하는 클래스"""
+
+    # 보관할 최근 주문 수
+    MAX_TRACKED_ORDERS = 500
+
+    def __init__(self):
+        """주문체결 이벤트 저장소를 초기화합니다."""
+        self.connected = False  # 실시간 메시지를 받을 수 있는 상태인지 (끊기면 폴링으로 보완)
+        self._executions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._condition = threading.Condition()
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+
+    def start(self) -> 'OrderEventStream':
+        """수신을 시작합니다. (기본 클래스는 메시지를 직접 전달받으므로 연결 상태만 표시)"""
+        self.connected = True
+        return self
+
+    def stop(self):
+        """수신을 중지합니다."""
+        self.connected = False
+
+    def add_listener(self, listener: Callable[[Dict[str, Any]], None]):
+        """
+        체결을 수신할 때마다 호출할 함수를 등록합니다. (예: 계좌 정보 캐시 폐기)
+
+        Args:
+            listener: 체결 정보(get_execution()과 같은 형식)를 받는 함수
+        """
+        self._listeners.append(listener)
+
+    def handle_message(self, message: Dict[str, Any]):
+        """
+        실시간 메시지를 처리합니다.
+
+        Args:
+            message: {'trnm': 'REAL', 'data': [{'type': '00', 'values': {...}}, ...]} 형식 메시지
+        """
+        if message.get('trnm') != 'REAL':
+            return
+
+        for item in message.get('data') or []:
+            if item.get('type') == REAL_TYPE_ORDER_EXECUTION:
+                self._record_execution(item.get('values') or {})
+
+    def _record_execution(self, values: Dict[str, Any]):
+        """주문체결 값으로 주문번호별 누적 체결 상태를 갱신하고 대기 중인 스레드를 깨웁니다."""
+        order_number = str(values.get(FID_ORDER_NUMBER, '')).strip()
+        if not order_number:
+            return
+
+        # 접수/확인(정정·취소)/거부 메시지는 체결이 아님 (확인 메시지는 미체결수량이 0이어도 체결가가 비어 있음)
+        if str(values.get(FID_ORDER_STATUS, '')).strip() != ORDER_STATUS_EXECUTED:
+            return
+
+        with self._condition:
+            previous = self._executions.get(order_number)
+        previous_quantity = previous['executed_quantity'] if previous else 0
+        previous_amount = previous['executed_amount'] if previous else Decimal('0')
+
+        # 누적 체결량: 주문수량 - 미체결수량 (미체결수량이 없으면 단위 체결량을 누적)
+        order_quantity = _to_int(values.get(FID_ORDER_QUANTITY))
+        unit_quantity = _to_int(values.get(FID_EXECUTED_QUANTITY))
+        unit_price = _to_decimal(values.get(FID_EXECUTED_PRICE))
+        if str(values.get(FID_UNEXECUTED_QUANTITY, '')).strip():
+            executed_quantity = order_quantity - _to_int(values.get(FID_UNEXECUTED_QUANTITY))
+        else:
+            executed_quantity = previous_quantity + unit_quantity
+        if executed_quantity <= 0:
+            return
+
+        # 누적 체결금액 (없으면 이전 누적 금액에 이번 체결분을 더함)
+        executed_amount = _to_decimal(values.get(FID_EXECUTED_AMOUNT))
+        if not executed_amount:
+            executed_amount = previous_amount + unit_price * (executed_quantity - previous_quantity)
+
+        executed_price = (executed_amount / executed_quantity).quantize(Decimal('1'))
+        if executed_amount <= 0 or executed_price <= 0:
+            logger.warning(f"체결가가 없는 체결 메시지를 무시합니다: 주문번호 {order_number} ({executed_quantity}주)")
+            return
+
+        execution = {
+            'order_number': order_number,
+            'stock_code': str(values.get(FID_STOCK_CODE, '')).strip().lstrip('A'),
+            'order_type': str(values.get(FID_ORDER_SIDE, '')),
+            'executed': 0 < order_quantity <= executed_quantity,
+            'order_quantity': order_quantity,
+            'executed_quantity': executed_quantity,
+            'executed_price': executed_price,
+            'executed_amount': executed_amount,
+        }
+
+        with self._condition:
+            previous = self._executions.get(order_number)
+            # 순서가 뒤바뀌어 도착한 이전 체결 메시지는 무시
+            if previous is None or previous['executed_quantity'] <= executed_quantity:
+                self._executions[order_number] = execution
+                self._executions.move_to_end(order_number)
+                while len(self._executions) > self.MAX_TRACKED_ORDERS:
+                    self._executions.popitem(last=False)
+            self._condition.notify_all()
+
+        logger.debug(f"실시간 체결 수신: 주문번호 {order_number} {executed_quantity}/{order_quantity}주")
+
+        for listener in self._listeners:
+            try:
+                listener(dict(execution))
+            except Exception as e:
+                logger.error(f"체결 수신 처리 함수 오류: {e}")
+
+    def get_execution(self, order_number: str) -> Optional[Dict[str, Any]]:
+        """
+        수신된 체결 상태를 반환합니다.
+
+        Returns:
+            Optional[Dict]: 체결 정보 (OrderManager.check_order_execution()과 같은 키, 수신 전이면 None)
+        """
+        with self._condition:
+            execution = self._executions.get(order_number)
+            return dict(execution) if execution else None
+
+    def wait_for_execution(self, order_number: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        주문이 전량 체결될 때까지 기다립니다. (체결 메시지가 오면 즉시 반환)
+
+        Args:
+            order_number: 주문번호
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            Optional[Dict]: 체결 정보 (시간 초과 시 그때까지의 부분 체결 정보 또는 None)
+        """
+        deadline = time.monotonic() + max(0.0, timeout)
+        with self._condition:
+            while True:
+                execution = self._executions.get(order_number)
+                if execution and execution['executed']:
+                    return dict(execution)
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return dict(execution) if execution else None
+                self._condition.wait(remaining)
+
+
+class KiwoomWebSocketOrderStream(OrderEventStream):
+    """키움증권 웹소켓으로 실시간 주문체결을 수신하는 클래스"""
+
+    RECONNECT_DELAYS = [1, 2, 5, 10, 30]  # 재연결 대기 시간 (초)
+
+    def __init__(self, kiwoom_client, websocket_url: str):
+        """
+        웹소켓 주문체결 수신기를 초기화합니다.
+
+        Args:
+            kiwoom_client: 키움증권 API 클라이언트 (접속 토큰 사용)
+            websocket_url: 웹소켓 접속 주소
+        """
+        super().__init__()
+        self.kiwoom = kiwoom_client
+        self.websocket_url = websocket_url
+        self._app = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def start(self) -> 'KiwoomWebSocketOrderStream':
+        """수신 스레드를 시작합니다. (연결이 끊기면 자동 재연결)"""
+        if not WEBSOCKET_AVAILABLE:
+            logger.warning("websocket-client 라이브러리가 없어 실시간 체결 수신을 사용하지 않습니다 (체결 조회 API 사용)")
+            return self
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name='kiwoom-order-stream', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """수신을 중지하고 연결을 닫습니다."""
+        self._stopped.set()
+        self.connected = False
+        if self._app is not None:
+            self._app.close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _run(self):
+        """연결이 끊기면 점점 긴 간격으로 재연결합니다."""
+        attempt = 0
+        while not self._stopped.is_set():
+            started_at = time.monotonic()
+            self._app = websocket.WebSocketApp(
+                self.websocket_url,
+                on_open=self._on_open,
+                on_message=self._on_message,
+                on_error=lambda app, error: logger.warning(f"실시간 체결 연결 오류: {error}"),
+                on_close=self._on_close,
+            )
+            self._app.run_forever(ping_interval=30, ping_timeout=10)
+            self.connected = False
+
+            if self._stopped.is_set():
+                break
+
+            # 오래 유지된 연결이 끊긴 경우 재연결 간격을 처음부터 다시 적용
+            attempt = 0 if time.monotonic() - started_at > 60 else attempt + 1
+            delay = self.RECONNECT_DELAYS[min(attempt, len(self.RECONNECT_DELAYS) - 1)]
+            logger.warning(f"실시간 체결 연결 끊김 - {delay}초 후 재연결 (그동안 체결 조회 API 사용)")
+            self._stopped.wait(delay)
+
+    def _on_open(self, app):
+        """접속 토큰으로 로그인합니다."""
+        try:
+            self.kiwoom._ensure_authenticated()
+            app.send(json.dumps({'trnm': 'LOGIN', 'token': self.kiwoom.access_token}))
+        except Exception as e:
+            logger.error(f"실시간 체결 로그인 요청 실패: {e}")
+            app.close()
+
+    def _on_message(self, app, raw_message: str):
+        """로그인 응답, PING, 실시간 메시지를 처리합니다."""
+        try:
+            message = json.loads(raw_message)
+        except ValueError:
+            logger.debug(f"실시간 체결 메시지 해석 실패: {raw_message[:100]}")
+            return
+
+        trnm = message.get('trnm')
+        if trnm == 'PING':
+            app.send(raw_message)  # 받은 메시지를 그대로 돌려보내야 연결이 유지됨
+        elif trnm == 'LOGIN':
+            if message.get('return_code') != 0:
+                logger.error(f"실시간 체결 로그인 실패: {message.get('return_msg')}")
+                app.close()
+                return
+            app.send(json.dumps({
+                'trnm': 'REG',
+                'grp_no': '1',
+                'refresh': '1',
+                'data': [{'item': [''], 'type': [REAL_TYPE_ORDER_EXECUTION]}],
+            }))
+        elif trnm == 'REG':
+            self.connected = message.get('return_code') == 0
+            if self.connected:
+                logger.info("✅ 실시간 주문체결 수신 시작")
+            else:
+                logger.error(f"실시간 주문체결 등록 실패: {message.get('return_msg')}")
+        else:
+            self.handle_message(message)
+
+    def _on_close(self, app, status_code, close_message):
+        self.connected = False
+        logger.info(f"실시간 체결 연결 종료 (코드: {status_code})")
+
+
+def create_order_event_stream(kiwoom_client) -> Optional[OrderEventStream]:
+    """
+    키움증권 클라이언트에 맞는 실시간 주문체결 수신기를 생성하고 시작합니다.
+
+    Args:
+        kiwoom_client: 키움증권 API 클라이언트
+
+    Returns:
+        Optional[OrderEventStream]: 수신기 (웹소켓 주소가 없거나 라이브러리가 없으면 None)
+    """
+    websocket_url = getattr(kiwoom_client, 'websocket_url', None)
+    if not websocket_url or not WEBSOCKET_AVAILABLE:
+        logger.info("실시간 주문체결 수신 미사용 - 체결 조회 API로 체결을 확인합니다")
+        return None
+
+    return KiwoomWebSocketOrderStream(kiwoom_client, websocket_url).start()
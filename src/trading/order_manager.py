@@ -11,6 +11,7 @@ from datetime import datetime
 from loguru import logger
 
 from src.trading.kiwoom_client import KiwoomAPIClient
+from src.trading.order_events import OrderEventStream
 
 
 class OrderManager:
@@ -19,14 +20,22 @@ class OrderManager:
     # 수수료율 (매수/매도 수수료 + 거래세)
     COMMISSION_RATE = Decimal('0.00018')  # 0.018%
     
-    def __init__(self, kiwoom_client: KiwoomAPIClient):
+    # 체결 조회 API 폴링 간격 (초): 짧게 시작해서 두 배씩 늘려 최대값까지
+    POLL_INITIAL_DELAY = 0.1
+    POLL_MAX_DELAY = 1.0
+    # 실시간 체결 수신 중 메시지 누락에 대비한 체결 조회 간격 (초)
+    STREAM_POLL_INTERVAL = 2.0
+    
+    def __init__(self, kiwoom_client: KiwoomAPIClient, order_events: Optional[OrderEventStream] = None):
         """
         주문 관리자를 초기화합니다.
         
         Args:
             kiwoom_client: 키움증권 API 클라이언트
+            order_events: 실시간 주문체결 수신기 (None이면 체결 조회 API로만 확인)
         """
         self.kiwoom = kiwoom_client
+        self.order_events = order_events
         logger.info("주문 관리자 초기화 완료")
     
     def _calculate_buy_quantity(self, available_amount: Decimal, price: Decimal) -> int:
@@ -382,7 +391,6 @@ class OrderManager:
             logger.info(f"체결 확인 중: 주문번호 {order_number}, 종목 {stock_code}")
             
             for attempt in range(max_retries):
-                # 체결 내역 조회 (TR: ka10076)
                 orders = self.kiwoom.get_order_status(stock_code=stock_code, order_number=order_number)
                 
                 if not orders or len(orders) == 0:
@@ -390,35 +398,12 @@ class OrderManager:
                     time.sleep(1)
                     continue
                 
-                order = orders[0]
-                
-                # 체결 확인
-                executed_quantity = order['executed_quantity']
-                order_quantity = order['order_quantity']
+                execution = self._parse_execution(orders, order_number)
+                if execution:
+                    return execution
                 
-                if executed_quantity > 0:
-                    executed_price = order['executed_price']
-                    executed_amount = executed_price * Decimal(str(executed_quantity))
-                    
-                    if executed_quantity == order_quantity:
-                        logger.info(f"✅ 전량 체결 완료: {executed_quantity}주 @ {executed_price:,}원")
-                        return {
-                            'executed': True,
-                            'executed_quantity': executed_quantity,
-                            'executed_price': executed_price,
-                            'executed_amount': executed_amount
-                        }
-                    else:
-                        logger.info(f"⚠️ 부분 체결: {executed_quantity}/{order_quantity}주")
-                        return {
-                            'executed': False,
-                            'executed_quantity': executed_quantity,
-                            'executed_price': executed_price,
-                            'executed_amount': executed_amount
-                        }
-                else:
-                    logger.debug(f"미체결 (시도 {attempt+1}/{max_retries})")
-                    time.sleep(2)
+                logger.debug(f"미체결 (시도 {attempt+1}/{max_retries})")
+                time.sleep(2)
             
             logger.warning("주문이 아직 체결되지 않았습니다")
             return None
@@ -427,6 +412,106 @@ class OrderManager:
             logger.error(f"체결 확인 중 오류 발생: {e}")
             return None
     
+    def _parse_execution(self, orders: list, order_number: str) -> Optional[Dict]:
+        """
+        체결 조회(ka10076) 결과에서 주문의 체결 정보를 추출합니다.
+        
+        Args:
+            orders: KiwoomAPIClient.get_order_status() 결과
+            order_number: 주문번호
+            
+        Returns:
+            Optional[Dict]: 체결 정보 (체결 수량이 없으면 None, 일부만 체결되면 executed=False)
+        """
+        order = next((item for item in orders if item['order_number'] == order_number), orders[0])
+        
+        executed_quantity = order['executed_quantity']
+        order_quantity = order['order_quantity']
+        if executed_quantity <= 0:
+            return None
+        
+        executed_price = order['executed_price']
+        executed_amount = executed_price * Decimal(str(executed_quantity))
+        
+        if executed_quantity == order_quantity:
+            logger.info(f"✅ 전량 체결 완료: {executed_quantity}주 @ {executed_price:,}원")
+        else:
+            logger.info(f"⚠️ 부분 체결: {executed_quantity}/{order_quantity}주")
+        
+        return {
+            'executed': executed_quantity == order_quantity,
+            'executed_quantity': executed_quantity,
+            'executed_price': executed_price,
+            'executed_amount': executed_amount
+        }
+    
+    def wait_for_execution(self, order_number: str, stock_code: str, timeout: float) -> Optional[Dict]:
+        """
+        주문이 전량 체결될 때까지 기다립니다.
+        
+        실시간 주문체결 수신기가 연결되어 있으면 체결 메시지가 도착하는 즉시 반환합니다.
+        수신기가 없거나 연결이 끊긴 경우에는 체결 조회 API(ka10076)를 0.1초부터 두 배씩
+        늘린 간격(최대 1초)으로 호출하고, 연결된 경우에도 메시지 누락에 대비해 2초마다 조회합니다.
+        
+        Args:
+            order_number: 주문번호
+            stock_code: 종목코드
+            timeout: 최대 대기 시간 (초, 0이면 한 번만 조회)
+            
+        Returns:
+            Optional[Dict]: 체결 정보 (check_order_execution()과 같은 형식,
+                시간 초과 시 그때까지의 부분 체결 정보 또는 None)
+        """
+        started_at = time.monotonic()
+        deadline = started_at + max(0.0, timeout)
+        stream = self.order_events
+        latest = None
+        
+        delay = self.POLL_INITIAL_DELAY
+        next_poll_at = started_at + (self.STREAM_POLL_INTERVAL if stream and stream.connected else 0)
+        
+        while True:
+            # 1. 실시간 체결 수신 결과 확인
+            if stream is not None:
+                execution = stream.get_execution(order_number)
+                if execution:
+                    latest = execution
+                    if execution['executed']:
+                        logger.info(f"✅ 실시간 체결 수신: {execution['executed_quantity']}주 @ {execution['executed_price']:,}원 "
+                                    f"({(time.monotonic() - started_at) * 1000:.0f}ms)")
+                        return execution
+            
+            # 2. 체결 조회 API 폴링 (수신기 미연결 시 짧은 간격, 연결 시 누락 대비)
+            now = time.monotonic()
+            if now >= next_poll_at:
+                try:
+                    orders = self.kiwoom.get_order_status(stock_code=stock_code, order_number=order_number)
+                    execution = self._parse_execution(orders, order_number) if orders else None
+                except Exception as e:
+                    logger.error(f"체결 조회 중 오류 발생: {e}")
+                    execution = None
+                
+                if execution:
+                    latest = execution
+                    if execution['executed']:
+                        return execution
+                
+                streaming = stream is not None and stream.connected
+                next_poll_at = time.monotonic() + (self.STREAM_POLL_INTERVAL if streaming else delay)
+                delay = min(delay * 2, self.POLL_MAX_DELAY)
+            
+            # 3. 다음 확인까지 대기 (실시간 체결이 도착하면 즉시 깨어남)
+            now = time.monotonic()
+            if now >= deadline:
+                logger.warning(f"주문 {order_number}이 {timeout:g}초 안에 전량 체결되지 않았습니다")
+                return latest
+            
+            wait_seconds = min(next_poll_at, deadline) - now
+            if stream is not None:
+                stream.wait_for_execution(order_number, wait_seconds)
+            else:
+                time.sleep(wait_seconds)
+    
     def has_pending_orders(self, stock_code: str) -> bool:
         """
         특정 종목의 미체결 주문이 있는지 확인합니다.
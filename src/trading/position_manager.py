@@ -4,7 +4,7 @@
 이 모듈은 보유 주식 포지션을 관리하고 보유 기간별 매도 전략을 실행합니다.
 """
 
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Optional, List
 from decimal import Decimal
 from datetime import datetime, timedelta
 from loguru import logger
@@ -15,14 +15,27 @@ from src.trading.kiwoom_client import KiwoomAPIClient
 class PositionManager:
     """포지션 관리 클래스"""
     
-    def __init__(self, kiwoom_client: KiwoomAPIClient):
+    def __init__(self, kiwoom_client: KiwoomAPIClient, config: Optional[Dict] = None,
+                 clock: Optional[Callable[[], datetime]] = None):
         """
         포지션 관리자를 초기화합니다.
         
         Args:
             kiwoom_client: 키움증권 API 클라이언트
+            config: 거래 설정 (None이면 TRADING_CONFIG 사용)
+            clock: 현재 시각을 반환하는 함수 (None이면 실제 시각, 백테스트에서 시뮬레이션 시각 지정)
         """
         self.kiwoom = kiwoom_client
+        self.clock = clock or datetime.now
+        
+        if config is None:
+            from config.settings import TRADING_CONFIG
+            config = TRADING_CONFIG
+        self.profit_target = Decimal(str(config.get('profit_target', '0.03')))  # 익절 목표
+        self.stop_loss_rate = Decimal(str(config.get('stop_loss_5days', '-0.01')))  # 조건부 매도 구간 손절률
+        self.hold_period_soft = config.get('hold_period_soft', 5)  # 조건부 매도 보유일
+        self.hold_period_hard = config.get('hold_period_hard', 10)  # 무조건 매도 보유일
+        
         logger.info("포지션 관리자 초기화 완료")
     
     def get_current_position(self) -> Optional[Dict]:
@@ -71,7 +84,7 @@ class PositionManager:
         Returns:
             int: 보유 일수
         """
-        now = datetime.now()
+        now = self.clock()
         delta = now - buy_date
         holding_days = delta.days
         
@@ -104,36 +117,40 @@ class PositionManager:
                    f"현재가={current_price:,}원, 매수가={avg_price:,}원, "
                    f"등락률={price_ratio*100:.2f}%")
         
+        hard_days = self.hold_period_hard
+        soft_days = self.hold_period_soft
+        target_pct = float(self.profit_target * 100)
+        
         # 10일 경과: 무조건 시장가 매도
-        if holding_days >= 10:
-            logger.warning(f"⚠️ 10일 경과 → 무조건 시장가 매도")
+        if holding_days >= hard_days:
+            logger.warning(f"⚠️ {hard_days}일 경과 → 무조건 시장가 매도")
             return {
                 'should_sell': True,
                 'sell_type': 'market',
-                'reason': f'10일 경과 (보유 {holding_days}일)',
+                'reason': f'{hard_days}일 경과 (보유 {holding_days}일)',
                 'target_price': None
             }
         
         # 5일 경과: 조건부 매도
-        if holding_days >= 5:
+        if holding_days >= soft_days:
             # 현재가가 매수가 ~ 매수가+3% 사이: 시장가 매도
-            if Decimal('0') <= price_ratio < Decimal('0.03'):
-                logger.warning(f"⚠️ 5일 경과 + 현재가 매수가~매수가+3% → 시장가 매도")
+            if Decimal('0') <= price_ratio < self.profit_target:
+                logger.warning(f"⚠️ {soft_days}일 경과 + 현재가 매수가~매수가+{target_pct:g}% → 시장가 매도")
                 return {
                     'should_sell': True,
                     'sell_type': 'market',
-                    'reason': f'5일 경과, 현재가 {price_ratio*100:.2f}% (0~3% 구간)',
+                    'reason': f'{soft_days}일 경과, 현재가 {price_ratio*100:.2f}% (0~{target_pct:g}% 구간)',
                     'target_price': None
                 }
             
             # 현재가가 매수가 미만: 매수가 -1% 손절가 설정
             elif price_ratio < Decimal('0'):
-                stop_loss_price = avg_price * Decimal('0.99')
-                logger.warning(f"⚠️ 5일 경과 + 현재가 매수가 미만 → 손절가 설정 ({stop_loss_price:,}원)")
+                stop_loss_price = avg_price * (Decimal('1') + self.stop_loss_rate)
+                logger.warning(f"⚠️ {soft_days}일 경과 + 현재가 매수가 미만 → 손절가 설정 ({stop_loss_price:,}원)")
                 return {
                     'should_sell': True,
                     'sell_type': 'limit',
-                    'reason': f'5일 경과, 손절가 설정 (매수가 -1%)',
+                    'reason': f'{soft_days}일 경과, 손절가 설정 (매수가 {float(self.stop_loss_rate * 100):g}%)',
                     'target_price': stop_loss_price
                 }
         
@@ -174,13 +191,14 @@ class PositionManager:
             
             # 1. 매도 주문이 설정되지 않은 경우 → 기본 익절가(+3%) 설정
             if not has_sell_order:
-                logger.info("매도 주문 미설정 → 기본 익절가(+3%) 설정")
+                target_pct = float(self.profit_target * 100)
+                logger.info(f"매도 주문 미설정 → 기본 익절가(+{target_pct:g}%) 설정")
                 return {
                     'action': 'place_order',
                     'sell_type': 'limit',
-                    'target_price': avg_price * Decimal('1.03'),
-                    'profit_rate': Decimal('0.03'),
-                    'reason': '기본 익절가 설정 (매수가 +3%)'
+                    'target_price': avg_price * (Decimal('1') + self.profit_target),
+                    'profit_rate': self.profit_target,
+                    'reason': f'기본 익절가 설정 (매수가 +{target_pct:g}%)'
                 }
             
             # 2. 보유 기간에 따른 매도 전략
@@ -0,0 +1,146 @@
+"""
+키움증권 접속 토큰 보관 모듈
+
+이 모듈은 발급받은 접속 토큰(au10001)을 파일에 보관하여, 프로그램을 다시 시작하거나
+클라이언트를 새로 만들어도 만료 전까지 같은 토큰을 재사용하게 합니다.
+토큰은 앱 키와 접속 주소 조합별로 구분하며, 파일은 소유자만 읽고 쓸 수 있도록(0600) 생성합니다.
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from loguru import logger
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False  # Windows: 프로세스 간 잠금 없이 스레드 간에만 직렬화
+
+EXPIRES_FORMAT = '%Y%m%d%H%M%S'
+
+
+class TokenCache:
+    """앱 키/접속 주소별 접속 토큰을 파일에 보관하는 클래스"""
+
+    def __init__(self, file_path: str):
+        """
+        토큰 보관 파일을 초기화합니다.
+
+        Args:
+            file_path: 토큰 보관 파일 경로 (JSON)
+        """
+        self.file_path = file_path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(app_key: str, base_url: str) -> str:
+        """앱 키 원문을 파일에 남기지 않도록 앱 키와 접속 주소의 해시를 키로 사용합니다."""
+        return hashlib.sha256(f"{base_url}|{app_key}".encode()).hexdigest()[:32]
+
+    @contextmanager
+    def lock(self):
+        """
+        토큰 갱신 구간을 직렬화합니다. (같은 프로세스의 스레드와 다른 프로세스 모두)
+
+        잠금을 얻은 뒤 파일을 다시 읽으면 먼저 갱신한 쪽의 토큰을 재사용할 수 있습니다.
+        """
+        with self._lock:
+            if not FCNTL_AVAILABLE:
+                yield
+                return
+
+            lock_fd = os.open(f"{self.file_path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(lock_fd, fcntl.LOCK_EX)
+                yield
+            finally:
+                fcntl.flock(lock_fd, fcntl.LOCK_UN)
+                os.close(lock_fd)
+
+    def load(self, app_key: str, base_url: str) -> Optional[Tuple[str, datetime]]:
+        """
+        보관된 토큰을 반환합니다.
+
+        Args:
+            app_key: 키움증권 앱 키
+            base_url: 접속 주소
+
+        Returns:
+            Optional[Tuple[str, datetime]]: (토큰, 서버가 알려준 만료 시각), 없으면 None
+        """
+        entry = self._read().get(self.make_key(app_key, base_url))
+        if not entry:
+            return None
+
+        try:
+            return entry['token'], datetime.strptime(entry['expires_dt'], EXPIRES_FORMAT)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def save(self, app_key: str, base_url: str, token: str, expires_at: datetime):
+        """
+        토큰을 보관합니다. (만료된 다른 토큰은 함께 정리)
+
+        Args:
+            app_key: 키움증권 앱 키
+            base_url: 접속 주소
+            token: 접속 토큰
+            expires_at: 서버가 알려준 만료 시각
+        """
+        now = datetime.now().strftime(EXPIRES_FORMAT)
+        entries = {
+            key: entry for key, entry in self._read().items()
+            if isinstance(entry, dict) and str(entry.get('expires_dt', '')) > now
+        }
+        entries[self.make_key(app_key, base_url)] = {
+            'token': token,
+            'expires_dt': expires_at.strftime(EXPIRES_FORMAT),
+        }
+        self._write(entries)
+
+    def delete(self, app_key: str, base_url: str):
+        """
+        보관된 토큰을 삭제합니다. (서버가 토큰을 거부한 경우)
+
+        Args:
+            app_key: 키움증권 앱 키
+            base_url: 접속 주소
+        """
+        entries = self._read()
+        if entries.pop(self.make_key(app_key, base_url), None) is not None:
+            self._write(entries)
+
+    def _read(self) -> Dict[str, Dict[str, str]]:
+        """보관 파일을 읽습니다. (없거나 손상된 경우 빈 목록)"""
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"접속 토큰 보관 파일을 읽을 수 없습니다: {e}")
+            return {}
+
+    def _write(self, entries: Dict[str, Dict[str, str]]):
+        """소유자 전용 권한의 임시 파일에 쓴 뒤 교체합니다. (쓰는 중 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록)"""
+        directory = os.path.dirname(self.file_path) or '.'
+        fd, temp_path = tempfile.mkstemp(prefix='.kiwoom_token.', dir=directory)  # mkstemp는 0600으로 생성
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+            os.replace(temp_path, self.file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
@@ -4,7 +4,7 @@
 이 모듈은 공시 기반 매수 조건 판단 및 전체 거래 전략을 관리합니다.
 """
 
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Optional, List
 from decimal import Decimal
 from datetime import datetime
 from loguru import logger
@@ -23,9 +23,14 @@ class TradingStrategy:
     MIN_SCORE = 8  # 최소 투자 점수
     PROFIT_TARGET = Decimal('0.03')  # 3% 익절 목표
     
+    # 체결 대기 최대 시간 (초)
+    EXECUTION_TIMEOUT = 10
+    
     def __init__(self, kiwoom_client: KiwoomAPIClient, 
                  order_manager: OrderManager,
-                 position_manager: PositionManager):
+                 position_manager: PositionManager,
+                 config: Optional[Dict] = None,
+                 clock: Optional[Callable[[], datetime]] = None):
         """
         거래 전략을 초기화합니다.
         
@@ -33,13 +38,37 @@ class TradingStrategy:
             kiwoom_client: 키움증권 API 클라이언트
             order_manager: 주문 관리자
             position_manager: 포지션 관리자
+            config: 거래 설정 (None이면 TRADING_CONFIG 사용)
+            clock: 현재 시각을 반환하는 함수 (None이면 실제 시각, 백테스트에서 시뮬레이션 시각 지정)
         """
         self.kiwoom = kiwoom_client
         self.order_mgr = order_manager
         self.position_mgr = position_manager
+        self.clock = clock
+        self.execution_timeout = self.EXECUTION_TIMEOUT
+        
+        if config is None:
+            from config.settings import TRADING_CONFIG
+            config = TRADING_CONFIG
+        self.min_score = config.get('min_score', self.MIN_SCORE)
+        self.profit_target = Decimal(str(config.get('profit_target', self.PROFIT_TARGET)))
         
         logger.info("거래 전략 초기화 완료")
     
+    def _now(self) -> datetime:
+        """
+        현재 한국 시각을 반환합니다. (clock이 지정된 경우 해당 시각)
+        
+        Returns:
+            datetime: 한국 시간대 현재 시각
+        """
+        kst = pytz.timezone('Asia/Seoul')
+        if self.clock is None:
+            return datetime.now(kst)
+        
+        now = self.clock()
+        return kst.localize(now) if now.tzinfo is None else now.astimezone(kst)
+    
     def _is_today_disclosure(self, disclosure_date: str) -> bool:
         """
         공시가 오늘 날짜인지 확인합니다.
@@ -52,8 +81,7 @@ class TradingStrategy:
         """
         try:
             # 한국 시간대 기준
-            kst = pytz.timezone('Asia/Seoul')
-            today = datetime.now(kst).strftime('%Y%m%d')
+            today = self._now().strftime('%Y%m%d')
             
             is_today = disclosure_date == today
             logger.debug(f"공시 날짜 확인: {disclosure_date} (오늘: {today}) → {is_today}")
@@ -85,16 +113,17 @@ class TradingStrategy:
             
             # 조건 체크 결과
             checks = []
+            now = self._now() if self.clock else None
             
             # 1. 시장 개장 확인
-            if not is_market_open():
+            if not is_market_open(now):
                 reason = "시장 휴장일"
                 logger.warning(f"❌ {reason}")
                 return {'should_buy': False, 'reason': reason, 'score': 0}
             checks.append("✅ 시장 개장일")
             
             # 2. 거래 시간 확인 (09:00 ~ 15:20, 마감 10분 전까지만 매수)
-            if not is_trading_hours(allow_buy=True):
+            if not is_trading_hours(allow_buy=True, check_time=now):
                 reason = "거래 시간 외 (매수는 09:00~15:20만 가능)"
                 logger.warning(f"❌ {reason}")
                 return {'should_buy': False, 'reason': reason, 'score': 0}
@@ -110,8 +139,8 @@ class TradingStrategy:
             
             # 4. 투자 점수 확인
             score = analysis_result.recommendation_score if analysis_result else 0
-            if score < self.MIN_SCORE:
-                reason = f"투자 점수 부족 ({score}점 < {self.MIN_SCORE}점)"
+            if score < self.min_score:
+                reason = f"투자 점수 부족 ({score}점 < {self.min_score}점)"
                 logger.info(f"❌ {reason}")
                 return {'should_buy': False, 'reason': reason, 'score': score}
             checks.append(f"✅ 투자 점수 충족 ({score}점)")
@@ -201,58 +230,51 @@ class TradingStrategy:
             order_number = order_result['order_number']
             logger.info(f"✅ 1단계 성공: 매수 주문 완료 (주문번호: {order_number})")
             
-            # 2. 체결 확인 (최대 10초 대기)
+            # 2. 체결 확인 (실시간 체결 수신 또는 체결 조회, 최대 execution_timeout초 대기)
             logger.info("⏳ 2단계: 매수 체결 확인 중...")
-            import time
             
-            for attempt in range(5):
-                time.sleep(2)
-                logger.debug(f"체결 확인 시도 {attempt+1}/5...")
+            execution = self.order_mgr.wait_for_execution(order_number, stock_code, timeout=self.execution_timeout)
+            if execution and execution['executed']:
+                logger.info(f"✅ 2단계 성공: 매수 체결 완료")
+                logger.info(f"   📊 체결 수량: {execution['executed_quantity']}주")
+                logger.info(f"   💰 체결 가격: {execution['executed_price']:,}원")
+                logger.info(f"   💵 체결 금액: {execution['executed_amount']:,}원")
                 
-                execution = self.order_mgr.check_order_execution(order_number, stock_code)
-                if execution and execution['executed']:
-                    logger.info(f"✅ 2단계 성공: 매수 체결 완료")
-                    logger.info(f"   📊 체결 수량: {execution['executed_quantity']}주")
-                    logger.info(f"   💰 체결 가격: {execution['executed_price']:,}원")
-                    logger.info(f"   💵 체결 금액: {execution['executed_amount']:,}원")
-                    
-                    # 3. 익절 매도 주문 설정 (+3%)
-                    logger.info("📈 3단계: 익절 매도 주문 설정 중...")
-                    sell_result = self.order_mgr.place_limit_sell_order(
-                        stock_code=stock_code,
-                        stock_name=stock_name,
-                        quantity=execution['executed_quantity'],
-                        buy_price=execution['executed_price'],
-                        profit_rate=self.PROFIT_TARGET
-                    )
-                    
-                    if sell_result:
-                        logger.info(f"✅ 3단계 성공: 익절 매도 주문 설정 완료")
-                        logger.info(f"   🎯 목표가: {sell_result['sell_price']:,}원 (+{self.PROFIT_TARGET*100:.1f}%)")
-                    else:
-                        logger.warning("⚠️ 3단계 경고: 익절 매도 주문 설정 실패 (나중에 재시도)")
-                    
-                    logger.info("🎉 매수 전략 실행 완료!")
-                    logger.info("=" * 60)
-                    
-                    return {
-                        'order_number': order_number,
-                        'stock_code': stock_code,
-                        'stock_name': stock_name,
-                        'quantity': execution['executed_quantity'],
-                        'executed_price': execution['executed_price'],
-                        'executed_amount': execution['executed_amount'],
-                        'buy_time': datetime.now(),
-                        'sell_order_number': sell_result['order_number'] if sell_result else None
-                    }
+                # 3. 익절 매도 주문 설정 (+3%)
+                logger.info("📈 3단계: 익절 매도 주문 설정 중...")
+                sell_result = self.order_mgr.place_limit_sell_order(
+                    stock_code=stock_code,
+                    stock_name=stock_name,
+                    quantity=execution['executed_quantity'],
+                    buy_price=execution['executed_price'],
+                    profit_rate=self.profit_target
+                )
+                
+                if sell_result:
+                    logger.info(f"✅ 3단계 성공: 익절 매도 주문 설정 완료")
+                    logger.info(f"   🎯 목표가: {sell_result['sell_price']:,}원 (+{self.profit_target*100:.1f}%)")
+                else:
+                    logger.warning("⚠️ 3단계 경고: 익절 매도 주문 설정 실패 (나중에 재시도)")
                 
-                logger.debug(f"   ⏳ 체결 대기 중... (2초 후 재시도)")
+                logger.info("🎉 매수 전략 실행 완료!")
+                logger.info("=" * 60)
+                
+                return {
+                    'order_number': order_number,
+                    'stock_code': stock_code,
+                    'stock_name': stock_name,
+                    'quantity': execution['executed_quantity'],
+                    'executed_price': execution['executed_price'],
+                    'executed_amount': execution['executed_amount'],
+                    'buy_time': self.clock() if self.clock else datetime.now(),
+                    'sell_order_number': sell_result['order_number'] if sell_result else None
+                }
             
             # 체결 확인 실패
             error_info = {
                 'step': '매수 체결 확인',
                 'error_type': '체결 확인 타임아웃',
-                'error_message': '매수 주문은 성공했지만 10초 내에 체결을 확인할 수 없었습니다',
+                'error_message': f'매수 주문은 성공했지만 {self.execution_timeout}초 내에 체결을 확인할 수 없었습니다',
                 'order_number': order_number,
                 'possible_causes': [
                     '시장가 주문이지만 호가가 없어 체결 지연',
@@ -347,10 +369,10 @@ class TradingStrategy:
                     if sell_result:
                         logger.info(f"✅ 시장가 매도 주문 완료")
                         
-                        # 체결 확인
-                        import time
-                        time.sleep(2)
-                        execution = self.order_mgr.check_order_execution(sell_result['order_number'], stock_code)
+                        # 체결 확인 (실시간 체결 수신 또는 체결 조회)
+                        execution = self.order_mgr.wait_for_execution(
+                            sell_result['order_number'], stock_code, timeout=self.execution_timeout
+                        )
                         
                         if execution and execution['executed']:
                             executed_price = execution['executed_price']
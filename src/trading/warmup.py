@@ -0,0 +1,171 @@
+"""
+장 시작 전 거래 경로 준비 모듈
+
+이 모듈은 거래일 개장 전에 키움증권 인증, 연결(TLS) 수립, 계좌 정보 조회, 시장지수 시세 조회를
+미리 수행하고, 장중에는 가벼운 계좌 조회로 연결과 계좌 정보를 최신 상태로 유지합니다.
+그날 첫 공시의 매수 주문이 인증/연결/예수금 조회를 기다리지 않도록 하기 위함입니다.
+(상주 모드처럼 시스템 인스턴스가 계속 유지될 때만 의미가 있습니다.)
+"""
+
+import time
+import threading
+from datetime import datetime, timedelta
+from typing import Optional, Sequence
+from loguru import logger
+
+from src.utils.market_schedule import KoreanMarketSchedule, market_schedule
+
+
+class TradingWarmup:
+    """개장 전 거래 경로를 준비하고 장중 연결을 유지하는 클래스"""
+
+    # 시장지수 200일 이동평균 계산에 쓰는 조회 기간 (StockAnalyzer와 동일)
+    INDEX_LOOKBACK_DAYS = 150
+
+    def __init__(self, auto_trading, minutes_before_open: int = 10, keepalive_seconds: float = 30,
+                 market_types: Sequence[str] = ('KOSPI', 'KOSDAQ'),
+                 schedule: Optional[KoreanMarketSchedule] = None):
+        """
+        거래 경로 준비기를 초기화합니다.
+
+        Args:
+            auto_trading: 자동매매 시스템 (재연결 후에도 현재 구성요소를 사용하도록 시스템 자체를 참조)
+            minutes_before_open: 정규장 개장 몇 분 전부터 준비할지
+            keepalive_seconds: 장중 계좌 조회(연결 유지) 간격 (초)
+            market_types: 미리 조회할 시장지수 (빈 값이면 생략)
+            schedule: 시장 스케줄 (None이면 전역 스케줄 사용)
+        """
+        self.auto_trading = auto_trading
+        self.minutes_before_open = minutes_before_open
+        self.keepalive_seconds = keepalive_seconds
+        self.market_types = tuple(market_types)
+        self.schedule = schedule or market_schedule
+
+        self.is_warm = False
+        self._default_snapshot_ttl: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def start(self) -> 'TradingWarmup':
+        """준비/유지 스레드를 시작합니다."""
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name='trading-warmup', daemon=True)
+        self._thread.start()
+        logger.info(f"🔥 거래 경로 준비 스레드 시작 (개장 {self.minutes_before_open}분 전부터, "
+                    f"{self.keepalive_seconds:g}초마다 연결 유지)")
+        return self
+
+    def stop(self):
+        """준비/유지 스레드를 중지합니다."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._cool_down()
+
+    def _run(self):
+        """준비 시간이면 거래 경로를 준비하거나 유지합니다."""
+        while not self._stopped.is_set():
+            try:
+                self.tick()
+            except Exception as e:
+                logger.error(f"거래 경로 준비 중 오류 발생: {e}")
+            self._stopped.wait(self.keepalive_seconds)
+
+    def tick(self, now: Optional[datetime] = None) -> bool:
+        """
+        현재 시각에 맞춰 준비, 유지, 해제 중 하나를 수행합니다.
+
+        Args:
+            now: 기준 시각 (None이면 현재 시각)
+
+        Returns:
+            bool: 거래 경로가 준비된 상태인지 여부
+        """
+        if not self.schedule.is_trading_warmup_time(now, self.minutes_before_open):
+            if self.is_warm:
+                self._cool_down()
+                logger.info("🌙 장 마감 - 거래 경로 유지 종료")
+            return False
+
+        if not self.auto_trading.trading_enabled or not hasattr(self.auto_trading, 'kiwoom_client'):
+            return False
+
+        if self.is_warm:
+            self.keep_alive()
+        else:
+            self.warm_up()
+        return self.is_warm
+
+    def warm_up(self) -> bool:
+        """
+        인증, 연결 수립, 계좌 정보 조회, 시장지수 조회를 미리 수행합니다.
+
+        Returns:
+            bool: 준비 성공 여부
+        """
+        started_at = time.perf_counter()
+        kiwoom = self.auto_trading.kiwoom_client
+
+        # 1. 인증 (보관된 토큰이 있으면 재사용)
+        if not kiwoom.authenticate():
+            logger.warning("⚠️ 거래 경로 준비 실패: 키움증권 인증 실패 (다음 주기에 재시도)")
+            return False
+
+        # 2. 계좌 정보 조회 (연결 수립, 매수 수량 계산에 쓰는 예수금 보관)
+        if kiwoom.get_account_snapshot(force_refresh=True) is None:
+            logger.warning("⚠️ 거래 경로 준비 실패: 계좌 정보 조회 실패 (다음 주기에 재시도)")
+            return False
+
+        # 3. 시장지수 시세 (모든 종목 분석이 같은 지수를 사용하므로 미리 캐시에 적재)
+        self._warm_market_index()
+
+        self.is_warm = True
+        self._extend_snapshot_ttl()
+        logger.info(f"🔥 거래 경로 준비 완료 ({time.perf_counter() - started_at:.2f}초)")
+        return True
+
+    def keep_alive(self):
+        """계좌 정보가 오래됐으면 다시 조회하여 연결과 계좌 정보를 최신 상태로 유지합니다."""
+        kiwoom = self.auto_trading.kiwoom_client
+        snapshot = kiwoom.get_account_snapshot()
+        if snapshot is not None and snapshot.age() >= self.keepalive_seconds:
+            kiwoom.get_account_snapshot(force_refresh=True)
+        self._extend_snapshot_ttl()
+
+    def _warm_market_index(self):
+        """분석기의 시장지수 조회를 미리 수행합니다. (실패해도 준비는 계속)"""
+        pykrx_client = getattr(self.auto_trading.stock_analyzer, 'pykrx_client', None)
+        if pykrx_client is None or not self.market_types:
+            return
+
+        today = datetime.now().strftime("%Y%m%d")
+        start_date = (datetime.now() - timedelta(days=self.INDEX_LOOKBACK_DAYS)).strftime("%Y%m%d")
+        for market_type in self.market_types:
+            try:
+                pykrx_client.get_market_index(market_type, start_date, today)
+            except Exception as e:
+                logger.warning(f"시장지수 미리 조회 실패 ({market_type}): {e}")
+
+    def _extend_snapshot_ttl(self):
+        """
+        실시간 체결 수신 중에는 계좌 정보 재사용 시간을 연결 유지 간격보다 길게 설정합니다.
+
+        주문/체결 시 계좌 정보가 즉시 폐기되므로, 체결을 수신하고 있다면 연결 유지 조회로 얻은
+        계좌 정보를 첫 매수 주문에 그대로 사용해도 됩니다. 수신이 끊기면 원래 재사용 시간으로 돌립니다.
+        """
+        kiwoom = self.auto_trading.kiwoom_client
+        if self._default_snapshot_ttl is None:
+            self._default_snapshot_ttl = kiwoom.account_snapshot_ttl
+
+        order_events = getattr(self.auto_trading, 'order_events', None)
+        if order_events is not None and order_events.connected:
+            kiwoom.account_snapshot_ttl = max(self._default_snapshot_ttl, self.keepalive_seconds * 1.5)
+        else:
+            kiwoom.account_snapshot_ttl = self._default_snapshot_ttl
+
+    def _cool_down(self):
+        """준비 상태를 해제하고 계좌 정보 재사용 시간을 원래대로 돌립니다."""
+        if self._default_snapshot_ttl is not None and hasattr(self.auto_trading, 'kiwoom_client'):
+            self.auto_trading.kiwoom_client.account_snapshot_ttl = self._default_snapshot_ttl
+        self._default_snapshot_ttl = None
+        self.is_warm = False
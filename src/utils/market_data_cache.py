@@ -0,0 +1,213 @@
+"""
+일별 시세 데이터 캐시
+
+이 모듈은 pykrx로 조회한 일별 시세(주식/지수 OHLCV, 시가총액)를 (종목코드, 거래일) 단위로
+디스크에 보관합니다. 확정된 과거 거래일 데이터는 한 번만 받아오고 이후에는 없는 구간(주로 최근 거래일)만
+조회하며, 장중에 계속 바뀌는 당일 데이터는 짧은 시간 동안만 메모리에 보관합니다.
+"""
+
+import os
+import time
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional, Tuple
+import pandas as pd
+import pytz
+from loguru import logger
+
+KST = pytz.timezone('Asia/Seoul')
+
+
+def _shift_date(date_str: str, days: int) -> str:
+    """YYYYMMDD 날짜를 days일 만큼 이동합니다."""
+    return (datetime.strptime(date_str, "%Y%m%d") + timedelta(days=days)).strftime("%Y%m%d")
+
+
+class MarketDataCache:
+    """일별 시세를 (종목코드, 거래일) 단위로 디스크에 보관하는 캐시 클래스"""
+
+    def __init__(self, directory: str, live_ttl_seconds: float = 60):
+        """
+        시세 캐시를 초기화합니다.
+
+        Args:
+            directory (str): 캐시 파일 저장 디렉토리
+            live_ttl_seconds (float): 당일(미확정) 데이터를 재사용하는 시간 (초)
+        """
+        self.directory = directory
+        self.live_ttl_seconds = live_ttl_seconds
+
+        # (데이터 종류, 종목코드) -> 확정 데이터 {'df', 'covered_from', 'covered_to'}
+        self._entries: Dict[Tuple[str, str], Dict] = {}
+        # (데이터 종류, 종목코드) -> (조회 시각, 당일 데이터)
+        self._live: Dict[Tuple[str, str], Tuple[float, pd.DataFrame]] = {}
+        self._key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        logger.info(f"시세 데이터 캐시 초기화 완료: {directory}")
+
+    def _get_key_lock(self, key: Tuple[str, str]) -> threading.Lock:
+        """같은 종목을 동시에 조회하지 않도록 종목별 잠금을 반환합니다."""
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _file_path(self, key: Tuple[str, str]) -> str:
+        """캐시 파일 경로를 반환합니다."""
+        kind, ticker = key
+        return os.path.join(self.directory, f"{kind}_{ticker}.pkl")
+
+    def _load_entry(self, key: Tuple[str, str]) -> Optional[Dict]:
+        """확정 데이터를 메모리 또는 디스크에서 불러옵니다."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+
+        file_path = self._file_path(key)
+        if not os.path.exists(file_path):
+            return None
+
+        try:
+            entry = pd.read_pickle(file_path)
+            self._entries[key] = entry
+            return entry
+        except Exception as e:
+            logger.warning(f"시세 캐시 파일을 읽을 수 없어 새로 조회합니다: {file_path} ({e})")
+            return None
+
+    def _save_entry(self, key: Tuple[str, str], entry: Dict):
+        """확정 데이터를 디스크에 저장합니다."""
+        self._entries[key] = entry
+        file_path = self._file_path(key)
+        temp_path = f"{file_path}.tmp"
+        try:
+            pd.to_pickle(entry, temp_path)
+            os.replace(temp_path, file_path)
+        except Exception as e:
+            logger.warning(f"시세 캐시 저장 실패: {file_path} ({e})")
+
+    @staticmethod
+    def _merge(base: Optional[pd.DataFrame], new: Optional[pd.DataFrame]) -> pd.DataFrame:
+        """두 데이터를 날짜 기준으로 합칩니다. (중복 날짜는 새 데이터 우선)"""
+        frames = [df for df in (base, new) if df is not None and not df.empty]
+        if not frames:
+            return base if base is not None else (new if new is not None else pd.DataFrame())
+        merged = pd.concat(frames)
+        return merged[~merged.index.duplicated(keep='last')].sort_index()
+
+    def get_bars(self, kind: str, ticker: str, start_date: str, end_date: str,
+                 fetch: Callable[[str, str], pd.DataFrame]) -> pd.DataFrame:
+        """
+        기간의 일별 데이터를 반환합니다. 캐시에 없는 구간만 fetch로 조회합니다.
+
+        Args:
+            kind (str): 데이터 종류 (예: 'stock', 'index', 'cap')
+            ticker (str): 종목/지수 코드
+            start_date (str): 시작일 (YYYYMMDD)
+            end_date (str): 종료일 (YYYYMMDD)
+            fetch (Callable[[str, str], pd.DataFrame]): (시작일, 종료일)로 데이터를 조회하는 함수
+
+        Returns:
+            pd.DataFrame: 날짜 인덱스의 일별 데이터 (없으면 빈 DataFrame)
+        """
+        key = (kind, ticker)
+        today = datetime.now(KST).strftime("%Y%m%d")
+        today_ts = pd.Timestamp(today)
+        hist_end = min(end_date, _shift_date(today, -1))  # 확정된 마지막 거래일 후보
+        include_today = end_date >= today
+
+        with self._get_key_lock(key):
+            entry = self._load_entry(key)
+            entry_changed = False
+
+            # 1. 캐시 구간보다 앞선 과거 구간 (드물게 더 긴 기간을 요청한 경우)
+            if entry is not None and start_date < entry['covered_from'] and start_date <= hist_end:
+                head_end = min(_shift_date(entry['covered_from'], -1), hist_end)
+                head = fetch(start_date, head_end)
+                # 빈 응답은 조회 실패(pykrx 장애 등)일 수 있으므로 조회한 것으로 기록하지 않음
+                if head is not None and not head.empty:
+                    entry = {
+                        'df': self._merge(head, entry['df']),
+                        'covered_from': start_date,
+                        'covered_to': entry['covered_to']
+                    }
+                    entry_changed = True
+
+            # 2. 캐시 이후 구간 + 당일 데이터 (한 번의 조회로 함께 가져옴)
+            tail_from = None
+            if start_date <= hist_end:
+                if entry is None:
+                    tail_from = start_date
+                elif hist_end > entry['covered_to']:
+                    tail_from = _shift_date(entry['covered_to'], 1)
+
+            live = self._live.get(key)
+            live_fresh = live is not None and time.time() - live[0] < self.live_ttl_seconds
+
+            if tail_from or (include_today and not live_fresh):
+                fetch_from = tail_from or today
+                fetch_to = end_date if include_today else hist_end
+                fetched = fetch(fetch_from, fetch_to)
+                logger.debug(f"시세 조회 ({kind}:{ticker}): {fetch_from} ~ {fetch_to}")
+
+                if fetched is not None and not fetched.empty:
+                    hist_part = fetched[fetched.index < today_ts]
+                    live_part = fetched[fetched.index >= today_ts]
+                else:
+                    hist_part = live_part = fetched
+
+                # 빈 응답은 조회 실패일 수 있으므로 구간을 확정 처리하지 않고 다음 조회 때 다시 받음
+                # (한 건이라도 받았다면 그 사이의 빈 날짜는 휴장일)
+                if tail_from and fetched is not None and not fetched.empty:
+                    entry = {
+                        'df': self._merge(entry['df'] if entry else None, hist_part),
+                        'covered_from': entry['covered_from'] if entry else start_date,
+                        'covered_to': hist_end
+                    }
+                    entry_changed = True
+
+                if include_today:
+                    live = (time.time(), live_part)
+                    self._live[key] = live
+
+            if entry_changed:
+                self._save_entry(key, entry)
+
+            hist_df = None
+            if entry is not None and entry['df'] is not None and not entry['df'].empty:
+                hist_df = entry['df'].loc[pd.Timestamp(start_date):pd.Timestamp(hist_end)]
+            live_df = live[1] if include_today and live is not None else None
+
+            return self._merge(hist_df, live_df).copy()
+
+
+# 전역 시세 캐시 인스턴스 (모든 분석기가 공유)
+_global_market_data_cache: Optional[MarketDataCache] = None
+_global_cache_lock = threading.Lock()
+
+
+def get_market_data_cache() -> Optional[MarketDataCache]:
+    """
+    전역 시세 캐시를 반환합니다. (설정에서 비활성화된 경우 None)
+
+    Returns:
+        Optional[MarketDataCache]: 시세 캐시 인스턴스
+    """
+    global _global_market_data_cache
+
+    with _global_cache_lock:
+        if _global_market_data_cache is None:
+            try:
+                from config.settings import MARKET_DATA_CONFIG
+            except ImportError:
+                return None
+
+            if not MARKET_DATA_CONFIG.get('use_cache', False):
+                return None
+
+            _global_market_data_cache = MarketDataCache(
+                MARKET_DATA_CONFIG['cache_dir'],
+                live_ttl_seconds=MARKET_DATA_CONFIG.get('live_ttl_seconds', 60)
+            )
+
+        return _global_market_data_cache
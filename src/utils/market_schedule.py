@@ -127,6 +127,33 @@ class KoreanMarketSchedule:
         logger.warning("10일 내에 다음 거래일을 찾을 수 없습니다.")
         return check_date
     
+    def is_trading_warmup_time(self, check_time: Optional[datetime] = None, minutes_before_open: int = 10) -> bool:
+        """
+        거래 경로(인증, 연결, 계좌 정보)를 미리 준비해 둘 시간인지 확인합니다.
+        거래일의 정규장 개장 minutes_before_open분 전부터 장 마감까지입니다.
+        
+        Args:
+            check_time (Optional[datetime]): 확인할 시점 (None이면 현재 시각)
+            minutes_before_open (int): 개장 몇 분 전부터 준비할지
+            
+        Returns:
+            bool: 준비 시간 여부
+        """
+        if check_time is None:
+            check_time = datetime.now(self.KST)
+        elif check_time.tzinfo is None:
+            check_time = self.KST.localize(check_time)
+        else:
+            check_time = check_time.astimezone(self.KST)
+        
+        if not self.is_trading_day(check_time.date()):
+            return False
+        
+        from datetime import timedelta
+        warmup_start = (datetime.combine(check_time.date(), self.REGULAR_OPEN_TIME)
+                        - timedelta(minutes=minutes_before_open)).time()
+        return warmup_start <= check_time.time() <= self.REGULAR_CLOSE_TIME
+    
     def get_market_status_message(self) -> str:
         """
         현재 시장 상태를 설명하는 메시지를 반환합니다.
@@ -269,8 +296,10 @@ class KoreanMarketSchedule:
 market_schedule = KoreanMarketSchedule()
 
 
-def is_market_open() -> bool:
-    """현재 시장이 열려있는지 간단히 확인하는 함수"""
+def is_market_open(check_time: Optional[datetime] = None) -> bool:
+    """현재(또는 지정한 시점에) 시장이 열려있는지 간단히 확인하는 함수"""
+    if check_time is not None:
+        return market_schedule.is_market_open_at_time(check_time)
     return market_schedule.is_market_open_now()
 
 
@@ -284,21 +313,27 @@ def should_run_dart_scraping() -> Tuple[bool, str]:
     return market_schedule.should_run_scraping()
 
 
-def is_trading_hours(allow_buy: bool = False) -> bool:
+def is_trading_hours(allow_buy: bool = False, check_time: Optional[datetime] = None) -> bool:
     """
     현재 시간이 거래 가능 시간인지 확인합니다.
     
     Args:
         allow_buy: True면 매수 가능 시간(09:00~15:20), False면 매도 가능 시간(09:00~15:30)
+        check_time: 확인할 시점 (None이면 현재 시각, 백테스트에서 시뮬레이션 시각 지정)
         
     Returns:
         bool: 거래 가능 시간 여부
     """
-    now = datetime.now(KoreanMarketSchedule.KST)
+    if check_time is None:
+        now = datetime.now(KoreanMarketSchedule.KST)
+    elif check_time.tzinfo is None:
+        now = KoreanMarketSchedule.KST.localize(check_time)
+    else:
+        now = check_time.astimezone(KoreanMarketSchedule.KST)
     current_time = now.time()
     
     # 거래일인지 확인
-    if not market_schedule.is_trading_day():
+    if not market_schedule.is_trading_day(now.date()):
         return False
     
     # 시간 확인
@@ -0,0 +1,229 @@
+"""
+토큰 버킷 방식의 API 호출 제한 모듈
+
+여러 스레드가 하나의 API 키를 공유할 때 전체 초당 호출 수가
+허용량을 넘지 않도록 조절합니다.
+
+- TokenBucketRateLimiter: 한 프로세스 안의 스레드 간 공유
+- SharedTokenBucketRateLimiter: SQLite 파일로 여러 프로세스가 공유 (버킷별 한도, 일일 호출 수 보관)
+"""
+
+import os
+import time
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+from loguru import logger
+
+
+class TokenBucketRateLimiter:
+    """스레드 간에 공유되는 토큰 버킷 호출 제한 클래스"""
+
+    def __init__(self, rate_per_second: float, burst: int = 1):
+        """
+        토큰 버킷을 초기화합니다.
+
+        Args:
+            rate_per_second (float): 초당 충전되는 토큰 수 (평균 초당 호출 수)
+            burst (int): 버킷 최대 크기 (순간적으로 허용되는 호출 수)
+        """
+        if rate_per_second <= 0:
+            raise ValueError(f"초당 호출 수는 0보다 커야 합니다: {rate_per_second}")
+
+        self.rate_per_second = float(rate_per_second)
+        self.capacity = float(max(1, burst))
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0):
+        """
+        토큰을 확보할 때까지 대기합니다.
+
+        Args:
+            tokens (float): 소모할 토큰 수
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._last_refill
+                self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+                self._last_refill = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+
+                wait_time = (tokens - self._tokens) / self.rate_per_second
+
+            logger.trace(f"API 호출 제한으로 {wait_time:.3f}초 대기 중...")
+            time.sleep(wait_time)
+
+
+class SharedTokenBucketRateLimiter:
+    """여러 프로세스가 SQLite 파일로 공유하는 버킷별 토큰 버킷 호출 제한 클래스"""
+
+    def __init__(self, buckets: Dict[str, Dict[str, float]], db_path: Optional[str] = None,
+                 scope: str = '', max_calls_per_day: int = 0, name: str = 'API'):
+        """
+        공유 토큰 버킷을 초기화합니다.
+
+        Args:
+            buckets (Dict[str, Dict]): 버킷 이름 -> {'rate': 초당 충전 토큰 수, 'burst': 버킷 최대 크기}
+            db_path (Optional[str]): 상태를 공유할 SQLite 파일 경로 (None이면 현재 프로세스 안에서만 제한)
+            scope (str): 같은 파일을 쓰는 다른 API 키의 상태와 구분하는 식별자
+            max_calls_per_day (int): 일일 최대 호출 수 (0이면 제한 없음)
+            name (str): 로그에 표시할 API 이름
+        """
+        for bucket_name, limit in buckets.items():
+            if limit['rate'] <= 0:
+                raise ValueError(f"초당 호출 수는 0보다 커야 합니다: {bucket_name}={limit['rate']}")
+
+        self.buckets = {
+            bucket_name: (float(limit['rate']), float(max(1, limit.get('burst', 1))))
+            for bucket_name, limit in buckets.items()
+        }
+        self.scope = scope or ''
+        self.max_calls_per_day = max_calls_per_day
+        self.name = name
+        self._lock = threading.Lock()
+
+        if db_path:
+            directory = os.path.dirname(db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        # 트랜잭션을 직접 시작(BEGIN IMMEDIATE)하여 프로세스 간 읽기-수정-쓰기를 직렬화
+        self._conn = sqlite3.connect(db_path or ':memory:', timeout=10, isolation_level=None,
+                                     check_same_thread=False)
+        if db_path:
+            # 호출마다 디스크 동기화를 기다리지 않도록 WAL 사용 (전원 장애 시 마지막 몇 건의 기록만 유실)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_tables()
+
+    def _create_tables(self):
+        """버킷 상태와 일일 호출 수 테이블을 생성합니다."""
+        with self._lock:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS rate_buckets (
+                    scope TEXT NOT NULL,
+                    bucket TEXT NOT NULL,
+                    tokens REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (scope, bucket)
+                )
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS daily_usage (
+                    scope TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    calls INTEGER NOT NULL,
+                    PRIMARY KEY (scope, day)
+                )
+                """
+            )
+
+    def acquire(self, bucket_names: Iterable[str]):
+        """
+        지정한 모든 버킷에서 토큰을 하나씩 확보할 때까지 대기합니다.
+        (한 버킷이라도 부족하면 어느 버킷의 토큰도 소모하지 않음)
+
+        Args:
+            bucket_names (Iterable[str]): 소모할 버킷 이름 (설정에 없는 이름은 무시)
+
+        Raises:
+            Exception: 일일 호출 한도를 초과한 경우
+        """
+        names = [bucket_name for bucket_name in dict.fromkeys(bucket_names) if bucket_name in self.buckets]
+
+        while True:
+            with self._lock:
+                wait_time = self._try_acquire(names)
+
+            if wait_time <= 0:
+                return
+
+            logger.trace(f"{self.name} 호출 제한으로 {wait_time:.3f}초 대기 중...")
+            time.sleep(wait_time)
+
+    def _try_acquire(self, names: list) -> float:
+        """
+        한 트랜잭션 안에서 버킷을 충전하고 토큰을 소모합니다.
+
+        Returns:
+            float: 토큰을 확보했으면 0, 부족하면 다시 시도할 때까지 기다릴 시간 (초)
+        """
+        # 여러 프로세스가 비교할 수 있도록 monotonic 대신 벽시계 사용
+        now = time.time()
+        today = datetime.now().strftime('%Y%m%d')
+
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self._conn.execute(
+                "SELECT calls FROM daily_usage WHERE scope = ? AND day = ?", (self.scope, today)
+            ).fetchone()
+            calls = row[0] if row else 0
+            if self.max_calls_per_day and calls >= self.max_calls_per_day:
+                error_msg = f"🚨 {self.name} 일일 호출 한도 초과! 현재: {calls}/{self.max_calls_per_day}회"
+                logger.error(error_msg)
+                raise Exception(error_msg)
+
+            tokens = {}
+            wait_time = 0.0
+            for bucket_name in names:
+                rate, capacity = self.buckets[bucket_name]
+                row = self._conn.execute(
+                    "SELECT tokens, updated_at FROM rate_buckets WHERE scope = ? AND bucket = ?",
+                    (self.scope, bucket_name)
+                ).fetchone()
+                if row is None:
+                    tokens[bucket_name] = capacity
+                else:
+                    elapsed = max(0.0, now - row[1])  # 시계가 뒤로 돌아간 경우 충전하지 않음
+                    tokens[bucket_name] = min(capacity, row[0] + elapsed * rate)
+
+                if tokens[bucket_name] < 1:
+                    wait_time = max(wait_time, (1 - tokens[bucket_name]) / rate)
+
+            if wait_time <= 0:
+                for bucket_name in names:
+                    tokens[bucket_name] -= 1
+                if calls == 0:
+                    # 날짜가 바뀐 첫 호출: 지난 날짜 기록 정리
+                    self._conn.execute("DELETE FROM daily_usage WHERE scope = ? AND day < ?", (self.scope, today))
+                    logger.info(f"{self.name} 호출 카운터 초기화: {today}")
+                self._conn.execute(
+                    "INSERT INTO daily_usage (scope, day, calls) VALUES (?, ?, 1) "
+                    "ON CONFLICT (scope, day) DO UPDATE SET calls = calls + 1",
+                    (self.scope, today)
+                )
+
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO rate_buckets (scope, bucket, tokens, updated_at) VALUES (?, ?, ?, ?)",
+                [(self.scope, bucket_name, bucket_tokens, now) for bucket_name, bucket_tokens in tokens.items()]
+            )
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+
+        return wait_time
+
+    def get_daily_usage(self) -> int:
+        """
+        오늘 호출 수를 반환합니다. (같은 파일을 공유하는 모든 프로세스 합계)
+
+        Returns:
+            int: 오늘 호출 수
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT calls FROM daily_usage WHERE scope = ? AND day = ?",
+                (self.scope, datetime.now().strftime('%Y%m%d'))
+            ).fetchone()
+        return row[0] if row else 0
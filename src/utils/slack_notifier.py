@@ -11,7 +11,7 @@ import os
 from typing import Dict, List, Optional
 from loguru import logger
 from datetime import datetime
-from .stock_analyzer import StockAnalyzer, StockAnalysisResult
+from .stock_analyzer import StockAnalysisResult, get_stock_analyzer
 
 try:
     from googleapiclient.discovery import build
@@ -62,8 +62,8 @@ class SlackNotifier:
                 drive_folder_id
             )
         
-        # 주식 분석기 초기화 (pykrx 기반, API 키 불필요)
-        self.stock_analyzer = StockAnalyzer()
+        # 주식 분석기 (pykrx 기반, API 키 불필요 - 자동매매와 분석 결과 공유)
+        self.stock_analyzer = get_stock_analyzer()
         
         if self.is_enabled:
             logger.info("슬랙 알림이 활성화되었습니다.")
@@ -5,13 +5,23 @@
 계약 정보와 함께 종목 분석을 수행합니다.
 """
 
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from loguru import logger
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import io
 import os
 import tempfile
+import threading
+
+from src.utils.market_data_cache import get_market_data_cache
+from src.utils.stock_screener import (
+    INDEX_MA_WINDOW, VOLUME_AVG_WINDOW, MARKET_CAP_MIN, MARKET_CAP_MAX,
+    CONTRACT_RATIO_THRESHOLD, VOLUME_RATIO_THRESHOLD, INDEX_SCORE, MARKET_CAP_SCORE,
+    CONTRACT_RATIO_SCORE, TRADING_CONDITION_SCORE, ScreeningResult,
+    build_panel, score_contracts_with_index
+)
 
 try:
     from pykrx import stock
@@ -67,6 +77,9 @@ class StockAnalysisResult:
     
     # 차트 이미지 경로
     chart_image_path: Optional[str] = None
+    
+    # 차트 생성용 일별 시세 (차트를 나중에 만들 때 사용)
+    price_history: Optional[object] = field(default=None, repr=False)
 
 
 class PykrxStockDataClient:
@@ -78,8 +91,29 @@ class PykrxStockDataClient:
             logger.error("pykrx 라이브러리를 사용할 수 없습니다.")
             raise ImportError("pykrx 라이브러리가 필요합니다: pip install pykrx")
         
+        # 모든 클라이언트가 공유하는 시세 캐시 (확정된 과거 거래일 데이터 재사용)
+        self.cache = get_market_data_cache()
+        
         logger.info("pykrx 주식 데이터 클라이언트가 초기화되었습니다.")
     
+    def _get_bars(self, kind: str, ticker: str, start_date: str, end_date: str, fetch) -> object:
+        """
+        일별 데이터를 조회합니다. 시세 캐시가 있으면 캐시에 없는 구간만 pykrx로 조회합니다.
+        
+        Args:
+            kind (str): 데이터 종류 ('stock', 'index', 'cap')
+            ticker (str): 종목/지수 코드
+            start_date (str): 시작일 (YYYYMMDD)
+            end_date (str): 종료일 (YYYYMMDD)
+            fetch: (시작일, 종료일)로 pykrx를 호출하는 함수
+            
+        Returns:
+            pd.DataFrame: 일별 데이터
+        """
+        if self.cache is None:
+            return fetch(start_date, end_date)
+        return self.cache.get_bars(kind, ticker, start_date, end_date, fetch)
+    
     def get_stock_ohlcv(self, stock_code: str, start_date: str, end_date: str, retry_with_prev_day: bool = True) -> Optional[object]:
         """
         특정 기간의 주식 OHLCV 데이터를 조회합니다.
@@ -96,11 +130,12 @@ class PykrxStockDataClient:
         try:
             logger.debug(f"주식 OHLCV 조회 시도: {stock_code}, 기간: {start_date} ~ {end_date}")
             
-            df = stock.get_market_ohlcv_by_date(
-                fromdate=start_date,
-                todate=end_date,
+            fetch_ohlcv = lambda fromdate, todate: stock.get_market_ohlcv_by_date(
+                fromdate=fromdate,
+                todate=todate,
                 ticker=stock_code
             )
+            df = self._get_bars('stock', stock_code, start_date, end_date, fetch_ohlcv)
             
             # 거래정지일 제거 (시가가 0인 경우)
             if not df.empty:
@@ -118,11 +153,7 @@ class PykrxStockDataClient:
                     prev_date = (end_dt - timedelta(days=days_back)).strftime("%Y%m%d")
                     logger.debug(f"재시도 {days_back}일 전: {prev_date}")
                     
-                    df = stock.get_market_ohlcv_by_date(
-                        fromdate=start_date,
-                        todate=prev_date,
-                        ticker=stock_code
-                    )
+                    df = self._get_bars('stock', stock_code, start_date, prev_date, fetch_ohlcv)
                     
                     if not df.empty:
                         df = df[df['시가'] != 0].copy()
@@ -220,11 +251,12 @@ class PykrxStockDataClient:
             
             logger.debug(f"시장지수 조회 시도: {market_type} (ticker={index_ticker}), 기간: {start_date} ~ {end_date}")
             
-            df = stock.get_index_ohlcv_by_date(
-                fromdate=start_date,
-                todate=end_date,
+            fetch_index = lambda fromdate, todate: stock.get_index_ohlcv_by_date(
+                fromdate=fromdate,
+                todate=todate,
                 ticker=index_ticker
             )
+            df = self._get_bars('index', index_ticker, start_date, end_date, fetch_index)
             
             # 데이터가 없고 재시도 옵션이 켜져 있으면 전일로 재시도
             if df.empty and retry_with_prev_day:
@@ -238,11 +270,7 @@ class PykrxStockDataClient:
                     prev_date = (end_dt - timedelta(days=days_back)).strftime("%Y%m%d")
                     logger.debug(f"재시도 {days_back}일 전: {prev_date}")
                     
-                    df = stock.get_index_ohlcv_by_date(
-                        fromdate=start_date,
-                        todate=prev_date,
-                        ticker=index_ticker
-                    )
+                    df = self._get_bars('index', index_ticker, start_date, prev_date, fetch_index)
                     
                     if not df.empty:
                         logger.info(f"✅ {prev_date} 날짜로 지수 데이터 조회 성공 (오늘 데이터 미제공)")
@@ -280,11 +308,12 @@ class PykrxStockDataClient:
             logger.debug(f"시가총액 조회 시도: {stock_code}, 날짜: {date}")
             
             # 시가총액 조회 (원 단위)
-            market_cap_raw = stock.get_market_cap_by_date(
-                fromdate=date,
-                todate=date,
+            fetch_cap = lambda fromdate, todate: stock.get_market_cap_by_date(
+                fromdate=fromdate,
+                todate=todate,
                 ticker=stock_code
             )
+            market_cap_raw = self._get_bars('cap', stock_code, date, date, fetch_cap)
             
             # 데이터가 없고 재시도 옵션이 켜져 있으면 전일로 재시도
             if (market_cap_raw is None or market_cap_raw.empty) and retry_with_prev_day:
@@ -297,11 +326,7 @@ class PykrxStockDataClient:
                     prev_date = (date_dt - timedelta(days=days_back)).strftime("%Y%m%d")
                     logger.debug(f"재시도 {days_back}일 전: {prev_date}")
                     
-                    market_cap_raw = stock.get_market_cap_by_date(
-                        fromdate=prev_date,
-                        todate=prev_date,
-                        ticker=stock_code
-                    )
+                    market_cap_raw = self._get_bars('cap', stock_code, prev_date, prev_date, fetch_cap)
                     
                     if market_cap_raw is not None and not market_cap_raw.empty:
                         logger.info(f"✅ {prev_date} 날짜로 시가총액 조회 성공 (오늘 데이터 미제공)")
@@ -323,6 +348,31 @@ class PykrxStockDataClient:
             import traceback
             logger.debug(f"상세 오류:\n{traceback.format_exc()}")
             return None
+    
+    def get_market_cap_history(self, stock_code: str, start_date: str, end_date: str) -> Optional[object]:
+        """
+        특정 기간의 일별 시가총액을 조회합니다.
+        
+        Args:
+            stock_code (str): 종목코드 (6자리)
+            start_date (str): 시작일 (YYYYMMDD)
+            end_date (str): 종료일 (YYYYMMDD)
+            
+        Returns:
+            Optional[pd.DataFrame]: 일별 시가총액 데이터프레임 (원 단위, 실패 시 None)
+        """
+        try:
+            fetch_cap = lambda fromdate, todate: stock.get_market_cap_by_date(
+                fromdate=fromdate,
+                todate=todate,
+                ticker=stock_code
+            )
+            df = self._get_bars('cap', stock_code, start_date, end_date, fetch_cap)
+            return df if df is not None and not df.empty else None
+            
+        except Exception as e:
+            logger.error(f"시가총액 이력 조회 실패 ({stock_code}): {e}")
+            return None
 
 
 class StockChartGenerator:
@@ -640,6 +690,11 @@ class StockChartGenerator:
 class StockAnalyzer:
     """주식 분석 메인 클래스"""
     
+    # 접수번호별로 보관할 분석 결과 개수
+    ANALYSIS_CACHE_SIZE = 100
+    # 같은 접수번호의 동시 분석을 직렬화하는 잠금 수 (접수번호 해시로 나눠 사용, 개수 고정)
+    ANALYSIS_LOCK_STRIPES = 64
+    
     def __init__(self):
         """
         주식 분석기를 초기화합니다.
@@ -652,12 +707,107 @@ class StockAnalyzer:
             self.pykrx_client = PykrxStockDataClient()
         
         self.chart_generator = StockChartGenerator()
+        
+        # 접수번호 -> 분석 결과 (슬랙 알림과 자동매매가 같은 결과를 사용)
+        self._analysis_cache: "OrderedDict[str, StockAnalysisResult]" = OrderedDict()
+        self._analysis_locks = [threading.Lock() for _ in range(self.ANALYSIS_LOCK_STRIPES)]
+        self._cache_lock = threading.Lock()
+        
         logger.info("주식 분석기가 초기화되었습니다 (pykrx 기반).")
     
-    def analyze_stock_for_contract(self, contract_data: Dict) -> Optional[StockAnalysisResult]:
+    def analyze_stock_for_contract(self, contract_data: Dict, include_chart: bool = True) -> Optional[StockAnalysisResult]:
         """
         계약 정보와 함께 종목을 분석합니다.
         
+        같은 접수번호의 계약은 한 번만 분석하고 결과를 재사용합니다.
+        (동시에 요청된 경우 먼저 시작한 분석이 끝날 때까지 기다렸다가 그 결과를 반환)
+        
+        Args:
+            contract_data (Dict): 계약 정보
+            include_chart (bool): 차트 이미지 생성 여부 (매수 판단처럼 빠른 응답이 필요하면 False)
+            
+        Returns:
+            Optional[StockAnalysisResult]: 분석 결과 (실패 시 None)
+        """
+        rcept_no = str(contract_data.get('접수번호', '') or '').strip()
+        if not rcept_no:
+            result = self._analyze_stock(contract_data)
+            if include_chart:
+                self.ensure_chart(result)
+            return result
+        
+        # 접수번호별 잠금을 따로 만들면 보관하지 않는 실패 결과의 잠금이 계속 쌓이므로 고정 개수를 나눠 사용
+        key_lock = self._analysis_locks[hash(rcept_no) % self.ANALYSIS_LOCK_STRIPES]
+        
+        with key_lock:
+            with self._cache_lock:
+                cached = self._analysis_cache.get(rcept_no)
+            if cached is not None:
+                logger.info(f"기존 분석 결과 재사용: {cached.stock_name} (접수번호: {rcept_no})")
+                if include_chart:
+                    self.ensure_chart(cached)
+                return cached
+            
+            result = self._analyze_stock(contract_data)
+            
+            # 분석 실패 결과는 보관하지 않음 (다음 요청에서 다시 분석)
+            if result is not None and result.market_type != "UNKNOWN":
+                self.remember_analysis(contract_data, result)
+            
+            if include_chart:
+                self.ensure_chart(result)
+            return result
+    
+    def remember_analysis(self, contract_data: Dict, result: StockAnalysisResult):
+        """
+        분석 결과를 접수번호로 보관하여 이후 analyze_stock_for_contract()에서 재사용하게 합니다.
+        (배치 스크리닝 결과나 벤치마크용 고정 결과를 미리 등록할 때 사용)
+        
+        Args:
+            contract_data (Dict): 계약 정보 (접수번호 필요)
+            result (StockAnalysisResult): 분석 결과
+        """
+        rcept_no = str(contract_data.get('접수번호', '') or '').strip()
+        if not rcept_no:
+            return
+        
+        with self._cache_lock:
+            self._analysis_cache[rcept_no] = result
+            self._analysis_cache.move_to_end(rcept_no)
+            while len(self._analysis_cache) > self.ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+    
+    def ensure_chart(self, result: Optional[StockAnalysisResult]) -> Optional[str]:
+        """
+        분석 결과에 차트 이미지가 없으면 보관된 시세로 차트를 생성합니다.
+        
+        Args:
+            result (Optional[StockAnalysisResult]): 분석 결과
+            
+        Returns:
+            Optional[str]: 차트 이미지 경로 (생성할 수 없으면 None)
+        """
+        if result is None or result.chart_image_path or result.price_history is None:
+            return result.chart_image_path if result else None
+        
+        # 차트 생성 (최근 10일 표시, 100일 데이터 사용)
+        logger.info(f"  → 주식 차트 생성 중... ({result.stock_name})")
+        chart_path = self.chart_generator.create_candlestick_chart(
+            result.stock_code, result.stock_name, result.price_history, days_to_show=10
+        )
+        
+        if chart_path:
+            logger.info(f"  ✅ 차트 생성 완료: {chart_path}")
+            result.chart_image_path = chart_path
+        else:
+            logger.warning(f"  ⚠️ 차트 생성 실패 (차트 없이 계속 진행)")
+        
+        return chart_path
+    
+    def _analyze_stock(self, contract_data: Dict) -> Optional[StockAnalysisResult]:
+        """
+        계약 정보와 함께 종목을 분석합니다. (캐시 없이 항상 새로 분석)
+        
         Args:
             contract_data (Dict): 계약 정보
             
@@ -745,24 +895,14 @@ class StockAnalyzer:
             
             logger.info(f"  ✅ 시장 지수 조회 성공: {len(index_df)}일치")
             
-            # 5. 차트 생성 (최근 10일 표시, 100일 데이터 사용)
-            logger.info(f"  → 5단계: 주식 차트 생성 중...")
-            chart_path = self.chart_generator.create_candlestick_chart(
-                stock_code, stock_name, stock_df, days_to_show=10
-            )
-            
-            if chart_path:
-                logger.info(f"  ✅ 차트 생성 완료: {chart_path}")
-            else:
-                logger.warning(f"  ⚠️ 차트 생성 실패 (차트 없이 계속 진행)")
-            
-            # 6. 분석 수행
-            logger.info(f"  → 6단계: 투자 점수 분석 수행 중...")
+            # 5. 분석 수행 (차트는 필요할 때 ensure_chart()로 생성)
+            logger.info(f"  → 5단계: 투자 점수 분석 수행 중...")
             analysis_result = self._perform_analysis(
                 stock_code, stock_name, market_type, industry_code, industry_name, is_target_industry,
                 current_price, opening_price, price_change_rate, market_cap,
-                contract_amount, recent_sales, stock_df, index_df, current_price_info, chart_path
+                contract_amount, recent_sales, stock_df, index_df, current_price_info, None
             )
+            analysis_result.price_history = stock_df
             
             logger.info(f"✅ 종목 분석 완료: {stock_name} (투자 점수: {analysis_result.recommendation_score}/10)")
             return analysis_result
@@ -772,6 +912,71 @@ class StockAnalyzer:
             return self._create_error_result(stock_code, stock_name, industry_code,
                                              industry_name, is_target_industry, f"분석 오류: {str(e)}")
     
+    def screen_contracts(self, contracts: List[Dict]) -> Optional[ScreeningResult]:
+        """
+        여러 계약의 투자 점수를 한 번에 계산합니다.
+        
+        종목별 시세와 시장지수를 모아 (종목 수, 기간) 배열로 만든 뒤 벡터 연산으로 채점하므로
+        관심 종목 전체를 미리 채점할 때 사용합니다. 차트는 생성하지 않으며, 시세를 조회할 수 없는
+        종목은 조건 미충족으로 채점됩니다.
+        
+        Args:
+            contracts (List[Dict]): 계약 정보 목록
+            
+        Returns:
+            Optional[ScreeningResult]: 계약 순서대로의 분석 지표와 점수 (pykrx를 사용할 수 없으면 None)
+        """
+        if not self.pykrx_client:
+            logger.error("pykrx 클라이언트를 사용할 수 없습니다.")
+            return None
+        
+        today = datetime.now().strftime("%Y%m%d")
+        start_date = (datetime.now() - timedelta(days=150)).strftime("%Y%m%d")
+        
+        logger.info(f"일괄 스크리닝 시작: {len(contracts)}개 계약")
+        
+        volumes, open_prices, close_prices, market_caps = [], [], [], []
+        contract_amounts, recent_sales_list, market_types = [], [], []
+        
+        for contract in contracts:
+            stock_code = contract.get('종목코드', '')
+            stock_df = self.pykrx_client.get_stock_ohlcv(stock_code, start_date, today)
+            
+            if stock_df is None or stock_df.empty:
+                logger.warning(f"  ⚠️ 시세 없음 - 조건 미충족 처리: {contract.get('종목명', '')}({stock_code})")
+                volumes.append(None)
+                open_prices.append(0)
+                close_prices.append(0)
+                market_cap = 0
+            else:
+                volumes.append(stock_df['거래량'].to_numpy())
+                open_prices.append(stock_df['시가'].iloc[-1])
+                close_prices.append(stock_df['종가'].iloc[-1])
+                market_cap = self.pykrx_client.get_market_cap(stock_code)
+                if market_cap is None:
+                    listed_shares = self._parse_number(contract.get('상장주식수', '0'))
+                    market_cap = (int(close_prices[-1]) * listed_shares) // 100000000 if listed_shares > 0 else 0
+            
+            market_caps.append(market_cap)
+            contract_amounts.append(self._parse_number(contract.get('계약금액', '0')))
+            recent_sales_list.append(self._parse_number(contract.get('최근 매출액', '0')))
+            market_types.append(contract.get('시장구분', 'KOSPI'))
+        
+        # 시장별 지수는 한 번씩만 조회
+        index_close = {}
+        for market_type in dict.fromkeys(market_types):
+            index_df = self.pykrx_client.get_market_index(market_type, start_date, today)
+            if index_df is not None and not index_df.empty:
+                index_close[market_type] = index_df['종가'].to_numpy()
+        
+        result = score_contracts_with_index(
+            build_panel(volumes), open_prices, close_prices, market_caps,
+            contract_amounts, recent_sales_list, market_types, index_close
+        )
+        
+        logger.info(f"✅ 일괄 스크리닝 완료: {len(result)}개 계약 (8점 이상: {int((result.recommendation_score >= 8).sum())}개)")
+        return result
+    
     def _check_target_industry(self, industry_code: str) -> bool:
         """주목 업종인지 확인합니다."""
         try:
@@ -792,8 +997,8 @@ class StockAnalyzer:
         index_current = float(index_df.iloc[-1]['종가'])
         
         # 200일 이동평균 계산 (최소 200일 데이터가 있어야 함)
-        if len(index_df) >= 200:
-            index_ma200 = float(index_df['종가'].tail(200).mean())
+        if len(index_df) >= INDEX_MA_WINDOW:
+            index_ma200 = float(index_df['종가'].tail(INDEX_MA_WINDOW).mean())
         else:
             # 데이터가 부족한 경우 사용 가능한 모든 데이터의 평균 사용
             index_ma200 = float(index_df['종가'].mean())
@@ -802,16 +1007,16 @@ class StockAnalyzer:
         is_index_above_ma200 = index_current > index_ma200
         
         # 2. 시가총액 범위 체크 (500억 ~ 5,000억)
-        is_market_cap_in_range = 500 <= market_cap <= 5000
+        is_market_cap_in_range = MARKET_CAP_MIN <= market_cap <= MARKET_CAP_MAX
         
         # 3. 매출 대비 계약금액 비율
         contract_sales_ratio = (contract_amount / recent_sales * 100) if recent_sales > 0 else 0
-        is_contract_ratio_over_20 = contract_sales_ratio > 20
+        is_contract_ratio_over_20 = contract_sales_ratio > CONTRACT_RATIO_THRESHOLD
         
         # 4. 거래 조건 체크
         # 4-1. 거래대금 비율 (20일 평균 대비)
-        if len(stock_df) >= 20:
-            recent_20_days = stock_df.tail(20)
+        if len(stock_df) >= VOLUME_AVG_WINDOW:
+            recent_20_days = stock_df.tail(VOLUME_AVG_WINDOW)
             avg_volume_20days = recent_20_days['거래량'].mean()
             today_volume = current_price_info['volume']
             volume_ratio = today_volume / avg_volume_20days if avg_volume_20days > 0 else 0
@@ -824,7 +1029,7 @@ class StockAnalyzer:
         
         # 거래 조건 만족 개수
         trading_conditions_met = 0
-        if volume_ratio < 1.1:  # 20일 평균의 1.1배 미만 (다른 플레이어 반응 전)
+        if volume_ratio < VOLUME_RATIO_THRESHOLD:  # 20일 평균의 1.1배 미만 (다른 플레이어 반응 전)
             trading_conditions_met += 1
         if is_positive_candle:  # 양봉
             trading_conditions_met += 1
@@ -863,35 +1068,35 @@ class StockAnalyzer:
     def _create_analysis_summary(self, is_index_above_ma200: bool, is_market_cap_in_range: bool,
                                is_contract_ratio_over_20: bool, trading_conditions_met: int,
                                market_cap: int, contract_sales_ratio: float) -> Tuple[str, int]:
-        """분석 요약과 추천 점수를 생성합니다."""
+        """분석 요약과 추천 점수를 생성합니다. (항목별 점수는 일괄 스크리닝과 공유)"""
         
         # 기본 점수 계산
         score = 0
         summary_parts = []
         
-        # 시장지수 조건 (2점)
+        # 시장지수 조건
         if is_index_above_ma200:
-            score += 2
+            score += INDEX_SCORE
             summary_parts.append("✅ 시장지수 > 200일 이평선")
         else:
             summary_parts.append("❌ 시장지수 < 200일 이평선")
         
-        # 시가총액 조건 (2점)
+        # 시가총액 조건
         if is_market_cap_in_range:
-            score += 2
+            score += MARKET_CAP_SCORE
             summary_parts.append(f"✅ 시가총액 적정 ({market_cap:,}억원)")
         else:
             summary_parts.append(f"❌ 시가총액 부적정 ({market_cap:,}억원)")
         
-        # 매출 비율 조건 (3점)
+        # 매출 비율 조건
         if is_contract_ratio_over_20:
-            score += 3
+            score += CONTRACT_RATIO_SCORE
             summary_parts.append(f"✅ 매출 대비 계약 비율 높음 ({contract_sales_ratio:.1f}%)")
         else:
             summary_parts.append(f"❌ 매출 대비 계약 비율 낮음 ({contract_sales_ratio:.1f}%)")
         
-        # 거래 조건 (각 1.5점, 총 3점)
-        score += trading_conditions_met * 1.5
+        # 거래 조건 (조건별 점수)
+        score += trading_conditions_met * TRADING_CONDITION_SCORE
         if trading_conditions_met == 2:
             summary_parts.append("✅ 거래 조건 모두 만족")
         elif trading_conditions_met == 1:
@@ -955,3 +1160,23 @@ class StockAnalyzer:
             return 0
         except:
             return 0
+
+
+# 전역 주식 분석기 인스턴스 (슬랙 알림과 자동매매가 공유)
+_global_stock_analyzer: Optional[StockAnalyzer] = None
+_global_analyzer_lock = threading.Lock()
+
+
+def get_stock_analyzer() -> StockAnalyzer:
+    """
+    전역 주식 분석기를 반환합니다.
+    
+    Returns:
+        StockAnalyzer: 주식 분석기 인스턴스
+    """
+    global _global_stock_analyzer
+    
+    with _global_analyzer_lock:
+        if _global_stock_analyzer is None:
+            _global_stock_analyzer = StockAnalyzer()
+        return _global_stock_analyzer
@@ -0,0 +1,224 @@
+"""
+다종목 일괄 스크리닝 모듈
+
+이 모듈은 여러 계약(종목)의 투자 점수를 NumPy 배열 연산으로 한 번에 계산합니다.
+StockAnalyzer의 종목별 분석(_perform_analysis, _create_analysis_summary)과 같은 기준과
+점수 체계를 사용하므로, 아침마다 관심 종목 전체를 미리 채점하거나 백테스트에서
+대량으로 다시 채점할 때 종목별 분석을 반복하지 않아도 됩니다.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+
+# 분석 기준 (StockAnalyzer와 공유)
+INDEX_MA_WINDOW = 200  # 시장지수 이동평균 기간 (일)
+VOLUME_AVG_WINDOW = 20  # 거래량 평균 기간 (일)
+MARKET_CAP_MIN = 500  # 적정 시가총액 하한 (억원)
+MARKET_CAP_MAX = 5000  # 적정 시가총액 상한 (억원)
+CONTRACT_RATIO_THRESHOLD = 20  # 매출 대비 계약금액 비율 기준 (%)
+VOLUME_RATIO_THRESHOLD = 1.1  # 거래량 비율 기준 (20일 평균 대비, 다른 플레이어 반응 전)
+
+# 항목별 점수 (총 10점)
+INDEX_SCORE = 2
+MARKET_CAP_SCORE = 2
+CONTRACT_RATIO_SCORE = 3
+TRADING_CONDITION_SCORE = 1.5
+
+
+@dataclass
+class ScreeningResult:
+    """일괄 스크리닝 결과를 담는 데이터 클래스 (모든 배열은 입력 계약 순서)"""
+    is_index_above_ma200: np.ndarray
+    is_market_cap_in_range: np.ndarray
+    is_contract_ratio_over_20: np.ndarray
+    trading_conditions_met: np.ndarray
+    index_current: np.ndarray
+    index_ma200: np.ndarray
+    contract_sales_ratio: np.ndarray
+    volume_ratio: np.ndarray
+    is_positive_candle: np.ndarray
+    recommendation_score: np.ndarray  # 0-10점 (정수)
+
+    def __len__(self) -> int:
+        return len(self.recommendation_score)
+
+    def top(self, count: int) -> np.ndarray:
+        """
+        점수가 높은 계약의 위치를 반환합니다.
+
+        Args:
+            count (int): 반환할 개수
+
+        Returns:
+            np.ndarray: 점수 내림차순 계약 위치 (동점이면 입력 순서)
+        """
+        order = np.argsort(-self.recommendation_score, kind='stable')
+        return order[:count]
+
+
+def build_panel(series_list: Sequence[Optional[Sequence[float]]], length: Optional[int] = None) -> np.ndarray:
+    """
+    종목별 일별 값 목록을 (종목 수, 기간) 배열로 만듭니다.
+
+    최근 값이 마지막 열에 오도록 오른쪽 정렬하고, 데이터가 짧은 종목의 앞부분은 NaN으로 채웁니다.
+
+    Args:
+        series_list (Sequence): 종목별 일별 값 (오래된 날짜부터, 없으면 None)
+        length (Optional[int]): 기간 길이 (None이면 가장 긴 데이터 기준, 길면 최근 값만 사용)
+
+    Returns:
+        np.ndarray: float 배열
+    """
+    arrays = [np.asarray(series if series is not None else [], dtype=float) for series in series_list]
+    if length is None:
+        length = max((len(array) for array in arrays), default=0)
+
+    panel = np.full((len(arrays), length), np.nan)
+    for row, array in enumerate(arrays):
+        array = array[-length:] if length else array[:0]
+        if len(array):
+            panel[row, length - len(array):] = array
+    return panel
+
+
+def _last_valid(panel: np.ndarray) -> np.ndarray:
+    """각 행의 마지막(가장 최근) 값을 반환합니다. (값이 없으면 NaN)"""
+    if panel.shape[1] == 0:
+        return np.full(panel.shape[0], np.nan)
+    valid = ~np.isnan(panel)
+    last_index = panel.shape[1] - 1 - np.argmax(valid[:, ::-1], axis=1)
+    values = panel[np.arange(panel.shape[0]), last_index]
+    return np.where(valid.any(axis=1), values, np.nan)
+
+
+def _tail_mean(panel: np.ndarray, window: int) -> np.ndarray:
+    """각 행의 최근 window개 값의 평균을 반환합니다. (값이 적으면 있는 값의 평균)"""
+    tail = panel[:, -window:]
+    counts = (~np.isnan(tail)).sum(axis=1)
+    sums = np.nansum(tail, axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(counts > 0, sums / counts, np.nan)
+
+
+def index_indicators(index_close: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    시장지수의 현재값과 200일 이동평균을 계산합니다.
+
+    Args:
+        index_close (np.ndarray): (지수 수, 기간) 종가 배열 (build_panel 형식)
+
+    Returns:
+        Dict[str, np.ndarray]: 'current', 'ma200'
+    """
+    return {
+        'current': _last_valid(index_close),
+        'ma200': _tail_mean(index_close, INDEX_MA_WINDOW)
+    }
+
+
+def score_contracts(volume: np.ndarray, open_price: np.ndarray, close_price: np.ndarray,
+                    market_cap: Sequence[float], contract_amount: Sequence[float],
+                    recent_sales: Sequence[float], index_current: Sequence[float],
+                    index_ma200: Sequence[float]) -> ScreeningResult:
+    """
+    여러 계약의 분석 지표와 투자 점수를 한 번에 계산합니다.
+
+    종목별 분석(StockAnalyzer._perform_analysis)과 같은 기준을 사용합니다.
+    거래량 데이터가 20일 미만인 종목은 거래량 비율을 1.0으로 간주합니다.
+
+    Args:
+        volume (np.ndarray): (종목 수, 기간) 거래량 배열 (build_panel 형식, 마지막 열이 당일)
+        open_price (np.ndarray): 종목별 당일 시가
+        close_price (np.ndarray): 종목별 현재가
+        market_cap (Sequence[float]): 종목별 시가총액 (억원)
+        contract_amount (Sequence[float]): 계약별 계약금액
+        recent_sales (Sequence[float]): 계약별 최근 매출액
+        index_current (Sequence[float]): 계약별 해당 시장지수 현재값
+        index_ma200 (Sequence[float]): 계약별 해당 시장지수 200일 이동평균
+
+    Returns:
+        ScreeningResult: 계약 순서대로의 분석 지표와 점수
+    """
+    volume = np.asarray(volume, dtype=float)
+    open_price = np.asarray(open_price, dtype=float)
+    close_price = np.asarray(close_price, dtype=float)
+    market_cap = np.asarray(market_cap, dtype=float)
+    contract_amount = np.asarray(contract_amount, dtype=float)
+    recent_sales = np.asarray(recent_sales, dtype=float)
+    index_current = np.asarray(index_current, dtype=float)
+    index_ma200 = np.asarray(index_ma200, dtype=float)
+
+    # 1. 시장지수 200일 이동평균 비교
+    is_index_above_ma200 = index_current > index_ma200
+
+    # 2. 시가총액 범위 체크
+    is_market_cap_in_range = (market_cap >= MARKET_CAP_MIN) & (market_cap <= MARKET_CAP_MAX)
+
+    # 3. 매출 대비 계약금액 비율
+    with np.errstate(invalid='ignore', divide='ignore'):
+        contract_sales_ratio = np.where(recent_sales > 0, contract_amount / recent_sales * 100, 0.0)
+    is_contract_ratio_over_20 = contract_sales_ratio > CONTRACT_RATIO_THRESHOLD
+
+    # 4-1. 거래량 비율 (20일 평균 대비)
+    has_enough_volume = (~np.isnan(volume)).sum(axis=1) >= VOLUME_AVG_WINDOW
+    avg_volume = _tail_mean(volume, VOLUME_AVG_WINDOW)
+    today_volume = _last_valid(volume)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        volume_ratio = np.where(avg_volume > 0, today_volume / avg_volume, 0.0)
+    volume_ratio = np.where(has_enough_volume, volume_ratio, 1.0)
+
+    # 4-2. 양봉 여부
+    is_positive_candle = close_price > open_price
+
+    trading_conditions_met = (volume_ratio < VOLUME_RATIO_THRESHOLD).astype(int) + is_positive_candle.astype(int)
+
+    # 점수 계산 (_create_analysis_summary와 동일)
+    score = (INDEX_SCORE * is_index_above_ma200 +
+             MARKET_CAP_SCORE * is_market_cap_in_range +
+             CONTRACT_RATIO_SCORE * is_contract_ratio_over_20 +
+             TRADING_CONDITION_SCORE * trading_conditions_met)
+
+    return ScreeningResult(
+        is_index_above_ma200=is_index_above_ma200,
+        is_market_cap_in_range=is_market_cap_in_range,
+        is_contract_ratio_over_20=is_contract_ratio_over_20,
+        trading_conditions_met=trading_conditions_met,
+        index_current=index_current,
+        index_ma200=index_ma200,
+        contract_sales_ratio=contract_sales_ratio,
+        volume_ratio=volume_ratio,
+        is_positive_candle=is_positive_candle,
+        recommendation_score=np.floor(score).astype(int)
+    )
+
+
+def score_contracts_with_index(volume: np.ndarray, open_price: np.ndarray, close_price: np.ndarray,
+                               market_cap: Sequence[float], contract_amount: Sequence[float],
+                               recent_sales: Sequence[float], market_types: List[str],
+                               index_close: Dict[str, Sequence[float]]) -> ScreeningResult:
+    """
+    시장별 지수 종가로 지표를 계산한 뒤 여러 계약을 한 번에 채점합니다.
+
+    Args:
+        volume, open_price, close_price, market_cap, contract_amount, recent_sales: score_contracts()와 동일
+        market_types (List[str]): 계약별 시장구분 (예: 'KOSPI', 'KOSDAQ')
+        index_close (Dict[str, Sequence[float]]): 시장구분별 지수 종가 (오래된 날짜부터)
+
+    Returns:
+        ScreeningResult: 계약 순서대로의 분석 지표와 점수 (지수 데이터가 없는 시장은 조건 미충족)
+    """
+    markets = list(index_close)
+    indicators = index_indicators(build_panel([index_close[market] for market in markets]))
+
+    # 계약별 시장 위치 (지수 데이터가 없는 시장은 NaN)
+    position = {market: i for i, market in enumerate(markets)}
+    market_index = np.array([position.get(market, -1) for market in market_types], dtype=int)
+    known = market_index >= 0
+    lookup = np.where(known, market_index, 0)
+
+    current = np.where(known, indicators['current'][lookup] if markets else np.nan, np.nan)
+    ma200 = np.where(known, indicators['ma200'][lookup] if markets else np.nan, np.nan)
+
+    return score_contracts(volume, open_price, close_price, market_cap,
+                           contract_amount, recent_sales, current, ma200)
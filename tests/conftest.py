@@ -0,0 +1,15 @@
+"""
+테스트 공통 설정
+
+config.settings는 불러올 때 DART/시트 접속 정보가 없으면 예외를 발생시키므로,
+외부 서비스에 접속하지 않는 테스트에서도 모듈을 불러올 수 있도록 자리표시 값을 채웁니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault('DART_API_KEY', 'test-dart-api-key')
+os.environ.setdefault('SPREADSHEET_URL', 'https://docs.google.com/spreadsheets/d/test')
+os.environ.setdefault('SERVICE_ACCOUNT_FILE', 'test-service-account.json')
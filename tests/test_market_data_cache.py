@@ -0,0 +1,63 @@
+"""시세 데이터 캐시 테스트"""
+
+import pandas as pd
+
+from src.utils.market_data_cache import MarketDataCache
+
+
+def _bars(dates):
+    """날짜 목록으로 일별 시세 DataFrame을 만듭니다."""
+    index = pd.to_datetime(dates, format='%Y%m%d')
+    return pd.DataFrame({'종가': range(1, len(dates) + 1)}, index=index)
+
+
+class _Fetcher:
+    """조회 요청을 기록하는 가짜 조회 함수"""
+
+    def __init__(self, df):
+        self.df = df
+        self.calls = []
+
+    def __call__(self, start_date, end_date):
+        self.calls.append((start_date, end_date))
+        if self.df.empty:
+            return self.df
+        return self.df.loc[pd.Timestamp(start_date):pd.Timestamp(end_date)]
+
+
+def test_empty_fetch_is_not_marked_as_covered(tmp_path):
+    cache = MarketDataCache(str(tmp_path))
+    failing = _Fetcher(pd.DataFrame())
+    assert cache.get_bars('stock', '005930', '20260101', '20260301', failing).empty
+    assert failing.calls == [('20260101', '20260301')]
+
+    # 새 인스턴스(재시작)에서도 실패한 구간을 다시 조회해야 함
+    cache = MarketDataCache(str(tmp_path))
+    working = _Fetcher(_bars(['20260102', '20260105', '20260227']))
+    result = cache.get_bars('stock', '005930', '20260101', '20260301', working)
+
+    assert working.calls == [('20260101', '20260301')]
+    assert len(result) == 3
+
+
+def test_empty_head_fetch_is_not_marked_as_covered(tmp_path):
+    cache = MarketDataCache(str(tmp_path))
+    data = _bars(['20260105', '20260202', '20260227'])
+    cache.get_bars('stock', '005930', '20260201', '20260301', _Fetcher(data))
+
+    failing = _Fetcher(pd.DataFrame())
+    assert len(cache.get_bars('stock', '005930', '20260101', '20260301', failing)) == 2
+    assert failing.calls == [('20260101', '20260131')]
+
+    working = _Fetcher(data)
+    assert len(cache.get_bars('stock', '005930', '20260101', '20260301', working)) == 3
+    assert working.calls == [('20260101', '20260131')]
+
+
+def test_covered_range_is_served_from_cache(tmp_path):
+    cache = MarketDataCache(str(tmp_path))
+    cache.get_bars('stock', '005930', '20260101', '20260301', _Fetcher(_bars(['20260102', '20260227'])))
+
+    fetcher = _Fetcher(pd.DataFrame())
+    assert len(cache.get_bars('stock', '005930', '20260101', '20260301', fetcher)) == 2
+    assert fetcher.calls == []
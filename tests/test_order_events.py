@@ -0,0 +1,66 @@
+"""실시간 주문체결 이벤트 테스트"""
+
+from decimal import Decimal
+
+from src.trading.order_events import OrderEventStream
+
+
+def _message(status, unexecuted, executed_amount='', unit_price='', unit_quantity='', order_quantity='10'):
+    """주문번호 0000001에 대한 실시간 주문체결(타입 '00') 메시지를 만듭니다."""
+    return {
+        'trnm': 'REAL',
+        'data': [{
+            'type': '00',
+            'values': {
+                '9203': '0000001',
+                '9001': 'A005930',
+                '913': status,
+                '900': order_quantity,
+                '902': unexecuted,
+                '903': executed_amount,
+                '905': '+매수',
+                '910': unit_price,
+                '911': unit_quantity,
+            },
+        }],
+    }
+
+
+def test_only_fill_messages_are_recorded():
+    stream = OrderEventStream().start()
+
+    stream.handle_message(_message('접수', '10'))
+    # 취소 확인: 미체결수량 0, 체결가 없음 -> 체결로 기록하면 안 됨
+    stream.handle_message(_message('확인', '0'))
+    stream.handle_message(_message('거부', '0'))
+    assert stream.get_execution('0000001') is None
+    assert stream.wait_for_execution('0000001', timeout=0) is None
+
+
+def test_partial_fills_accumulate_until_fully_executed():
+    stream = OrderEventStream().start()
+    received = []
+    stream.add_listener(received.append)
+
+    stream.handle_message(_message('접수', '10'))
+    stream.handle_message(_message('체결', '6', executed_amount='200000', unit_price='50000', unit_quantity='4'))
+
+    partial = stream.wait_for_execution('0000001', timeout=0)
+    assert not partial['executed']
+    assert partial['executed_quantity'] == 4
+    assert partial['executed_price'] == Decimal('50000')
+
+    # 누계금액이 없으면 단위 체결가 x 이번 체결량을 더함
+    stream.handle_message(_message('체결', '0', unit_price='51000', unit_quantity='6'))
+    execution = stream.wait_for_execution('0000001', timeout=1)
+    assert execution['executed']
+    assert execution['executed_quantity'] == 10
+    assert execution['executed_amount'] == Decimal('506000')
+    assert execution['executed_price'] == Decimal('50600')
+    assert [item['executed_quantity'] for item in received] == [4, 10]
+
+
+def test_fill_without_price_is_ignored():
+    stream = OrderEventStream().start()
+    stream.handle_message(_message('체결', '0', unit_quantity='10'))
+    assert stream.get_execution('0000001') is None
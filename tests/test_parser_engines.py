@@ -0,0 +1,57 @@
+"""보고서 파서 엔진(html.parser / lxml) 동등성 테스트"""
+
+from pathlib import Path
+
+import pytest
+
+from src.dart_api.analyzer import ReportAnalyzer, LXML_AVAILABLE
+
+FIXTURE_DIR = Path(__file__).parent / 'fixtures' / 'dart'
+FIXTURES = sorted(FIXTURE_DIR.iterdir())
+
+# 각 예제 문서에서 반드시 추출되어야 하는 값
+EXPECTED_FIELDS = {
+    'single_sales_contract.xml': {
+        '판매ㆍ공급계약 내용': 'OLED 증착장비 공급계약',
+        '계약상대방': 'Global Display Co., Ltd.',
+        '계약(수주)일자': '2026-02-27',
+        '시작일': '2026-03-02',
+        '종료일': '2026-12-31',
+        '계약금액': '35,000,000,000',
+        '최근 매출액': '412,000,000,000',
+        '매출액 대비 비율': '8.50',
+    },
+    'single_sales_contract_viewer.html': {
+        '판매ㆍ공급계약 내용': '2차전지 소재 장기 공급계약',
+        '계약상대방': 'Battery Materials GmbH',
+        '계약(수주)일자': '2026-03-20',
+        '계약금액': '128,400,000,000',
+        '최근 매출액': '1,023,500,000,000',
+        '매출액 대비 비율': '12.55',
+    },
+    'nested_table.html': {
+        '계약금액': '12,500,000,000',
+        '시작일': '2026-01-15',
+        '종료일': '2026-12-31',
+        '매출액 대비 비율': '12.76',
+    },
+}
+
+
+def _analyze(parser_engine: str, fixture: Path):
+    return ReportAnalyzer(parser_engine=parser_engine).analyze_report(
+        fixture.read_text(encoding='utf-8'), fixture.stem
+    )
+
+
+@pytest.mark.parametrize('fixture', FIXTURES, ids=lambda path: path.name)
+def test_html_parser_extracts_expected_fields(fixture):
+    result = _analyze('html.parser', fixture)
+    for field_name, expected in EXPECTED_FIELDS[fixture.name].items():
+        assert result[field_name] == expected, field_name
+
+
+@pytest.mark.skipif(not LXML_AVAILABLE, reason='lxml이 설치되어 있지 않음')
+@pytest.mark.parametrize('fixture', FIXTURES, ids=lambda path: path.name)
+def test_lxml_matches_html_parser(fixture):
+    assert _analyze('lxml', fixture) == _analyze('html.parser', fixture)
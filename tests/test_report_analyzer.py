@@ -0,0 +1,44 @@
+"""보고서 분석기 테스트"""
+
+import re
+
+from bs4 import BeautifulSoup
+
+from src.dart_api.analyzer import ReportAnalyzer
+
+NESTED_TABLE = """
+<table>
+  <tr>
+    <td>2. 계약내역</td>
+    <td>
+      <table>
+        <tr><td>계약금액(원)</td><td>12,500,000,000</td></tr>
+        <tr><td>최근 매출액(원)</td><td>98,000,000,000</td></tr>
+      </table>
+    </td>
+  </tr>
+  <tr><td>3. 계약상대방</td><td>Global Semiconductor Inc.</td></tr>
+</table>
+"""
+
+
+def _table_rows(analyzer: ReportAnalyzer, html: str):
+    return analyzer._build_table_index(BeautifulSoup(html, 'html.parser'))
+
+
+def test_nested_table_value_comes_from_the_rows_own_next_cell():
+    analyzer = ReportAnalyzer(parser_engine='html.parser')
+    table_rows = _table_rows(analyzer, NESTED_TABLE)
+
+    # 바깥 행의 셀(중첩 표 전체)이 아니라 중첩 표 행의 다음 셀을 반환해야 함
+    assert analyzer._find_value_by_header(table_rows, re.compile(r'계약금액\(원\)')) == '12,500,000,000'
+    assert analyzer._find_value_by_header(table_rows, re.compile(r'최근\s*매출액')) == '98,000,000,000'
+    assert analyzer._find_value_by_header(table_rows, re.compile(r'계약내역')).startswith('계약금액(원)')
+    assert analyzer._find_value_by_header(table_rows, re.compile(r'3\.\s*계약상대방')) == 'Global Semiconductor Inc.'
+
+
+def test_outer_row_does_not_include_nested_cells():
+    analyzer = ReportAnalyzer(parser_engine='html.parser')
+    table_rows = _table_rows(analyzer, NESTED_TABLE)
+
+    assert [len(cells) for cells in table_rows] == [2, 2, 2, 2]
@@ -0,0 +1,44 @@
+"""다종목 일괄 스크리닝 테스트"""
+
+from itertools import product
+
+import numpy as np
+
+from src.utils.stock_analyzer import StockAnalyzer
+from src.utils.stock_screener import score_contracts
+
+
+def _summary_score(is_index_above_ma200, is_market_cap_in_range, is_contract_ratio_over_20, trading_conditions_met):
+    """종목별 분석의 점수 계산 (초기화 없이 호출, 시세 조회를 하지 않음)"""
+    analyzer = StockAnalyzer.__new__(StockAnalyzer)
+    _, score = analyzer._create_analysis_summary(
+        is_index_above_ma200, is_market_cap_in_range, is_contract_ratio_over_20,
+        trading_conditions_met, market_cap=1000, contract_sales_ratio=30.0
+    )
+    return score
+
+
+def test_score_contracts_matches_analysis_summary_for_every_condition():
+    cases = list(product([False, True], [False, True], [False, True], [False, True], [False, True]))
+
+    # 조건 조합별 입력 (거래량 조건: 당일 거래량이 20일 평균의 1.1배 미만, 양봉 조건: 현재가 > 시가)
+    volume = np.array([[100.0] * 19 + ([100.0] if calm else [1000.0]) for _, _, _, calm, _ in cases])
+    open_price = np.full(len(cases), 10000.0)
+    close_price = np.array([10500.0 if rising else 9500.0 for *_, rising in cases])
+    market_cap = [1000.0 if cap else 100.0 for _, cap, _, _, _ in cases]
+    contract_amount = [30.0 if ratio else 10.0 for _, _, ratio, _, _ in cases]
+    recent_sales = [100.0] * len(cases)
+    index_current = [110.0 if index else 90.0 for index, *_ in cases]
+    index_ma200 = [100.0] * len(cases)
+
+    result = score_contracts(volume, open_price, close_price, market_cap, contract_amount,
+                             recent_sales, index_current, index_ma200)
+
+    for i, (index, cap, ratio, calm, rising) in enumerate(cases):
+        trading_conditions_met = int(calm) + int(rising)
+        assert result.is_index_above_ma200[i] == index
+        assert result.is_market_cap_in_range[i] == cap
+        assert result.is_contract_ratio_over_20[i] == ratio
+        assert result.trading_conditions_met[i] == trading_conditions_met
+        assert result.recommendation_score[i] == _summary_score(index, cap, ratio, trading_conditions_met), \
+            (index, cap, ratio, trading_conditions_met)
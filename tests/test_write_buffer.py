@@ -0,0 +1,48 @@
+"""시트 쓰기 버퍼 테스트"""
+
+from src.google_sheets.write_buffer import SheetWriteBuffer
+
+
+class _FakeDocument:
+    """전송된 요청을 기록하는 가짜 스프레드시트"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.appended = []
+        self.updated = []
+
+    def values_append(self, range_name, params, body):
+        if self.fail:
+            raise RuntimeError('quota exceeded')
+        self.appended.append((range_name, body['values']))
+
+    def values_batch_update(self, body):
+        if self.fail:
+            raise RuntimeError('quota exceeded')
+        self.updated.extend(body['data'])
+
+
+def test_queued_writes_survive_restart_before_flush(tmp_path):
+    spill_file = str(tmp_path / 'spill.json')
+    buffer = SheetWriteBuffer(spill_file)
+    assert buffer.add_append('계약', [['20260101000001', '1,000']])
+    assert buffer.add_update('거래내역', 'G5:H5', [['매도', '51,500']])
+
+    # 전송 전에 종료된 경우: 새 인스턴스가 보관 파일에서 불러와 전송
+    restarted = SheetWriteBuffer(spill_file)
+    assert restarted.pending_rows('계약') == [['20260101000001', '1,000']]
+
+    document = _FakeDocument()
+    assert restarted.flush(document)
+    assert document.appended == [("'계약'", [['20260101000001', '1,000']])]
+    assert len(document.updated) == 1
+    assert not (tmp_path / 'spill.json').exists()
+
+
+def test_failed_flush_keeps_writes_on_disk(tmp_path):
+    spill_file = str(tmp_path / 'spill.json')
+    buffer = SheetWriteBuffer(spill_file)
+    buffer.add_append('계약', [['20260101000001']])
+
+    assert not buffer.flush(_FakeDocument(fail=True))
+    assert SheetWriteBuffer(spill_file).pending_rows('계약') == [['20260101000001']]
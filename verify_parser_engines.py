@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+보고서 파서 엔진 동등성 검증 스크립트 (저장된 공시 문서 전체 대상, 선택 사항)
+
+사용법:
+    python verify_parser_engines.py [문서 디렉토리]
+
+저장된 DART 공시 문서(원본파일 저장소의 ZIP 또는 .xml/.html 파일)를
+모든 사용 가능한 파서 엔진으로 분석하고, 추출된 필드가 html.parser 결과와
+동일한지 비교합니다. 파서 엔진을 변경하기 전에 실행하여 추출 정확도가
+달라지지 않는지 확인합니다.
+
+문서 디렉토리를 지정하지 않으면 DART_API_CONFIG['document_cache_dir']를 사용합니다.
+예제 문서에 대한 동등성은 tests/test_parser_engines.py가 검증하며, 이 스크립트는
+실제로 보관된 문서 전체로 같은 비교를 수행할 때 사용합니다.
+"""
+
+import sys
+import os
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# 문서 분석에는 DART/시트 접속 정보가 필요 없으므로 설정 로드에 필요한 값만 채움
+for env_name in ('DART_API_KEY', 'SPREADSHEET_URL', 'SERVICE_ACCOUNT_FILE'):
+    os.environ.setdefault(env_name, 'unused')
+
+from loguru import logger
+
+from config.settings import DART_API_CONFIG
+from src.dart_api.client import DartApiClient, DOCUMENT_EXTENSIONS
+from src.dart_api.analyzer import ReportAnalyzer, LXML_AVAILABLE
+
+
+def load_documents(directory: str):
+    """
+    디렉토리에서 보고서 문서를 읽어 (접수번호, 내용) 목록을 반환합니다.
+
+    Args:
+        directory (str): 문서 디렉토리 (하위 디렉토리 포함)
+
+    Returns:
+        list: (접수번호, HTML/XML 내용) 목록
+    """
+    dart_client = DartApiClient(document_store=None)
+    documents = []
+
+    for root, _, files in os.walk(directory):
+        for file_name in sorted(files):
+            file_path = os.path.join(root, file_name)
+            rcept_no = os.path.splitext(file_name)[0]
+
+            if file_name.endswith('.zip'):
+                with open(file_path, 'rb') as f:
+                    content = dart_client.extract_document_from_zip(f.read(), rcept_no)
+            elif file_name.lower().endswith(DOCUMENT_EXTENSIONS):
+                with open(file_path, 'rb') as f:
+                    content, _ = dart_client._decode_document(f.read())
+            else:
+                continue
+
+            if content:
+                documents.append((rcept_no, content))
+
+    return documents
+
+
+def main() -> int:
+    """모든 파서 엔진의 추출 결과를 비교하고 불일치 건수를 반환합니다."""
+    directory = sys.argv[1] if len(sys.argv) > 1 else DART_API_CONFIG['document_cache_dir']
+
+    if not os.path.isdir(directory):
+        print(f"❌ 문서 디렉토리가 없습니다: {directory}")
+        return 1
+
+    # 검증 중에는 상세 로그 생략
+    logger.remove()
+    logger.add(sys.stderr, level='WARNING')
+
+    documents = load_documents(directory)
+    if not documents:
+        print(f"⚠️ 검증할 문서가 없습니다: {directory}")
+        return 1
+
+    if not LXML_AVAILABLE:
+        print("⚠️ lxml이 설치되어 있지 않아 html.parser만 검증합니다.")
+
+    engines = ['html.parser'] + (['lxml'] if LXML_AVAILABLE else [])
+    analyzers = {engine: ReportAnalyzer(parser_engine=engine) for engine in engines}
+
+    print(f"🔍 문서 {len(documents)}건을 {', '.join(engines)} 엔진으로 비교합니다.")
+
+    results = {engine: {} for engine in engines}
+    for engine, analyzer in analyzers.items():
+        started = time.perf_counter()
+        for rcept_no, content in documents:
+            results[engine][rcept_no] = analyzer.analyze_report(content, rcept_no)
+        elapsed = time.perf_counter() - started
+        print(f"  ├─ {engine:12s}: {elapsed:.2f}초 (문서당 {elapsed / len(documents) * 1000:.1f}ms)")
+
+    mismatches = 0
+    for engine in engines[1:]:
+        for rcept_no, _ in documents:
+            expected = results['html.parser'][rcept_no]
+            actual = results[engine][rcept_no]
+            if expected != actual:
+                mismatches += 1
+                print(f"  ❌ {rcept_no} ({engine}) 불일치")
+                for field in sorted(set(expected) | set(actual)):
+                    if expected.get(field) != actual.get(field):
+                        print(f"      - {field}: {expected.get(field)!r} != {actual.get(field)!r}")
+
+    if mismatches:
+        print(f"❌ 불일치 {mismatches}건 발견")
+    else:
+        print("✅ 모든 엔진의 추출 결과가 동일합니다.")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())